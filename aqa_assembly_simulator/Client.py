@@ -4,49 +4,238 @@ AQA Assembly Simulator
 Usage:
   aqa-assembly-simulator config setup
   aqa-assembly-simulator config show
-  aqa-assembly-simulator execute <file> [--trace]
+  aqa-assembly-simulator execute <file> [--trace] [--no-cache] [--stream] [--registers=<n>] [--memory=<n>]
+                                [--memory-in=<image>] [--memory-out=<image>] [--output=<format>] [--select=<items>]
+                                [--memory-view=<view>] [--coverage=<report>]
+  aqa-assembly-simulator coverage <report> [--output=<format>]
+  aqa-assembly-simulator test <file> <spec> [--no-cache] [--registers=<n>] [--memory=<n>] [--workers=<n>]
+                             [--output=<format>]
+  aqa-assembly-simulator compare <file> <reference> --inputs=<images> [--no-cache] [--registers=<n>] [--memory=<n>]
+                                [--select=<items>] [--budget=<n>] [--fail-fast] [--output=<format>]
+  aqa-assembly-simulator debug <file> [--no-cache] [--stream] [--registers=<n>] [--memory=<n>] [--memory-in=<image>]
+  aqa-assembly-simulator assemble <file> [<output>] [--no-cache]
+  aqa-assembly-simulator disassemble <file>
+  aqa-assembly-simulator lsp [--registers=<n>] [--memory=<n>]
 
 Options:
   -h --help                 Show this screen.
   --version                 Show version.
   --trace                   Shows program counter, registers and memory during VM execution.
+  --no-cache                Always lex and parse the program, bypassing the compiled program cache.
+  --stream                  Read, lex and parse the program one line at a time, for very large programs.
+  --registers=<n>           Number of registers, overriding the virtual machine config.
+  --memory=<n>              Number of addressable memory units, overriding the virtual machine config.
+  --memory-in=<image>       Load the initial memory contents from a memory image file.
+  --memory-out=<image>      Write the final memory contents to a memory image file instead of printing them.
+  --output=<format>         Format of the final state: table (default), json, csv or none.
+                            Format of coverage reports: text (default), json or lcov.
+                            Format of test and compare results: text (default) or json.
+  --select=<items>          Parts of the final state to output, e.g. r1-r3,flags,0-99 (json and csv only).
+                            Outputs compared by compare, everything by default.
+  --memory-view=<view>      Memory units shown in tables: sparse (default), touched, full or a window e.g. 0-99.
+  --workers=<n>             Number of processes test cases are run on, the number of CPUs by default.
+  --inputs=<images>         JSON list of input memory images, each a list of values or an object {address: value}.
+  --budget=<n>              Maximum number of statements each program may execute per input, 1000000 by default.
+  --fail-fast               Stop comparing at the first input whose outputs differ.
+  --coverage=<report>       Record line and branch coverage in a JSON coverage report, merged with the report if it
+                            already exists.
 
 Help:
   For help, please see https://github.com/johnyob/AQA-Assembly-Simulator
 """
 
 from importlib import import_module
-from functools import reduce
-from docopt import docopt
-import json
+import sys
 
-from aqa_assembly_simulator.helpers.Constants import COMMANDS_JSON
-from aqa_assembly_simulator.helpers.Util import read_file
 from aqa_assembly_simulator import __version__
 
+COMMANDS = [
+    {
+        "Module Identifier": "config.Setup",
+        "Class Identifier": "Setup",
+        "Conditions": ["config", "setup"],
+        "Arguments": [],
+        "Optional Arguments": [],
+        "Options": [],
+        "Value Options": []
+    },
+    {
+        "Module Identifier": "config.Show",
+        "Class Identifier": "Show",
+        "Conditions": ["config", "show"],
+        "Arguments": [],
+        "Optional Arguments": [],
+        "Options": [],
+        "Value Options": []
+    },
+    {
+        "Module Identifier": "Execute",
+        "Class Identifier": "Execute",
+        "Conditions": ["execute"],
+        "Arguments": ["<file>"],
+        "Optional Arguments": [],
+        "Options": ["--trace", "--no-cache", "--stream"],
+        "Value Options": [
+            "--registers", "--memory", "--memory-in", "--memory-out", "--output", "--select", "--memory-view",
+            "--coverage"
+        ]
+    },
+    {
+        "Module Identifier": "Coverage",
+        "Class Identifier": "Coverage",
+        "Conditions": ["coverage"],
+        "Arguments": ["<report>"],
+        "Optional Arguments": [],
+        "Options": [],
+        "Value Options": ["--output"]
+    },
+    {
+        "Module Identifier": "Test",
+        "Class Identifier": "Test",
+        "Conditions": ["test"],
+        "Arguments": ["<file>", "<spec>"],
+        "Optional Arguments": [],
+        "Options": ["--no-cache"],
+        "Value Options": ["--registers", "--memory", "--workers", "--output"]
+    },
+    {
+        "Module Identifier": "Compare",
+        "Class Identifier": "Compare",
+        "Conditions": ["compare"],
+        "Arguments": ["<file>", "<reference>"],
+        "Optional Arguments": [],
+        "Options": ["--no-cache", "--fail-fast"],
+        "Value Options": ["--inputs", "--registers", "--memory", "--select", "--budget", "--output"]
+    },
+    {
+        "Module Identifier": "Debug",
+        "Class Identifier": "Debug",
+        "Conditions": ["debug"],
+        "Arguments": ["<file>"],
+        "Optional Arguments": [],
+        "Options": ["--no-cache", "--stream"],
+        "Value Options": ["--registers", "--memory", "--memory-in"]
+    },
+    {
+        "Module Identifier": "Assemble",
+        "Class Identifier": "Assemble",
+        "Conditions": ["assemble"],
+        "Arguments": ["<file>"],
+        "Optional Arguments": ["<output>"],
+        "Options": ["--no-cache"],
+        "Value Options": []
+    },
+    {
+        "Module Identifier": "Disassemble",
+        "Class Identifier": "Disassemble",
+        "Conditions": ["disassemble"],
+        "Arguments": ["<file>"],
+        "Optional Arguments": [],
+        "Options": [],
+        "Value Options": []
+    },
+    {
+        "Module Identifier": "Lsp",
+        "Class Identifier": "Lsp",
+        "Conditions": ["lsp"],
+        "Arguments": [],
+        "Optional Arguments": [],
+        "Options": [],
+        "Value Options": ["--registers", "--memory"]
+    }
+]
+
+DEFAULT_ARGUMENTS = dict(
+    [(argument, None) for command in COMMANDS for argument in command["Arguments"] + command["Optional Arguments"]] +
+    [(option, False) for command in COMMANDS for option in command["Options"]] +
+    [(option, None) for command in COMMANDS for option in command["Value Options"]]
+)
+
 
 class Client:
 
-    def __init__(self):
+    def __init__(self, argv=None):
         """
         Client Class.
-        Retrieves options from docopt. Options are then filtered using data stored in commands.json.
+        Matches the command line arguments against the COMMANDS table. Invocations that match a command exactly are
+        dispatched directly; anything else (help, version, abbreviated options or usage errors) is handled by docopt,
+        which is only imported in that case.
         Command is then imported and instantiated.
+
+        :param argv: command line arguments, sys.argv[1:] if None (list)
         """
 
-        self._options = docopt(__doc__, version=__version__)
-        self._arguments = {
-            k: v for k, v in self._options.items()
-            if not isinstance(v, bool) or k == "--trace"
-        }
+        argv = sys.argv[1:] if argv is None else argv
+
+        match = self._match(argv)
+        if match is None:
+            match = self._docopt(argv)
 
-        commands_json = json.loads(read_file(COMMANDS_JSON))
-        command = list(filter(lambda x: self._is_command(x["Conditions"]), commands_json))[0]
+        command, self._arguments = match
 
         getattr(
             import_module("aqa_assembly_simulator.commands.{0}".format(command["Module Identifier"])),
             command["Class Identifier"]
         )(self._arguments).run()
 
-    def _is_command(self, conditions):
-        return reduce(lambda x, y: x and y, map(lambda y: self._options[y], conditions))
\ No newline at end of file
+    def _match(self, argv):
+        """
+        Matches :param argv against the COMMANDS table without docopt.
+        Returns None unless :param argv is a complete invocation of a single command using only full option names.
+        Options that take a value may be given as --option=value or --option value.
+
+        :param argv: command line arguments (list)
+        :return: command, arguments (tuple or None)
+        """
+
+        for command in COMMANDS:
+            conditions = command["Conditions"]
+            if argv[:len(conditions)] != conditions:
+                continue
+
+            arguments = dict(DEFAULT_ARGUMENTS)
+            positional = []
+            remaining = iter(argv[len(conditions):])
+
+            for argument in remaining:
+                option, equals, value = argument.partition("=")
+
+                if not argument.startswith("-"):
+                    positional.append(argument)
+                elif argument in command["Options"] and not arguments[argument]:
+                    arguments[argument] = True
+                elif option in command["Value Options"] and arguments[option] is None:
+                    arguments[option] = value if equals else next(remaining, None)
+                    if arguments[option] is None:
+                        return None
+                else:
+                    return None
+
+            names = command["Arguments"] + command["Optional Arguments"]
+            if not len(command["Arguments"]) <= len(positional) <= len(names):
+                return None
+
+            arguments.update(zip(names, positional))
+            return command, arguments
+
+        return None
+
+    def _docopt(self, argv):
+        """
+        Parses :param argv with docopt. Exits for help, version and usage errors.
+
+        :param argv: command line arguments (list)
+        :return: command, arguments (tuple)
+        """
+
+        from docopt import docopt
+
+        options = docopt(__doc__, argv=argv, version=__version__)
+        arguments = {
+            k: v for k, v in options.items()
+            if not isinstance(v, bool) or k.startswith("--")
+        }
+
+        command = [command for command in COMMANDS if all(options[y] for y in command["Conditions"])][0]
+
+        return command, arguments
@@ -0,0 +1,50 @@
+from aqa_assembly_simulator.assembler.ObjectFormat import MAGIC, VERSION, HEADER, INSTRUCTION, LINE, SYMBOL
+from aqa_assembly_simulator.helpers.Exceptions import AssemblySimulatorObjectFileException
+from aqa_assembly_simulator.parser.Program import Program
+
+
+class Assembler:
+
+    def __init__(self, statements):
+        """
+        Assembler constructor.
+        Encodes statements produced by the parser into the .aqab binary object format: a header, a fixed width
+        instruction for every statement, a line number table and a label symbol table.
+        Instructions are packed from the columns of the struct of arrays program representation.
+
+        :param statements: list of statements produced by the parser (list)
+        """
+
+        self._statements = statements
+
+    def assemble(self):
+        """
+        Encodes the statements into an object file.
+        If an operand does not fit in the object format -> AssemblySimulatorObjectFileException raised.
+
+        :return: (bytes)
+        """
+
+        try:
+            program = Program.from_statements(self._statements)
+        except OverflowError as error:
+            raise AssemblySimulatorObjectFileException({
+                "message": "operand out of range for object format",
+                "error": str(error)
+            })
+
+        instructions = b"".join(map(INSTRUCTION.pack, *[
+            program.get_opcodes(), program.get_operand_kinds(), program.get_registers_d(), program.get_registers_n(),
+            program.get_operand_values()
+        ]))
+        lines = b"".join(map(LINE.pack, program.get_lines()))
+
+        symbols = bytearray()
+        for identifier in program.get_symbols():
+            encoded = identifier.encode()
+            symbols += SYMBOL.pack(program.get_labels().get(identifier, -1), len(encoded)) + encoded
+
+        return b"".join([
+            HEADER.pack(MAGIC, VERSION, len(program), len(program.get_symbols())),
+            instructions, lines, bytes(symbols)
+        ])
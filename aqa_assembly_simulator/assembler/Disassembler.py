@@ -0,0 +1,38 @@
+from aqa_assembly_simulator.assembler.Loader import Loader
+from aqa_assembly_simulator.parser.Statement import Label
+
+
+class Disassembler:
+
+    def __init__(self, statements):
+        """
+        Disassembler constructor.
+        Converts statements, typically loaded from an object file, back into AQA assembly source code.
+
+        :param statements: list of statements (list)
+        """
+
+        self._statements = statements
+
+    @staticmethod
+    def disassemble_file(file_location):
+        """
+        Disassembles the object file stored at :param file_location
+
+        :param file_location: absolute path for the object file (string)
+        :return: (string)
+        """
+
+        return Disassembler(Loader.load_file(file_location)).disassemble()
+
+    def disassemble(self):
+        """
+        Returns the source code for the statements. Labels are written on their own line and instructions are indented.
+
+        :return: (string)
+        """
+
+        return "".join(
+            "{0}\n".format(statement) if isinstance(statement, Label) else "  {0}\n".format(statement)
+            for statement in self._statements
+        )
@@ -0,0 +1,205 @@
+import struct
+import mmap
+
+from aqa_assembly_simulator.assembler.ObjectFormat import MAGIC, VERSION, HEADER, INSTRUCTION, LINE, SYMBOL
+from aqa_assembly_simulator.helpers.Exceptions import AssemblySimulatorObjectFileException
+from aqa_assembly_simulator.lexer.TokenType import TokenType, STATEMENTS
+from aqa_assembly_simulator.parser.Statement import Label
+from aqa_assembly_simulator.lexer.Token import Token
+
+LEXEMES = {
+    TokenType.REGISTER: "r{0}",
+    TokenType.IMMEDIATE_ADDRESS: "#{0}",
+    TokenType.DIRECT_ADDRESS: "{0}"
+}
+
+
+class Loader:
+
+    def __init__(self, buffer):
+        """
+        Loader constructor.
+        Decodes a .aqab object file into statements that can be executed by the virtual machine, without lexing or
+        parsing source code. Operand tokens are rebuilt from the instruction fields and carry the source line stored
+        in the line number table.
+
+        :param buffer: contents of the object file (bytes, mmap or memoryview)
+        """
+
+        self._buffer = memoryview(buffer)
+        self._symbols = []
+
+    @staticmethod
+    def load_file(file_location):
+        """
+        Memory maps the object file stored at :param file_location and decodes it
+
+        :param file_location: absolute path for the object file (string)
+        :return: (list)
+        """
+
+        with open(file_location, "rb") as file:
+            try:
+                mapping = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                raise AssemblySimulatorObjectFileException({
+                    "message": "object file is empty", "file": file_location
+                })
+
+        with mapping:
+            loader = Loader(mapping)
+            try:
+                return loader.load()
+            finally:
+                loader.release()
+
+    def load(self):
+        """
+        Decodes the object file into a list of statements
+
+        :return: (list)
+        """
+
+        try:
+            magic, version, instructions, symbols = HEADER.unpack_from(self._buffer, 0)
+        except struct.error:
+            raise AssemblySimulatorObjectFileException({"message": "object file header is truncated"})
+
+        if magic != MAGIC or version != VERSION:
+            raise AssemblySimulatorObjectFileException({
+                "message": "not a version {0} object file".format(VERSION)
+            })
+
+        offset = HEADER.size
+        end = offset + instructions * INSTRUCTION.size
+        lines_end = end + instructions * LINE.size
+
+        if len(self._buffer) < lines_end:
+            raise AssemblySimulatorObjectFileException({"message": "object file is truncated"})
+
+        try:
+            records = INSTRUCTION.iter_unpack(self._buffer[offset:end])
+            lines = [line for line, in LINE.iter_unpack(self._buffer[end:lines_end])]
+            self._symbols = self._read_symbols(lines_end, symbols)
+        except struct.error:
+            raise AssemblySimulatorObjectFileException({"message": "object file is truncated"})
+        except UnicodeDecodeError:
+            raise AssemblySimulatorObjectFileException({"message": "invalid symbol identifier"})
+
+        return [
+            self._statement(record, line) for record, line in zip(records, lines)
+        ]
+
+    def get_symbols(self):
+        """
+        Returns the symbol table, in format [(identifier, statement index)], where the statement index is -1 for labels
+        that are referenced but never declared.
+
+        :return: (list)
+        """
+
+        return self._symbols
+
+    def release(self):
+        """
+        Releases the underlying buffer
+
+        :return: (None)
+        """
+
+        self._buffer.release()
+
+    def _read_symbols(self, offset, symbols):
+        """
+        Decodes the symbol table starting at :param offset
+
+        :param offset: byte offset of the symbol table (integer)
+        :param symbols: number of symbols (integer)
+        :return: (list)
+        """
+
+        table = []
+
+        for _ in range(symbols):
+            definition, length = SYMBOL.unpack_from(self._buffer, offset)
+            offset += SYMBOL.size
+
+            identifier = self._buffer[offset:offset + length]
+            if len(identifier) != length:
+                raise struct.error("symbol table is truncated")
+
+            table.append((identifier.tobytes().decode(), definition))
+            offset += length
+
+        return table
+
+    def _statement(self, record, line):
+        """
+        Builds the statement encoded by :param record.
+        If :param record is not a valid instruction -> AssemblySimulatorObjectFileException raised.
+
+        :param record: in format (opcode, operand type, r_d, r_n, value) (tuple)
+        :param line: source line of the statement (integer)
+        :return: (aqa_assembly_simulator.parser.Statement.Statement)
+        """
+
+        opcode, operand_type, register_d, register_n, value = record
+
+        if opcode == TokenType.IDENTIFIER.value:
+            return Label(self._label(value, line))
+
+        if opcode not in STATEMENTS:
+            raise AssemblySimulatorObjectFileException({"message": "invalid opcode", "opcode": opcode})
+
+        type = TokenType(opcode)
+
+        if type in (TokenType.B, TokenType.BEQ, TokenType.BNE, TokenType.BGT, TokenType.BLT):
+            return STATEMENTS[type.value]([self._label(value, line)])
+
+        if type == TokenType.HALT:
+            return STATEMENTS[type.value]([Token(TokenType.HALT, "HALT", None, line)])
+
+        if operand_type not in (
+            (TokenType.DIRECT_ADDRESS.value,) if type in (TokenType.LDR, TokenType.STR)
+            else (TokenType.REGISTER.value, TokenType.IMMEDIATE_ADDRESS.value)
+        ):
+            raise AssemblySimulatorObjectFileException({
+                "message": "invalid operand type", "opcode": opcode, "operand type": operand_type
+            })
+
+        operand_type = TokenType(operand_type)
+
+        tokens = [self._token(TokenType.REGISTER, register_d, line)]
+        if type not in (TokenType.LDR, TokenType.STR, TokenType.MOV, TokenType.CMP, TokenType.MVN):
+            tokens.append(self._token(TokenType.REGISTER, register_n, line))
+        tokens.append(self._token(operand_type, value, line))
+
+        return STATEMENTS[type.value](tokens)
+
+    def _token(self, type, literal, line):
+        """
+        Rebuilds a register, immediate address or direct address token
+
+        :param type: (aqa_assembly_simulator.lexer.TokenType.TokenType)
+        :param literal: (integer)
+        :param line: (integer)
+        :return: (aqa_assembly_simulator.lexer.Token.Token)
+        """
+
+        return Token(type, LEXEMES[type].format(literal), literal, line)
+
+    def _label(self, symbol, line):
+        """
+        Rebuilds a label identifier token from the symbol table
+
+        :param symbol: symbol table index (integer)
+        :param line: (integer)
+        :return: (aqa_assembly_simulator.lexer.Token.Token)
+        """
+
+        if not 0 <= symbol < len(self._symbols):
+            raise AssemblySimulatorObjectFileException({"message": "invalid symbol index", "symbol": symbol})
+
+        identifier = self._symbols[symbol][0]
+
+        return Token(TokenType.IDENTIFIER, identifier, identifier, line)
@@ -0,0 +1,16 @@
+import struct
+
+MAGIC = b"AQAB"
+VERSION = 1
+
+# magic, version, instructions, symbols
+HEADER = struct.Struct("<4sHII")
+
+# opcode, operand type, r_d, r_n, value
+INSTRUCTION = struct.Struct("<BBxxIIq")
+
+# source line of each instruction
+LINE = struct.Struct("<I")
+
+# label definition (statement index, -1 if undefined), identifier length
+SYMBOL = struct.Struct("<iH")
@@ -0,0 +1,38 @@
+import os
+import sys
+
+from aqa_assembly_simulator.helpers.Exceptions import AssemblySimulatorObjectFileException
+from aqa_assembly_simulator.helpers.Constants import OBJECT_FILE_EXTENSION
+from aqa_assembly_simulator.assembler.Assembler import Assembler
+from aqa_assembly_simulator.commands.Execute import Execute
+from aqa_assembly_simulator.helpers.Util import read_file
+
+
+class Assemble(Execute):
+
+    def __init__(self, arguments):
+        super().__init__(arguments)
+        self._output_location = self._arguments["<output>"] or "{0}{1}".format(
+            os.path.splitext(self._file_location)[0], OBJECT_FILE_EXTENSION
+        )
+
+    def run(self):
+        """
+        Run method for assemble command.
+        Lexes and parses the source file and writes the encoded program to the object file.
+
+        :return: (None)
+        """
+
+        errors, statements = self._compile(read_file(self._file_location))
+        if errors:
+            sys.exit(65)
+
+        try:
+            data = Assembler(statements).assemble()
+        except AssemblySimulatorObjectFileException as error:
+            print(error, file=sys.stderr)
+            sys.exit(65)
+
+        with open(self._output_location, "wb") as file:
+            file.write(data)
@@ -0,0 +1,80 @@
+import json
+import sys
+
+from aqa_assembly_simulator.helpers.Constants import TEST_BUDGET
+from aqa_assembly_simulator.virtual_machine.Differential import ProgramComparison
+from aqa_assembly_simulator.virtual_machine.StateWriter import Selection
+from aqa_assembly_simulator.commands.Test import Test, OUTPUTS
+from aqa_assembly_simulator.helpers.Util import read_file
+
+
+class Compare(Test):
+
+    def run(self):
+        """
+        Run method for compare command.
+        Runs the candidate program <file> and the reference program <reference> on every input memory image and
+        prints whether their outputs matched, with the first output that differed. Both programs are loaded or lexed
+        and parsed once. Exits with status 1 if any outputs differed.
+
+        :return: (None)
+        """
+
+        output = self._arguments["--output"] or "text"
+        budget = self._arguments["--budget"]
+
+        try:
+            if output not in OUTPUTS:
+                raise ValueError("unknown output format {0}".format(output))
+
+            if budget is not None and not budget.isdigit():
+                raise ValueError("invalid budget {0}".format(budget))
+
+            if self._arguments["--inputs"] is None:
+                raise ValueError("--inputs is required")
+
+            selection = Selection.parse(self._arguments["--select"]) if self._arguments["--select"] else None
+        except ValueError as error:
+            self._print_errors([error])
+            sys.exit(64)
+
+        try:
+            memory_images = json.loads(read_file(self._arguments["--inputs"]))
+            if not isinstance(memory_images, list):
+                raise ValueError("inputs must be a list")
+
+            memory_images = [self._input_image(image) for image in memory_images]
+        except ValueError:
+            self._print_errors([ValueError("inputs must be a JSON list of memory images")])
+            sys.exit(65)
+
+        comparison = ProgramComparison(
+            self._statements(), self._statements(self._arguments["<reference>"]),
+            *self._config(), selection,
+            int(budget) if budget else TEST_BUDGET
+        )
+
+        self._print_results(comparison.run(memory_images, self._arguments["--fail-fast"]), output)
+
+    def _input_image(self, image):
+        """
+        Returns :param image, a list of integers or an object in format {address: integer}, with integer addresses.
+        If :param image is not a memory image -> ValueError raised.
+
+        :param image: (list or dict)
+        :return: (list or dict)
+        """
+
+        values = image.values() if isinstance(image, dict) else image
+        if not isinstance(image, (list, dict)) or not all(
+            isinstance(value, int) and not isinstance(value, bool) for value in values
+        ):
+            raise ValueError("invalid memory image {0}".format(image))
+
+        if isinstance(image, list):
+            return image
+
+        if not all(address.isdigit() for address in image):
+            raise ValueError("invalid memory image {0}".format(image))
+
+        return {int(address): value for address, value in image.items()}
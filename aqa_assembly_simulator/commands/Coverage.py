@@ -0,0 +1,29 @@
+import sys
+
+from aqa_assembly_simulator.virtual_machine.Coverage import Coverage as CoverageReport, FORMATS
+from aqa_assembly_simulator.commands.Command import Command
+
+
+class Coverage(Command):
+
+    def run(self):
+        """
+        Run method for coverage command.
+        Prints the coverage report recorded by execute --coverage in text, JSON or LCOV format.
+
+        :return: (None)
+        """
+
+        format = self._arguments["--output"] or "text"
+        if format not in FORMATS:
+            print("unknown coverage format {0}".format(format), file=sys.stderr)
+            sys.exit(64)
+
+        try:
+            with open(self._arguments["<report>"], "r") as file:
+                coverage = CoverageReport.from_json(file.read())
+
+            print(coverage.render(format))
+        except (ValueError, OSError) as error:
+            print(error, file=sys.stderr)
+            sys.exit(65)
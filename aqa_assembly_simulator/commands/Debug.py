@@ -0,0 +1,30 @@
+import sys
+
+from aqa_assembly_simulator.virtual_machine.VirtualMachine import VirtualMachine
+from aqa_assembly_simulator.virtual_machine.Debugger import Debugger
+from aqa_assembly_simulator.commands.Execute import Execute
+
+
+class Debug(Execute):
+
+    def _execute(self, statements):
+        """
+        Runs the interactive debugger on :param statements. The program is lexed and parsed once, before the debugger
+        starts.
+
+        :param statements: (list)
+        :return: virtual machine errors (list)
+        """
+
+        try:
+            virtual_machine = VirtualMachine(statements, *self._config())
+        except ValueError as error:
+            self._print_errors([error])
+            sys.exit(64)
+
+        if self._memory_in and not self._memory_image(virtual_machine.load_memory_file, self._memory_in):
+            sys.exit(66)
+
+        Debugger(virtual_machine, statements).cmdloop()
+
+        return []
@@ -0,0 +1,22 @@
+import sys
+
+from aqa_assembly_simulator.helpers.Exceptions import AssemblySimulatorObjectFileException
+from aqa_assembly_simulator.assembler.Disassembler import Disassembler
+from aqa_assembly_simulator.commands.Command import Command
+
+
+class Disassemble(Command):
+
+    def run(self):
+        """
+        Run method for disassemble command.
+        Prints the source code of the object file.
+
+        :return: (None)
+        """
+
+        try:
+            print(Disassembler.disassemble_file(self._arguments["<file>"]), end="")
+        except (AssemblySimulatorObjectFileException, OSError) as error:
+            print(error, file=sys.stderr)
+            sys.exit(65)
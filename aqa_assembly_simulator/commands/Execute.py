@@ -1,11 +1,17 @@
+import os
 import sys
 
+from aqa_assembly_simulator.helpers.Exceptions import (
+    AssemblySimulatorObjectFileException, AssemblySimulatorMemoryImageException, AssemblySimulatorVMConfigException
+)
+from aqa_assembly_simulator.helpers.Constants import OBJECT_FILE_EXTENSION
 from aqa_assembly_simulator.virtual_machine.config.VirtualMachineConfig import VirtualMachineConfig
+from aqa_assembly_simulator.virtual_machine.StateWriter import StateWriter, Selection
 from aqa_assembly_simulator.virtual_machine.VirtualMachine import VirtualMachine
+from aqa_assembly_simulator.virtual_machine.Coverage import Coverage
+from aqa_assembly_simulator.helpers.ProgramCache import ProgramCache
 from aqa_assembly_simulator.commands.Command import Command
-from aqa_assembly_simulator.helpers.Util import read_file
-from aqa_assembly_simulator.parser.Parser import Parser
-from aqa_assembly_simulator.lexer.Lexer import Lexer
+from aqa_assembly_simulator.helpers.Util import read_file, read_lines, write_file
 
 
 class Execute(Command):
@@ -14,19 +20,186 @@ class Execute(Command):
         super().__init__(arguments)
         self._file_location = self._arguments["<file>"]
         self._trace = self._arguments["--trace"]
+        self._stream = self._arguments["--stream"]
+        self._memory_in = self._arguments["--memory-in"]
+        self._memory_out = self._arguments["--memory-out"]
+        self._output = self._arguments["--output"] or ("none" if self._memory_out else "table")
+        self._select = self._arguments["--select"]
+        self._memory_view = self._arguments["--memory-view"] or "sparse"
+        self._coverage_file = self._arguments["--coverage"]
+        self._cache = None if self._arguments["--no-cache"] or self._stream else ProgramCache()
+
+        try:
+            VirtualMachineConfig.override(self._arguments["--registers"], self._arguments["--memory"])
+            VirtualMachineConfig.validate()
+        except AssemblySimulatorVMConfigException as error:
+            self._print_errors([error])
+            sys.exit(64)
 
     def run(self):
-        errors, virtual_machine_errors = self._run(read_file(self._file_location))
+        if self._execute(self._statements()):
+            sys.exit(70)
+
+    def _statements(self, file_location=None):
+        """
+        Loads, or lexes and parses, the program at :param file_location.
+        Exits if the program has errors.
+
+        :param file_location: absolute path for the program, <file> if None (string)
+        :return: (list)
+        """
+
+        file_location = file_location or self._file_location
+
+        if file_location.endswith(OBJECT_FILE_EXTENSION):
+            errors, statements = self._load(file_location)
+        elif self._stream:
+            errors, statements = self._compile_stream(read_lines(file_location))
+        else:
+            errors, statements = self._compile(read_file(file_location))
 
         if errors:
             sys.exit(65)
 
-        if virtual_machine_errors:
-            sys.exit(70)
+        return statements
+
+    def _config(self):
+        """
+        Returns the number of registers and addressable memory units in the virtual machine.
+        Exits if the virtual machine config is not setup.
+
+        :return: registers, memory capacity (tuple)
+        """
+
+        try:
+            return VirtualMachineConfig.get_registers(), VirtualMachineConfig.get_memory_capacity()
+        except AssemblySimulatorVMConfigException as error:
+            self._print_errors([error])
+            sys.exit(64)
+
+    def _execute(self, statements):
+
+        try:
+            virtual_machine = VirtualMachine(statements, *self._config(), self._trace, self._memory_view)
+        except ValueError as error:
+            self._print_errors([error])
+            sys.exit(64)
+
+        writer = None if self._output == "table" else self._writer()
+
+        coverage = self._coverage(statements) if self._coverage_file else None
+        if coverage is not None:
+            coverage.attach(virtual_machine)
+
+        if self._memory_in and not self._memory_image(virtual_machine.load_memory_file, self._memory_in):
+            sys.exit(66)
+
+        if writer is None:
+            virtual_machine.execute()
+        else:
+            writer.write(virtual_machine.run())
+
+        virtual_machine_errors = virtual_machine.get_errors()
+
+        self._print_errors(virtual_machine_errors)
+
+        if self._memory_out and not self._memory_image(virtual_machine.save_memory_file, self._memory_out):
+            sys.exit(74)
+
+        if coverage is not None:
+            try:
+                write_file(self._coverage_file, coverage.render("json"))
+            except OSError as error:
+                print(error, file=sys.stderr)
+                sys.exit(74)
+
+        return virtual_machine_errors
+
+    def _coverage(self, statements):
+        """
+        Returns coverage for :param statements, merged with the coverage report at --coverage if it exists.
+        Invalid coverage reports are printed.
+
+        :param statements: (list)
+        :return: (aqa_assembly_simulator.virtual_machine.Coverage.Coverage)
+        """
 
-    def _run(self, source):
+        coverage = Coverage.from_statements(statements, self._file_location)
 
-        lexer_errors, parser_errors, virtual_machine_errors = [], [], []
+        if os.path.exists(self._coverage_file):
+            try:
+                coverage.merge(Coverage.from_json(read_file(self._coverage_file)))
+            except ValueError as error:
+                self._print_errors([error])
+                sys.exit(65)
+
+        return coverage
+
+    def _writer(self):
+        """
+        Returns the writer for the output format, restricted to the selected registers and memory.
+        Invalid output formats and selections are printed.
+
+        :return: (aqa_assembly_simulator.virtual_machine.StateWriter.StateWriter)
+        """
+
+        try:
+            return StateWriter(self._output, Selection.parse(self._select) if self._select else None)
+        except ValueError as error:
+            self._print_errors([error])
+            sys.exit(64)
+
+    def _memory_image(self, transfer, file_location):
+        """
+        Loads or saves the memory image at :param file_location using :param transfer.
+        Memory image errors are printed.
+
+        :param transfer: load_memory_file or save_memory_file of a virtual machine (function)
+        :param file_location: absolute path for the memory image (string)
+        :return: whether the memory image was transferred (boolean)
+        """
+
+        try:
+            transfer(file_location)
+        except (AssemblySimulatorMemoryImageException, OSError) as error:
+            print(error, file=sys.stderr)
+            return False
+
+        return True
+
+    def _load(self, file_location):
+        """
+        Loads the statements stored in the object file at :param file_location.
+        Object file errors are printed.
+
+        :param file_location: absolute path for the object file (string)
+        :return: object file errors, statements (tuple)
+        """
+
+        from aqa_assembly_simulator.assembler.Loader import Loader
+
+        try:
+            return [], Loader.load_file(file_location)
+        except (AssemblySimulatorObjectFileException, OSError) as error:
+            print(error, file=sys.stderr)
+            return [error], None
+
+    def _compile(self, source):
+        """
+        Produces the statements for :param source, using the program cache when it is enabled.
+        Lexer and parser errors are printed; programs with errors are not cached.
+
+        :param source: assembly source code (string)
+        :return: lexer and parser errors, statements (tuple)
+        """
+
+        if self._cache is not None:
+            statements = self._cache.get(source)
+            if statements is not None:
+                return [], statements
+
+        from aqa_assembly_simulator.parser.Parser import Parser
+        from aqa_assembly_simulator.lexer.Lexer import Lexer
 
         lexer = Lexer(source)
         tokens = lexer.scan_tokens()
@@ -34,7 +207,7 @@ class Execute(Command):
         lexer_errors = lexer.get_errors()
         self._print_errors(lexer_errors)
         if lexer_errors:
-            return lexer_errors + parser_errors, virtual_machine_errors
+            return lexer_errors, None
 
         parser = Parser(tokens)
         statements = parser.parse()
@@ -42,23 +215,45 @@ class Execute(Command):
         parser_errors = parser.get_errors()
         self._print_errors(parser_errors)
         if parser_errors:
-            return lexer_errors + parser_errors, virtual_machine_errors
+            return parser_errors, None
 
-        virtual_machine = VirtualMachine(
-            statements, VirtualMachineConfig.get_registers(),
-            VirtualMachineConfig.get_memory_capacity(), self._trace
-        )
+        if self._cache is not None:
+            self._cache.put(source, statements)
 
-        virtual_machine.execute()
-        virtual_machine_errors = virtual_machine.get_errors()
+        return [], statements
 
-        self._print_errors(virtual_machine_errors)
+    def _compile_stream(self, lines):
+        """
+        Produces the statements for the source code :param lines, reading, lexing and parsing one line at a time so
+        that the whole source code and token list are never held in memory. Statements are not cached.
+        Lexer errors are printed in preference to parser errors.
+
+        :param lines: lines of source code (iterable)
+        :return: lexer or parser errors, statements (tuple)
+        """
+
+        from aqa_assembly_simulator.parser.Parser import Parser
+        from aqa_assembly_simulator.lexer.Lexer import Lexer
+
+        lexer = Lexer(lines)
+        parser = Parser(lexer.iter_tokens())
+        statements = parser.parse()
+
+        errors = lexer.get_errors() or parser.get_errors()
+        self._print_errors(errors)
+        if errors:
+            return errors, None
 
-        return lexer_errors + parser_errors, virtual_machine_errors
+        return [], statements
 
     def _print_errors(self, errors):
         for error in errors:
             if hasattr(error, "report"):
                 print(error.report(), file=sys.stderr)
+            elif isinstance(error, (
+                AssemblySimulatorVMConfigException, AssemblySimulatorObjectFileException,
+                AssemblySimulatorMemoryImageException
+            )):
+                print(error, file=sys.stderr)
             else:
                 print("[ERROR] Error: AssemblySimulatorPythonError, Response: {0}".format(error), file=sys.stderr)
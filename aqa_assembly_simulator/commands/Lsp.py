@@ -0,0 +1,32 @@
+import sys
+
+from aqa_assembly_simulator.helpers.Exceptions import AssemblySimulatorVMConfigException
+from aqa_assembly_simulator.virtual_machine.config.VirtualMachineConfig import VirtualMachineConfig
+from aqa_assembly_simulator.language_server.LanguageServer import LanguageServer
+from aqa_assembly_simulator.commands.Command import Command
+
+
+class Lsp(Command):
+
+    def run(self):
+        """
+        Run method for lsp command.
+        Runs the language server on stdin and stdout. If the virtual machine config is not setup, register and memory
+        range checks are skipped.
+
+        :return: (None)
+        """
+
+        try:
+            VirtualMachineConfig.override(self._arguments["--registers"], self._arguments["--memory"])
+            VirtualMachineConfig.validate()
+        except AssemblySimulatorVMConfigException as error:
+            print(error, file=sys.stderr)
+            sys.exit(64)
+
+        try:
+            registers, memory_capacity = VirtualMachineConfig.get_registers(), VirtualMachineConfig.get_memory_capacity()
+        except AssemblySimulatorVMConfigException:
+            registers, memory_capacity = None, None
+
+        sys.exit(LanguageServer(registers, memory_capacity).serve())
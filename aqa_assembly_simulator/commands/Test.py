@@ -0,0 +1,72 @@
+import json
+import sys
+
+from aqa_assembly_simulator.virtual_machine.TestSpec import TestSpec
+from aqa_assembly_simulator.commands.Execute import Execute
+from aqa_assembly_simulator.helpers.Util import read_file
+
+OUTPUTS = ["text", "json"]
+
+
+class Test(Execute):
+
+    def run(self):
+        """
+        Run method for test command.
+        Runs every test case in the test spec on the program, which is loaded or lexed and parsed once, and prints
+        whether each test case passed. Exits with status 1 if any test case failed.
+
+        :return: (None)
+        """
+
+        output = self._arguments["--output"] or "text"
+        workers = self._arguments["--workers"]
+
+        if output not in OUTPUTS or not (workers is None or workers.isdigit() and int(workers) > 0):
+            self._print_errors([ValueError("invalid output format {0} or workers {1}".format(output, workers))])
+            sys.exit(64)
+
+        try:
+            spec = TestSpec.parse(read_file(self._arguments["<spec>"]))
+        except ValueError as error:
+            self._print_errors([error])
+            sys.exit(65)
+
+        statements = self._statements()
+
+        registers, memory_capacity = spec.get_registers(), spec.get_memory_capacity()
+        if self._arguments["--registers"] or registers is None:
+            registers = self._config()[0]
+        if self._arguments["--memory"] or memory_capacity is None:
+            memory_capacity = self._config()[1]
+
+        results = spec.run(statements, registers, memory_capacity, int(workers) if workers else None)
+
+        self._print_results(results, output)
+
+    def _print_results(self, results, output):
+        """
+        Prints :param results as text or JSON.
+        Exits with status 1 if any test case failed.
+
+        :param results: (list)
+        :param output: "text" or "json" (string)
+        :return: (None)
+        """
+
+        if output == "json":
+            print(json.dumps([
+                {
+                    "name": result.get_name(), "passed": result.is_passed(), "steps": result.get_steps(),
+                    "location": result.get_location(), "expected": result.get_expected(), "actual": result.get_actual()
+                } for result in results
+            ]))
+        else:
+            for result in results:
+                print(result.report())
+
+            passed = sum(result.is_passed() for result in results)
+            print("\n{0} passed, {1} failed.".format(passed, len(results) - passed))
+
+        if not all(result.is_passed() for result in results):
+            sys.exit(1)
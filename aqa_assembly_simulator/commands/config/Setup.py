@@ -24,7 +24,7 @@ class Setup(Command):
         if not regular_expression.match(REGISTERS_REGEX, registers):
             print(AssemblySimulatorVMConfigException({
                 "message": "invalid number of registers",
-                "format": "[0-9]{1,2}",
+                "format": "[0-9]{1,3}",
                 "registers": registers
             }), file=sys.stderr)
             return
@@ -34,7 +34,7 @@ class Setup(Command):
         if not regular_expression.match(MEMORY_CAPACITY_REGEX, memory_capacity):
             print(AssemblySimulatorVMConfigException({
                 "message": "invalid number of addressable memory units",
-                "format": "[0-9]{1,3}",
+                "format": "[0-9]{1,9}",
                 "memory capacity": memory_capacity
             }), file=sys.stderr)
             return
@@ -13,6 +13,33 @@ class LexerError(Exception):
         self._message = message
         self._character = character
 
+    def get_line(self):
+        """
+        Returns the line that the error occurs in
+
+        :return: (integer)
+        """
+
+        return self._line
+
+    def get_message(self):
+        """
+        Returns the error message
+
+        :return: (string)
+        """
+
+        return self._message
+
+    def get_character(self):
+        """
+        Returns the character that raised the error
+
+        :return: (string)
+        """
+
+        return self._character
+
     def report(self):
         """
         Report method. Used to produce a string representation of the error when the error is printed.
@@ -11,6 +11,24 @@ class RuntimeError(Exception):
         self._token = token
         self._message = message
 
+    def get_token(self):
+        """
+        Returns the token that raised the error
+
+        :return: (aqa_assembly_simulator.lexer.Token.Token)
+        """
+
+        return self._token
+
+    def get_message(self):
+        """
+        Returns the error message
+
+        :return: (string)
+        """
+
+        return self._message
+
     def report(self):
         """
         Report method. Used to produce a string representation of the error when the error is printed.
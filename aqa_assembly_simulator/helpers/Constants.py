@@ -5,9 +5,29 @@ from aqa_assembly_simulator import ROOT, OS
 separator = "\\" if OS == "nt" else "/"
 
 SYNTAX_JSON = os.path.join(ROOT, "parser{0}syntax.json".format(separator))
-COMMANDS_JSON = os.path.join(ROOT, "commands.json")
 VM_CONFIG = os.path.join(ROOT, "virtual_machine{0}config{0}config.json".format(separator))
 
-REGISTERS_REGEX = r"^(\d{1,2})$"
-MEMORY_CAPACITY_REGEX = r"^(\d{1,3})$"
-INTEGER_REGEX = r"^(-?\d+)$"
\ No newline at end of file
+REGISTERS_ENVIRONMENT_VARIABLE = "AQA_ASSEMBLY_SIMULATOR_REGISTERS"
+MEMORY_ENVIRONMENT_VARIABLE = "AQA_ASSEMBLY_SIMULATOR_MEMORY"
+
+CACHE_DIRECTORY = os.environ.get(
+    "AQA_ASSEMBLY_SIMULATOR_CACHE",
+    os.path.join(os.environ.get("XDG_CACHE_HOME", os.path.join(os.path.expanduser("~"), ".cache")), "aqa-assembly-simulator")
+)
+CACHE_SIZE = 64 * 1024 * 1024
+CACHE_FORMAT = 3
+
+OBJECT_FILE_EXTENSION = ".aqab"
+
+REGISTERS_REGEX = r"^(\d{1,3})$"
+MEMORY_CAPACITY_REGEX = r"^(\d{1,9})$"
+MEMORY_PAGE_BITS = 10
+MEMORY_CELL_SIZE = 8
+TEST_BUDGET = 1000000
+INTEGER_REGEX = r"^(-?\d+)$"
+TOKEN_REGEX = (
+    r"[ \r\t]*(?:(?P<NEWLINE>\n)|(?P<COMMENT>;[^\n]*)|(?P<COMMA>,)|(?P<COLON>:)"
+    r"|(?P<REGISTER>r[0-9]*)|(?P<IMMEDIATE_ADDRESS>#[0-9]*)|(?P<DIRECT_ADDRESS>[0-9]+)"
+    r"|(?P<IDENTIFIER>[A-Za-z][A-Za-z0-9]*)|(?P<MISMATCH>.)|(?P<END>\Z))"
+)
+LINE_CACHE_SIZE = 4096
@@ -2,3 +2,15 @@ class AssemblySimulatorVMConfigException(Exception):
 
     def __str__(self):
         return "[ERROR] Error: AssemblySimulatorConfigError, Response: {0}".format(super().__str__())
+
+
+class AssemblySimulatorObjectFileException(Exception):
+
+    def __str__(self):
+        return "[ERROR] Error: AssemblySimulatorObjectFileError, Response: {0}".format(super().__str__())
+
+
+class AssemblySimulatorMemoryImageException(Exception):
+
+    def __str__(self):
+        return "[ERROR] Error: AssemblySimulatorMemoryImageError, Response: {0}".format(super().__str__())
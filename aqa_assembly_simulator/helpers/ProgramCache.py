@@ -0,0 +1,158 @@
+import hashlib
+import pickle
+import os
+
+from aqa_assembly_simulator.helpers.Constants import CACHE_DIRECTORY, CACHE_SIZE, CACHE_FORMAT
+from aqa_assembly_simulator import __version__
+
+
+class ProgramCache:
+
+    def __init__(self, directory=CACHE_DIRECTORY, max_size=CACHE_SIZE):
+        """
+        Program Cache constructor.
+        On-disk cache of parsed programs, keyed by a hash of the source code and the package version. Entries are
+        written atomically (temporary file then rename), so parallel workers may share a cache directory. When the
+        cache grows beyond :param max_size bytes, the least recently used entries are evicted.
+        Entries are pickled, so the cache directory must only be writable by trusted users.
+
+        :param directory: absolute path of the cache directory (string)
+        :param max_size: maximum total size of the cache in bytes (integer)
+        """
+
+        self._directory = directory
+        self._max_size = max_size
+
+    def key(self, source):
+        """
+        Returns the cache key for :param source
+
+        :param source: assembly source code (string)
+        :return: (string)
+        """
+
+        digest = hashlib.sha256("{0}:{1}:".format(__version__, CACHE_FORMAT).encode())
+        digest.update(source.encode())
+
+        return digest.hexdigest()
+
+    def get(self, source):
+        """
+        Returns the cached statements for :param source, or None on a miss.
+        A hit marks the entry as recently used.
+
+        :param source: assembly source code (string)
+        :return: (list or None)
+        """
+
+        path = self._path(self.key(source))
+
+        try:
+            with open(path, "rb") as file:
+                statements = pickle.load(file)
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        except Exception:
+            self._remove(path)
+            return None
+
+        return statements
+
+    def put(self, source, statements):
+        """
+        Stores :param statements for :param source, then evicts least recently used entries if the cache is full.
+        Failures to write are ignored; the cache is only an optimisation.
+
+        :param source: assembly source code (string)
+        :param statements: list of statements produced by the parser (list)
+        :return: (None)
+        """
+
+        import tempfile
+
+        try:
+            os.makedirs(self._directory, exist_ok=True)
+            descriptor, temporary = tempfile.mkstemp(dir=self._directory, suffix=".tmp")
+
+            try:
+                with os.fdopen(descriptor, "wb") as file:
+                    pickle.dump(statements, file, pickle.HIGHEST_PROTOCOL)
+                os.replace(temporary, self._path(self.key(source)))
+            except BaseException:
+                self._remove(temporary)
+                raise
+
+            self._evict()
+        except (OSError, pickle.PicklingError, RecursionError):
+            pass
+
+    def clear(self):
+        """
+        Removes every entry from the cache
+
+        :return: (None)
+        """
+
+        for entry in self._entries():
+            self._remove(entry.path)
+
+    def _path(self, key):
+        """
+        Returns the absolute path of the entry for :param key
+
+        :param key: (string)
+        :return: (string)
+        """
+
+        return os.path.join(self._directory, "{0}.pickle".format(key))
+
+    def _entries(self):
+        """
+        Returns the cache entries currently on disk
+
+        :return: (list)
+        """
+
+        try:
+            return [entry for entry in os.scandir(self._directory) if entry.name.endswith(".pickle")]
+        except FileNotFoundError:
+            return []
+
+    def _evict(self):
+        """
+        Removes least recently used entries until the cache is within its size limit.
+        Entries removed concurrently by another worker are skipped.
+
+        :return: (None)
+        """
+
+        entries = []
+        for entry in self._entries():
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, entry.path))
+
+        size = sum(entry[1] for entry in entries)
+
+        for _, entry_size, path in sorted(entries):
+            if size <= self._max_size:
+                break
+
+            self._remove(path)
+            size -= entry_size
+
+    def _remove(self, path):
+        """
+        Removes the file at :param path, if it exists
+
+        :param path: (string)
+        :return: (None)
+        """
+
+        try:
+            os.remove(path)
+        except OSError:
+            pass
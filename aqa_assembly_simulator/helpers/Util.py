@@ -17,6 +17,22 @@ def read_file(file_location):
         return ""
 
 
+def read_lines(file_location):
+    """
+    Generator that reads the file stored at :param file_location one line at a time.
+    Line endings are kept, so joining the lines reproduces the contents of the file.
+
+    :param file_location: absolute path for the file to be read (string)
+    :return: lines of the file (generator)
+    """
+
+    try:
+        with open(file_location, "r") as file:
+            yield from file
+    except FileNotFoundError:
+        print("[ERROR] Error: FileNotFoundError, Response: Failed to read {0}".format(file_location), file=sys.stderr)
+
+
 def write_file(file_location, data):
     """
     Writes :param data to the file stored at :param file_locations
@@ -0,0 +1,253 @@
+from aqa_assembly_simulator.helpers.Constants import LINE_CACHE_SIZE
+from aqa_assembly_simulator.language_server.Line import Line
+from aqa_assembly_simulator.lexer.TokenType import TokenType
+
+ERROR = 1
+WARNING = 2
+
+DESCRIPTIONS = {
+    TokenType.LDR: ("LDR r_d, <memory reference>", "Load the value stored in the memory location specified by <memory reference> into register r_d."),
+    TokenType.STR: ("STR r_d, <memory reference>", "Store the value that is in register r_d into the memory location specified by <memory reference>."),
+    TokenType.ADD: ("ADD r_d, r_n, <operand 2>", "Add the value specified in <operand 2> to the value in register r_n and store the result in register r_d."),
+    TokenType.SUB: ("SUB r_d, r_n, <operand 2>", "Subtract the value specified by <operand 2> from the value in register r_n and store the result in register r_d."),
+    TokenType.MOV: ("MOV r_d, <operand 2>", "Copy the value specified by <operand 2> into register r_d."),
+    TokenType.CMP: ("CMP r_d, <operand 2>", "Compare the value stored in register r_d with the value specified by <operand 2>."),
+    TokenType.B: ("B <label>", "Always branch to the instruction at position <label> in the program."),
+    TokenType.BEQ: ("BEQ <label>", "Branch to the instruction at position <label> if the last comparison was equal to."),
+    TokenType.BNE: ("BNE <label>", "Branch to the instruction at position <label> if the last comparison was not equal to."),
+    TokenType.BGT: ("BGT <label>", "Branch to the instruction at position <label> if the last comparison was greater than."),
+    TokenType.BLT: ("BLT <label>", "Branch to the instruction at position <label> if the last comparison was less than."),
+    TokenType.AND: ("AND r_d, r_n, <operand 2>", "Perform a bitwise logical AND operation between the value in register r_n and the value specified by <operand 2> and store the result in register r_d."),
+    TokenType.ORR: ("ORR r_d, r_n, <operand 2>", "Perform a bitwise logical OR operation between the value in register r_n and the value specified by <operand 2> and store the result in register r_d."),
+    TokenType.EOR: ("EOR r_d, r_n, <operand 2>", "Perform a bitwise logical XOR operation between the value in register r_n and the value specified by <operand 2> and store the result in register r_d."),
+    TokenType.MVN: ("MVN r_d, <operand 2>", "Perform a bitwise logical NOT operation on the value specified by <operand 2> and store the result in register r_d."),
+    TokenType.LSL: ("LSL r_d, r_n, <operand 2>", "Logically shift left the value stored in register r_n by the number of bits specified by <operand 2> and store the result in register r_d."),
+    TokenType.LSR: ("LSR r_d, r_n, <operand 2>", "Logically shift right the value stored in register r_n by the number of bits specified by <operand 2> and store the result in register r_d."),
+    TokenType.HALT: ("HALT", "Stops the execution of the program.")
+}
+
+
+class Document:
+
+    def __init__(self, uri, text):
+        """
+        Document constructor.
+        Holds the analysis of every line of an open source file. Edits only re-lex and re-parse the lines they touch,
+        unchanged lines keep their analysis and lines whose text has been seen before are taken from a cache.
+        Positions are zero based (line, column) pairs, as used by the Language Server Protocol.
+
+        :param uri: document identifier (string)
+        :param text: source code (string)
+        """
+
+        self._uri = uri
+        self._cache = {}
+        self._lines = [self._analyse(line) for line in text.split("\n")]
+
+    def get_uri(self):
+        """
+        Returns the document identifier
+
+        :return: (string)
+        """
+
+        return self._uri
+
+    def get_text(self):
+        """
+        Returns the source code
+
+        :return: (string)
+        """
+
+        return "\n".join(line.get_text() for line in self._lines)
+
+    def change(self, text, start=None, end=None):
+        """
+        Replaces the text between positions :param start and :param end with :param text.
+        If no range is given, the whole document is replaced.
+
+        :param text: replacement text (string)
+        :param start: in format (line, column) (tuple)
+        :param end: in format (line, column) (tuple)
+        :return: (None)
+        """
+
+        if start is None or end is None:
+            start, end = (0, 0), (len(self._lines) - 1, len(self._lines[-1].get_text()))
+
+        start_line, end_line = [min(max(line, 0), len(self._lines) - 1) for line, _ in (start, end)]
+
+        replacement = (
+            self._lines[start_line].get_text()[:start[1]] + text + self._lines[end_line].get_text()[end[1]:]
+        ).split("\n")
+
+        self._lines[start_line:end_line + 1] = [self._analyse(line) for line in replacement]
+
+    def get_diagnostics(self, registers=None, memory_capacity=None):
+        """
+        Returns lexer errors, parser errors and statements that would raise a virtual machine error: branches to
+        undefined labels and, when the virtual machine config is known, register and memory references out of range.
+
+        :param registers: number of registers in the virtual machine, None to skip the check (integer)
+        :param memory_capacity: number of addressable memory units, None to skip the check (integer)
+        :return: list of Language Server Protocol diagnostics (list)
+        """
+
+        if len(self._lines) == 1 and not self._lines[0].get_text():
+            return [self._diagnostic(0, 0, 0, "File is empty", ERROR)]
+
+        labels = self._labels()
+        diagnostics = []
+
+        for index, line in enumerate(self._lines):
+            for message, start, end in line.get_errors():
+                diagnostics.append(self._diagnostic(index, start, end, message, ERROR))
+
+            for token, start, end in line.get_references():
+                if token.get_lexeme() not in labels:
+                    diagnostics.append(self._diagnostic(index, start, end, "Invalid label identifier", WARNING))
+
+            if registers is not None:
+                for token, start, end in line.get_registers():
+                    if not 1 <= token.get_literal() <= registers:
+                        diagnostics.append(self._diagnostic(index, start, end, "Register index out of range", WARNING))
+
+            if memory_capacity is not None:
+                for token, start, end in line.get_addresses():
+                    if not 0 <= token.get_literal() < memory_capacity:
+                        diagnostics.append(self._diagnostic(index, start, end, "Address index out of range", WARNING))
+
+        return diagnostics
+
+    def get_definition(self, line, character):
+        """
+        Returns the location of the declaration of the label at position (:param line, :param character)
+
+        :param line: (integer)
+        :param character: (integer)
+        :return: Language Server Protocol location or None (dict)
+        """
+
+        token = self._token_at(line, character)
+        if token is None or token[0].get_type() != TokenType.IDENTIFIER:
+            return None
+
+        label = self._labels().get(token[0].get_lexeme())
+        if label is None:
+            return None
+
+        return {"uri": self._uri, "range": self._range(*label)}
+
+    def get_hover(self, line, character):
+        """
+        Returns a description of the token at position (:param line, :param character)
+
+        :param line: (integer)
+        :param character: (integer)
+        :return: Language Server Protocol hover or None (dict)
+        """
+
+        token = self._token_at(line, character)
+        if token is None:
+            return None
+
+        token, start, end = token
+        type = token.get_type()
+
+        if type in DESCRIPTIONS:
+            contents = "{0}\n\n{1}".format(*DESCRIPTIONS[type])
+        elif type == TokenType.REGISTER:
+            contents = "Register {0}".format(token.get_literal())
+        elif type == TokenType.IMMEDIATE_ADDRESS:
+            contents = "Immediate value {0}".format(token.get_literal())
+        elif type == TokenType.DIRECT_ADDRESS:
+            contents = "Memory address {0}".format(token.get_literal())
+        elif type == TokenType.IDENTIFIER:
+            label = self._labels().get(token.get_lexeme())
+            contents = "Label {0}, {1}".format(
+                token.get_lexeme(), "undefined" if label is None else "declared on line {0}".format(label[0] + 1)
+            )
+        else:
+            return None
+
+        return {
+            "contents": {"kind": "plaintext", "value": contents},
+            "range": self._range(line, start, end)
+        }
+
+    def _analyse(self, text):
+        """
+        Returns the analysis of line :param text, reusing a cached analysis where possible.
+
+        :param text: (string)
+        :return: (aqa_assembly_simulator.language_server.Line.Line)
+        """
+
+        line = self._cache.get(text)
+
+        if line is None:
+            if len(self._cache) >= LINE_CACHE_SIZE:
+                self._cache.clear()
+
+            line = self._cache[text] = Line(text)
+
+        return line
+
+    def _labels(self):
+        """
+        Returns the position of every label declaration. As in the virtual machine, the last declaration of a label
+        identifier wins.
+
+        :return: in format {identifier: (line, start column, end column)} (dict)
+        """
+
+        return {
+            token.get_lexeme(): (index, start, end)
+            for index, line in enumerate(self._lines) for token, start, end in line.get_labels()
+        }
+
+    def _token_at(self, line, character):
+        """
+        Returns the token at position (:param line, :param character)
+
+        :param line: (integer)
+        :param character: (integer)
+        :return: in format (token, start column, end column) or None (tuple)
+        """
+
+        if not 0 <= line < len(self._lines):
+            return None
+
+        return self._lines[line].get_token_at(character)
+
+    def _range(self, line, start, end):
+        """
+        Constructs a Language Server Protocol range on :param line
+
+        :param line: (integer)
+        :param start: start column (integer)
+        :param end: end column (integer)
+        :return: (dict)
+        """
+
+        return {"start": {"line": line, "character": start}, "end": {"line": line, "character": end}}
+
+    def _diagnostic(self, line, start, end, message, severity):
+        """
+        Constructs a Language Server Protocol diagnostic
+
+        :param line: (integer)
+        :param start: start column (integer)
+        :param end: end column (integer)
+        :param message: (string)
+        :param severity: ERROR or WARNING (integer)
+        :return: (dict)
+        """
+
+        return {
+            "range": self._range(line, start, end),
+            "severity": severity,
+            "source": "aqa-assembly-simulator",
+            "message": message
+        }
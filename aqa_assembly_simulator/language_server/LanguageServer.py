@@ -0,0 +1,202 @@
+import json
+import sys
+
+from aqa_assembly_simulator.language_server.Document import Document
+from aqa_assembly_simulator import __version__
+
+METHOD_NOT_FOUND = -32601
+INTERNAL_ERROR = -32603
+
+
+class LanguageServer:
+
+    def __init__(self, registers=None, memory_capacity=None, input=None, output=None):
+        """
+        Language Server constructor.
+        Language Server Protocol server speaking JSON-RPC over a pair of byte streams (stdin and stdout by default).
+        Publishes lexer, parser and label/bounds diagnostics, and provides go to label definition and hover.
+        Documents are synchronised incrementally, so each edit only re-analyses the lines it touches.
+
+        :param registers: number of registers in the virtual machine, None to skip register checks (integer)
+        :param memory_capacity: number of addressable memory units, None to skip memory checks (integer)
+        :param input: binary stream requests are read from (file)
+        :param output: binary stream responses are written to (file)
+        """
+
+        self._registers = registers
+        self._memory_capacity = memory_capacity
+        self._input = input or sys.stdin.buffer
+        self._output = output or sys.stdout.buffer
+
+        self._documents = {}
+        self._shutdown = False
+
+        self._requests = {
+            "initialize": self._initialize,
+            "shutdown": self._shutdown_request,
+            "textDocument/definition": self._definition,
+            "textDocument/hover": self._hover
+        }
+        self._notifications = {
+            "textDocument/didOpen": self._did_open,
+            "textDocument/didChange": self._did_change,
+            "textDocument/didClose": self._did_close
+        }
+
+    def serve(self):
+        """
+        Handles messages until an exit notification is received or the input stream is closed.
+
+        :return: exit code, 0 if a shutdown request was received first, otherwise 1 (integer)
+        """
+
+        while True:
+            message = self._read()
+            if message is None or message.get("method") == "exit":
+                return 0 if self._shutdown else 1
+
+            self._handle(message)
+
+    def _handle(self, message):
+        """
+        Dispatches :param message to its handler. Requests are answered with a result or an error response,
+        unknown notifications are ignored and errors raised by notification handlers are printed to stderr.
+
+        :param message: JSON-RPC message (dict)
+        :return: (None)
+        """
+
+        method = message.get("method")
+        params = message.get("params") or {}
+
+        if "id" not in message:
+            if method in self._notifications:
+                try:
+                    self._notifications[method](params)
+                except Exception as error:
+                    print("[ERROR] {0} notification failed: {1!r}".format(method, error), file=sys.stderr)
+            return
+
+        if method not in self._requests:
+            self._respond(message["id"], error={"code": METHOD_NOT_FOUND, "message": "Method not found"})
+            return
+
+        try:
+            result = self._requests[method](params)
+        except Exception as error:
+            self._respond(message["id"], error={"code": INTERNAL_ERROR, "message": str(error)})
+            return
+
+        self._respond(message["id"], result=result)
+
+    def _initialize(self, params):
+        return {
+            "capabilities": {
+                "textDocumentSync": {"openClose": True, "change": 2},
+                "definitionProvider": True,
+                "hoverProvider": True
+            },
+            "serverInfo": {"name": "aqa-assembly-simulator", "version": __version__}
+        }
+
+    def _shutdown_request(self, params):
+        self._shutdown = True
+        return None
+
+    def _did_open(self, params):
+        document = params["textDocument"]
+        self._documents[document["uri"]] = Document(document["uri"], document["text"])
+        self._publish(document["uri"])
+
+    def _did_change(self, params):
+        uri = params["textDocument"]["uri"]
+        document = self._documents.get(uri)
+        if document is None:
+            return
+
+        for change in params["contentChanges"]:
+            if "range" in change:
+                start, end = change["range"]["start"], change["range"]["end"]
+                document.change(change["text"], (start["line"], start["character"]), (end["line"], end["character"]))
+            else:
+                document.change(change["text"])
+
+        self._publish(uri)
+
+    def _did_close(self, params):
+        uri = params["textDocument"]["uri"]
+        self._documents.pop(uri, None)
+        self._notify("textDocument/publishDiagnostics", {"uri": uri, "diagnostics": []})
+
+    def _definition(self, params):
+        position = params["position"]
+        return self._documents[params["textDocument"]["uri"]].get_definition(position["line"], position["character"])
+
+    def _hover(self, params):
+        position = params["position"]
+        return self._documents[params["textDocument"]["uri"]].get_hover(position["line"], position["character"])
+
+    def _publish(self, uri):
+        """
+        Publishes the diagnostics of document :param uri
+
+        :param uri: document identifier (string)
+        :return: (None)
+        """
+
+        self._notify("textDocument/publishDiagnostics", {
+            "uri": uri,
+            "diagnostics": self._documents[uri].get_diagnostics(self._registers, self._memory_capacity)
+        })
+
+    def _read(self):
+        """
+        Reads a message framed by a Content-Length header
+
+        :return: JSON-RPC message, None at the end of the input stream (dict)
+        """
+
+        length = None
+
+        while True:
+            header = self._input.readline()
+            if not header:
+                return None
+
+            header = header.decode("ascii").strip()
+            if not header:
+                break
+
+            name, _, value = header.partition(":")
+            if name.strip().lower() == "content-length":
+                length = int(value)
+
+        if length is None:
+            return self._read()
+
+        return json.loads(self._input.read(length).decode("utf-8"))
+
+    def _write(self, message):
+        """
+        Writes :param message framed by a Content-Length header
+
+        :param message: JSON-RPC message (dict)
+        :return: (None)
+        """
+
+        body = json.dumps(message).encode("utf-8")
+        self._output.write("Content-Length: {0}\r\n\r\n".format(len(body)).encode("ascii") + body)
+        self._output.flush()
+
+    def _respond(self, id, result=None, error=None):
+        message = {"jsonrpc": "2.0", "id": id}
+
+        if error is None:
+            message["result"] = result
+        else:
+            message["error"] = error
+
+        self._write(message)
+
+    def _notify(self, method, params):
+        self._write({"jsonrpc": "2.0", "method": method, "params": params})
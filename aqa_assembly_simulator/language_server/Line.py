@@ -0,0 +1,165 @@
+import aqa_assembly_simulator.parser.Statement as Statement
+from aqa_assembly_simulator.lexer.TokenType import TokenType
+from aqa_assembly_simulator.parser.Parser import Parser
+from aqa_assembly_simulator.lexer.Lexer import Lexer
+
+
+class Line:
+
+    def __init__(self, text):
+        """
+        Line constructor.
+        Lexes and parses a single line of source code. AQA statements never span lines, so a line is analysed
+        independently of the rest of the document and its analysis can be reused for as long as its text is unchanged.
+        Tokens are scanned as line 1, the document supplies the real line number.
+        Columns are indices into :param text.
+
+        :param text: line of source code, without the line terminator (string)
+        """
+
+        self._text = text
+        self._tokens = []
+        self._columns = []
+        self._statements = []
+        self._errors = []
+        self._labels = []
+        self._references = []
+        self._registers = []
+        self._addresses = []
+
+        if not text:
+            return
+
+        lexer = Lexer(text)
+        tokens = lexer.scan_tokens()
+
+        parser = Parser(tokens)
+        self._statements = [statement for statement in parser.parse() if statement is not None]
+
+        column = 0
+        for token in tokens[:-1]:
+            column = text.find(token.get_lexeme(), column)
+            self._tokens.append(token)
+            self._columns.append(column)
+            column += len(token.get_lexeme())
+
+        self._errors = [
+            (error.get_message(), 0, len(text)) for error in lexer.get_errors()
+        ] + [
+            (error.get_message(),) + self._range(error.get_token()) for error in parser.get_errors()
+        ]
+
+        self._labels = [
+            (statement.get_identifier(),) + self._range(statement.get_identifier())
+            for statement in self._statements if isinstance(statement, Statement.Label)
+        ]
+        self._references = [
+            (statement.get_label(),) + self._range(statement.get_label())
+            for statement in self._statements if isinstance(statement, Statement.BRANCHES)
+        ]
+        self._registers = self._find(TokenType.REGISTER)
+        self._addresses = self._find(TokenType.DIRECT_ADDRESS)
+
+    def get_text(self):
+        """
+        Returns the text of the line
+
+        :return: (string)
+        """
+
+        return self._text
+
+    def get_statements(self):
+        """
+        Returns the statements parsed from the line
+
+        :return: (list)
+        """
+
+        return self._statements
+
+    def get_errors(self):
+        """
+        Returns lexer and parser errors
+
+        :return: in format [(message, start column, end column), ...] (list)
+        """
+
+        return self._errors
+
+    def get_labels(self):
+        """
+        Returns the label identifiers declared on the line
+
+        :return: in format [(token, start column, end column), ...] (list)
+        """
+
+        return self._labels
+
+    def get_references(self):
+        """
+        Returns the label identifiers branched to on the line
+
+        :return: in format [(token, start column, end column), ...] (list)
+        """
+
+        return self._references
+
+    def get_registers(self):
+        """
+        Returns the register references on the line
+
+        :return: in format [(token, start column, end column), ...] (list)
+        """
+
+        return self._registers
+
+    def get_addresses(self):
+        """
+        Returns the direct address references on the line
+
+        :return: in format [(token, start column, end column), ...] (list)
+        """
+
+        return self._addresses
+
+    def get_token_at(self, character):
+        """
+        Returns the token at column :param character, including a cursor placed directly after the token
+
+        :param character: column (integer)
+        :return: in format (token, start column, end column) or None (tuple)
+        """
+
+        for token, column in zip(self._tokens, self._columns):
+            if column <= character <= column + len(token.get_lexeme()):
+                return token, column, column + len(token.get_lexeme())
+
+        return None
+
+    def _find(self, type):
+        """
+        Returns the tokens of type :param type on the line
+
+        :param type: (aqa_assembly_simulator.lexer.TokenType.TokenType)
+        :return: in format [(token, start column, end column), ...] (list)
+        """
+
+        return [
+            (token, column, column + len(token.get_lexeme()))
+            for token, column in zip(self._tokens, self._columns) if token.get_type() == type
+        ]
+
+    def _range(self, token):
+        """
+        Returns the columns spanned by :param token. The End Of File token spans the end of the line.
+
+        :param token: (aqa_assembly_simulator.lexer.Token.Token)
+        :return: in format (start column, end column) (tuple)
+        """
+
+        for other, column in zip(self._tokens, self._columns):
+            if other is token:
+                return column, column + len(token.get_lexeme())
+
+        return len(self._text), len(self._text)
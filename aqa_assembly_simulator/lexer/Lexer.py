@@ -1,10 +1,15 @@
 import re as regular_expression
 
 from aqa_assembly_simulator.lexer.TokenType import TokenType, KEYWORDS
-from aqa_assembly_simulator.helpers.Constants import INTEGER_REGEX
+from aqa_assembly_simulator.helpers.Constants import INTEGER_REGEX, TOKEN_REGEX
 from aqa_assembly_simulator.error.LexerError import LexerError
 from aqa_assembly_simulator.lexer.Token import Token
 
+TOKENS = regular_expression.compile(TOKEN_REGEX, regular_expression.DOTALL)
+TOKEN_TYPES = {
+    type.name: type for type in [TokenType.COMMA, TokenType.COLON, TokenType.REGISTER, TokenType.IMMEDIATE_ADDRESS]
+}
+
 
 class Lexer:
 
@@ -12,10 +17,13 @@ class Lexer:
         """
         Lexer constructor
 
-        :param source: assembly source code (string)
+        :param source: assembly source code, or an iterable of source code lines for streaming (string or iterable)
         """
 
-        self._source = source
+        self._stream = not isinstance(source, str)
+        self._chunks = source if self._stream else [source]
+
+        self._source = "" if self._stream else source
         self._tokens = []
         self._errors = []
 
@@ -23,7 +31,7 @@ class Lexer:
         self._current = 0
         self._line = 1
 
-        if not self._source:
+        if not self._stream and not self._source:
             self._error("File is empty", self._peek())
 
     def scan_tokens(self):
@@ -34,12 +42,96 @@ class Lexer:
         :return: (list)
         """
 
+        return list(self.iter_tokens())
+
+    def iter_tokens(self):
+        """
+        Generator that performs lexical analysis on the source code, yielding tokens followed by an End Of File token.
+        When the lexer was constructed from an iterable of lines, lines are read and scanned one at a time, so only
+        the tokens of the current line are held in memory. Tokens never span lines, so the tokens and errors produced
+        are identical to scanning the whole source code at once.
+
+        :return: (generator)
+        """
+
+        empty = True
+
+        for chunk in self._chunks:
+            empty = empty and not chunk
+
+            self._tokens = []
+            self._scan_chunk(chunk)
+            yield from self._tokens
+
+        if self._stream and empty:
+            self._error("File is empty", "\0")
+
+        yield Token(TokenType.EOF, "", None, self._line)
+
+    def _scan_chunk(self, chunk):
+        """
+        Scans :param chunk, appending tokens to the internal tokens list.
+        ASCII source code is scanned by a single compiled regular expression. Source code containing other characters
+        is scanned one character at a time, so that unicode digits and letters are classified by str.isdigit and
+        str.isalpha exactly as before.
+
+        :param chunk: source code, or a line of source code (string)
+        :return: (None)
+        """
+
+        if chunk.isascii():
+            self._scan_source(chunk)
+            return
+
+        self._source, self._start, self._current = chunk, 0, 0
+
         while not self._is_at_end():
             self._start = self._current
             self._scan_token()
 
-        self._tokens.append(Token(TokenType.EOF, "", None, self._line))
-        return self._tokens
+    def _scan_source(self, source):
+        """
+        Scans ASCII :param source using the master token regular expression, appending tokens and errors.
+        Produces the same tokens and errors as the character scanner.
+
+        :param source: ASCII source code (string)
+        :return: (None)
+        """
+
+        tokens = self._tokens
+        line = self._line
+        keywords = KEYWORDS.get
+        identifier = TokenType.IDENTIFIER
+
+        for match in TOKENS.finditer(source):
+            kind = match.lastgroup
+
+            if kind == "NEWLINE":
+                line += 1
+                continue
+
+            if kind == "COMMENT" or kind == "END":
+                continue
+
+            lexeme = match.group(kind)
+
+            if kind == "IDENTIFIER":
+                tokens.append(Token(keywords(lexeme, identifier), lexeme, lexeme, line))
+            elif kind == "COMMA" or kind == "COLON":
+                tokens.append(Token(TOKEN_TYPES[kind], lexeme, None, line))
+            elif kind == "MISMATCH":
+                self._errors.append(LexerError(line, "Unexpected character", lexeme))
+            elif kind == "DIRECT_ADDRESS":
+                tokens.append(Token(TokenType.DIRECT_ADDRESS, lexeme, int(lexeme), line))
+            elif len(lexeme) > 1:
+                tokens.append(Token(TOKEN_TYPES[kind], lexeme, int(lexeme[1:]), line))
+            else:
+                end = match.end()
+                self._errors.append(LexerError(
+                    line, "Invalid integer format", source[end] if end < len(source) else "\0"
+                ))
+
+        self._line = line
 
     def get_errors(self):
         """
@@ -1,8 +1,14 @@
+from sys import intern
+
+
 class Token:
 
+    __slots__ = ("_type", "_lexeme", "_literal", "_line")
+
     def __init__(self, type, lexeme, literal, line):
         """
-        Token constructor
+        Token constructor.
+        Lexemes and string literals are interned, so every occurrence of a mnemonic, register or label shares one string.
 
         :param type: token type (aqa_assembly_simulator.lexer.TokenType.TokenType)
         :param lexeme: string representation of the token (string)
@@ -11,8 +17,8 @@ class Token:
         """
 
         self._type = type
-        self._lexeme = lexeme
-        self._literal = literal
+        self._lexeme = intern(lexeme)
+        self._literal = intern(literal) if isinstance(literal, str) else literal
         self._line = line
 
     def get_type(self):
@@ -0,0 +1,24 @@
+import json
+
+from aqa_assembly_simulator.lexer.TokenType import TokenType, STATEMENTS
+from aqa_assembly_simulator.helpers.Constants import SYNTAX_JSON
+from aqa_assembly_simulator.helpers.Util import read_file
+
+
+def _build_grammar():
+    """
+    Builds the instruction dispatch table from the syntax conditions stored in syntax.json.
+    Read once, when the module is first imported.
+
+    :return: in format {mnemonic token type: (statement class, ((operand token type, error message), ...))} (dict)
+    """
+
+    return {
+        TokenType(int(type)): (
+            STATEMENTS[int(type)],
+            tuple((TokenType(token["Type"]), token["Error"]) for token in tokens)
+        ) for type, tokens in json.loads(read_file(SYNTAX_JSON)).items()
+    }
+
+
+GRAMMAR = _build_grammar()
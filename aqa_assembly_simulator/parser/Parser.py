@@ -1,10 +1,7 @@
-import json
-
-from aqa_assembly_simulator.lexer.TokenType import TokenType, STATEMENTS
-from aqa_assembly_simulator.helpers.Constants import SYNTAX_JSON
 from aqa_assembly_simulator.error.ParseError import ParseError
 from aqa_assembly_simulator.parser.Statement import Label
-from aqa_assembly_simulator.helpers.Util import read_file
+from aqa_assembly_simulator.lexer.TokenType import TokenType
+from aqa_assembly_simulator.parser.Grammar import GRAMMAR
 
 
 class Parser:
@@ -13,13 +10,14 @@ class Parser:
         """
         Parser (syntactic analyser) constructor
 
-        :param tokens: list containing tokens produced from lexical analysis (list)
+        :param tokens: tokens produced from lexical analysis, ending with an End Of File token. May be a generator,
+                       in which case tokens are consumed as they are produced (list or iterable)
         """
 
-        self._current = 0
-        self._tokens = tokens
+        self._tokens = iter(tokens)
+        self._current_token = next(self._tokens)
+        self._previous_token = None
 
-        self._syntax = self._read_syntax()
         self._errors = []
 
     def get_errors(self):
@@ -31,32 +29,25 @@ class Parser:
 
         return self._errors
 
-    def _read_syntax(self):
+    def parse(self):
         """
-        Returns syntax conditions stored in syntax.json.
-        Converts keys from string to integer.
+        Performs syntactic analysis on the tokens to produce a list of statements.
 
-        :return: (dict)
+        :return: (list)
         """
 
-        return {
-            int(key): value for key, value
-            in json.loads(read_file(SYNTAX_JSON)).items()
-        }
+        return list(self.iter_statements())
 
-    def parse(self):
+    def iter_statements(self):
         """
-        Performs syntactic analysis on the tokens to produce a list of statements.
+        Generator that performs syntactic analysis on the tokens, yielding statements as soon as they are parsed.
+        Statements that could not be parsed are yielded as None.
 
-        :return: (list)
+        :return: (generator)
         """
 
-        statements = []
-
         while not self._is_at_end():
-            statements.append(self._declaration())
-
-        return statements
+            yield self._declaration()
 
     def _declaration(self):
         """
@@ -91,52 +82,58 @@ class Parser:
     def _statement(self):
         """
         Parses tokens to statement.
-        Uses syntax conditions stored in syntax.json to parse tokens to valid statements.
+        Looks up the syntax conditions for the current mnemonic in the grammar dispatch table built from syntax.json.
         If an unexpected token is discovered then a parser error is raised.
 
         :return: (aqa_assembly_simulator.parser.Statement.Statement)
         """
 
-        for type in self._syntax.keys():
-            if self._match(TokenType(type)):
-                return self._instruction(type)
+        rule = GRAMMAR.get(self._peek().get_type())
+        if rule is None:
+            raise self._error(self._peek(), "Unexpected token")
 
-        raise self._error(self._peek(), "Unexpected token")
+        return self._instruction(*rule, self._move())
 
-    def _instruction(self, type):
+    def _instruction(self, statement, conditions, mnemonic):
         """
-        Uses syntax conditions for :param type to parse current tokens to statement.
+        Uses syntax :param conditions to parse current tokens to statement.
         If unexpected token is discovered then a parser error is raised.
         If an <operand 2> condition is discovered then it is validated and appended to the tokens list.
+        Statements without operands (HALT) are given :param mnemonic, so they keep their source line.
 
-        :param type: token type (integer)
+        :param statement: statement class (sub-class of aqa_assembly_simulator.parser.Statement.Statement)
+        :param conditions: in format ((token type, error message), ...) (tuple)
+        :param mnemonic: mnemonic token of the statement (aqa_assembly_simulator.lexer.Token.Token)
         :return: (aqa_assembly_simulator.parser.Statement.Statement)
         """
 
+        if not conditions:
+            return statement([mnemonic])
+
         tokens = []
 
-        for token in self._syntax[type]:
-            if TokenType(token["Type"]) == TokenType.COMMA:
-                self._consume(TokenType.COMMA, token["Error"])
-            elif TokenType(token["Type"]) == TokenType.OPERAND:
-                tokens.append(self._operand(token))
+        for type, error in conditions:
+            if type == TokenType.COMMA:
+                self._consume(TokenType.COMMA, error)
+            elif type == TokenType.OPERAND:
+                tokens.append(self._operand(error))
             else:
-                tokens.append(self._consume(TokenType(token["Type"]), token["Error"]))
+                tokens.append(self._consume(type, error))
 
-        return STATEMENTS[type](tokens)
+        return statement(tokens)
 
-    def _operand(self, token):
+    def _operand(self, message):
         """
         Validates token based on <operand 2> conditions.
 
-        :param token: token condition object (dict)
+        :param message: error message (string)
         :return: (aqa_assembly_simulator.lexer.Token.Token)
         """
 
         if self._check(TokenType.IMMEDIATE_ADDRESS) or self._check(TokenType.REGISTER):
             return self._move()
 
-        raise self._error(self._peek(), token["Error"])
+        raise self._error(self._peek(), message)
 
     def _consume(self, type, message):
         """
@@ -183,14 +180,15 @@ class Parser:
 
     def _move(self):
         """
-        Increments current pointer for tokens list, if not at the end of tokens list.
+        Advances to the next token, if not at the end of the tokens.
         Returns the previous token.
 
         :return: (aqa_assembly_simulator.lexer.Token.Token)
         """
 
         if not self._is_at_end():
-            self._current += 1
+            self._previous_token = self._current_token
+            self._current_token = next(self._tokens)
 
         return self._previous()
 
@@ -214,7 +212,7 @@ class Parser:
         :return: (aqa_assembly_simulator.lexer.Token.Token)
         """
 
-        return self._tokens[self._current]
+        return self._current_token
 
     def _previous(self):
         """
@@ -223,7 +221,7 @@ class Parser:
         :return: (aqa_assembly_simulator.lexer.Token.Token)
         """
 
-        return self._tokens[self._current - 1]
+        return self._previous_token
 
     def _is_at_end(self):
         """
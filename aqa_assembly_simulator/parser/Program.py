@@ -0,0 +1,319 @@
+from array import array
+
+from aqa_assembly_simulator.parser.Statement import StatementVisitor
+from aqa_assembly_simulator.lexer.TokenType import TokenType
+
+COLUMN_TYPE = "i"
+VALUE_TYPE = "q"
+
+
+class _Encoder(StatementVisitor):
+    """
+    Translates statements into rows of the struct of arrays program representation.
+    Every row is in format (opcode, r_d, r_n, operand kind, operand value, label, line), where label is the identifier
+    of the label a branch jumps to or a label statement defines, and line is the source line of the statement. Halt
+    statements built without their mnemonic token are given the line of the statement before them.
+    Branches have operand kind TokenType.IDENTIFIER, and branches and labels have the symbol table index of the label
+    as operand value.
+    """
+
+    def __init__(self):
+        """
+        Encoder constructor
+        """
+
+        self._line = 0
+        self._symbols = {}
+
+    def encode(self, statement):
+        """
+        Encodes :param statement into a row
+
+        :param statement: (aqa_assembly_simulator.parser.Statement.Statement)
+        :return: (tuple)
+        """
+
+        return statement.accept(self)
+
+    def get_symbols(self):
+        """
+        Returns the identifiers of the labels referenced or defined by the encoded statements, in order of first use
+
+        :return: (list)
+        """
+
+        return list(self._symbols)
+
+    def _encode(self, type, register_d=None, register_n=None, operand=None):
+        """
+        Returns the row for a statement. Records the source line of the first operand.
+
+        :param type: (aqa_assembly_simulator.lexer.TokenType.TokenType)
+        :param register_d: (aqa_assembly_simulator.lexer.Token.Token)
+        :param register_n: (aqa_assembly_simulator.lexer.Token.Token)
+        :param operand: <operand 2> or direct address (aqa_assembly_simulator.lexer.Token.Token)
+        :return: (tuple)
+        """
+
+        first = register_d or register_n or operand
+        if first:
+            self._line = first.get_line()
+
+        return (
+            type.value,
+            register_d.get_literal() if register_d else 0,
+            register_n.get_literal() if register_n else 0,
+            operand.get_type().value if operand else 0,
+            operand.get_literal() if operand else 0,
+            None,
+            self._line
+        )
+
+    def _label(self, type, token):
+        self._line = token.get_line()
+        identifier = token.get_lexeme()
+        return (
+            type.value, 0, 0, 0 if type == TokenType.IDENTIFIER else TokenType.IDENTIFIER.value,
+            self._symbols.setdefault(identifier, len(self._symbols)), identifier, self._line
+        )
+
+    def visit_load_statement(self, statement):
+        return self._encode(TokenType.LDR, statement.get_register(), None, statement.get_direct_address())
+
+    def visit_store_statement(self, statement):
+        return self._encode(TokenType.STR, statement.get_register(), None, statement.get_direct_address())
+
+    def visit_add_statement(self, statement):
+        return self._encode(TokenType.ADD, statement.get_register_d(), statement.get_register_n(), statement.get_operand())
+
+    def visit_subtract_statement(self, statement):
+        return self._encode(TokenType.SUB, statement.get_register_d(), statement.get_register_n(), statement.get_operand())
+
+    def visit_move_statement(self, statement):
+        return self._encode(TokenType.MOV, statement.get_register_d(), None, statement.get_operand())
+
+    def visit_compare_statement(self, statement):
+        return self._encode(TokenType.CMP, statement.get_register_d(), None, statement.get_operand())
+
+    def visit_branch_statement(self, statement):
+        return self._label(TokenType.B, statement.get_label())
+
+    def visit_branch_equal_statement(self, statement):
+        return self._label(TokenType.BEQ, statement.get_label())
+
+    def visit_branch_not_equal_statement(self, statement):
+        return self._label(TokenType.BNE, statement.get_label())
+
+    def visit_branch_greater_than_statement(self, statement):
+        return self._label(TokenType.BGT, statement.get_label())
+
+    def visit_branch_less_than_statement(self, statement):
+        return self._label(TokenType.BLT, statement.get_label())
+
+    def visit_and_statement(self, statement):
+        return self._encode(TokenType.AND, statement.get_register_d(), statement.get_register_n(), statement.get_operand())
+
+    def visit_or_statement(self, statement):
+        return self._encode(TokenType.ORR, statement.get_register_d(), statement.get_register_n(), statement.get_operand())
+
+    def visit_eor_statement(self, statement):
+        return self._encode(TokenType.EOR, statement.get_register_d(), statement.get_register_n(), statement.get_operand())
+
+    def visit_not_statement(self, statement):
+        return self._encode(TokenType.MVN, statement.get_register_d(), None, statement.get_operand())
+
+    def visit_left_shift_statement(self, statement):
+        return self._encode(TokenType.LSL, statement.get_register_d(), statement.get_register_n(), statement.get_operand())
+
+    def visit_right_shift_statement(self, statement):
+        return self._encode(TokenType.LSR, statement.get_register_d(), statement.get_register_n(), statement.get_operand())
+
+    def visit_halt_statement(self, statement):
+        if statement.get_token() is not None:
+            self._line = statement.get_token().get_line()
+
+        return self._encode(TokenType.HALT)
+
+    def visit_label_statement(self, statement):
+        return self._label(TokenType.IDENTIFIER, statement.get_identifier())
+
+
+def statement_lines(statements):
+    """
+    Returns the source line of each statement. Halt statements built without their mnemonic token are given the line
+    of the statement before them.
+
+    :param statements: list of statements produced by the parser (list)
+    :return: (list)
+    """
+
+    encoder = _Encoder()
+    return [encoder.encode(statement)[-1] for statement in statements]
+
+
+class Program:
+
+    def __init__(self, opcodes, registers_d, registers_n, operand_kinds, operand_values, branch_targets, lines,
+                 labels, symbols):
+        """
+        Program constructor.
+        Struct of arrays representation of a list of statements. Row i of every column describes statement i, so
+        indices match the program counter of the virtual machine. Columns are array('i') objects, apart from operand
+        values which are array('q'), the width of the object format. Arrays pickle as raw bytes and support the buffer
+        protocol for sharing between processes.
+
+        :param opcodes: token type value of each mnemonic, TokenType.IDENTIFIER for labels (array)
+        :param registers_d: r_d literal, 0 if the statement has no r_d (array)
+        :param registers_n: r_n literal, 0 if the statement has no r_n (array)
+        :param operand_kinds: token type value of <operand 2> or the direct address, TokenType.IDENTIFIER for
+        branches, 0 if there is none (array)
+        :param operand_values: literal of <operand 2> or the direct address, index in :param symbols for branches and
+        labels, 0 if there is none (array)
+        :param branch_targets: index of the label statement a branch jumps to, -1 for undefined labels and
+        statements that are not branches (array)
+        :param lines: source line of each statement (array)
+        :param labels: label definitions, in format {identifier: index} (dict)
+        :param symbols: identifiers of every label referenced or defined, in order of first use (list)
+        """
+
+        self._opcodes = opcodes
+        self._registers_d = registers_d
+        self._registers_n = registers_n
+        self._operand_kinds = operand_kinds
+        self._operand_values = operand_values
+        self._branch_targets = branch_targets
+        self._lines = lines
+        self._labels = labels
+        self._symbols = symbols
+
+    @staticmethod
+    def from_statements(statements):
+        """
+        Builds the struct of arrays representation of :param statements.
+        If a register does not fit in a 32 bit signed integer or an operand in a 64 bit signed integer -> OverflowError
+        raised.
+
+        :param statements: list of statements produced by the parser (list)
+        :return: (aqa_assembly_simulator.parser.Program.Program)
+        """
+
+        encoder = _Encoder()
+        rows = [encoder.encode(statement) for statement in statements]
+        opcodes, registers_d, registers_n, operand_kinds, operand_values, identifiers, lines = list(zip(*rows)) or [()] * 7
+
+        label = TokenType.IDENTIFIER.value
+        labels = {
+            identifier: pointer for pointer, (opcode, identifier) in enumerate(zip(opcodes, identifiers))
+            if opcode == label
+        }
+
+        try:
+            columns = [
+                array(COLUMN_TYPE, opcodes), array(COLUMN_TYPE, registers_d), array(COLUMN_TYPE, registers_n),
+                array(COLUMN_TYPE, operand_kinds), array(VALUE_TYPE, operand_values)
+            ]
+        except OverflowError as error:
+            for statement, row in zip(statements, rows):
+                try:
+                    array(COLUMN_TYPE, row[:4]), array(VALUE_TYPE, row[4:5])
+                except OverflowError:
+                    raise OverflowError("{0!r} on line {1}: {2}".format(statement, row[-1], error))
+            raise
+
+        columns.append(array(COLUMN_TYPE, [
+            -1 if opcode == label else labels.get(identifier, -1)
+            for opcode, identifier in zip(opcodes, identifiers)
+        ]))
+        columns.append(array(COLUMN_TYPE, lines))
+
+        return Program(*columns, labels, encoder.get_symbols())
+
+    def get_opcodes(self):
+        """
+        Returns the opcode column
+
+        :return: (array)
+        """
+
+        return self._opcodes
+
+    def get_registers_d(self):
+        """
+        Returns the r_d column
+
+        :return: (array)
+        """
+
+        return self._registers_d
+
+    def get_registers_n(self):
+        """
+        Returns the r_n column
+
+        :return: (array)
+        """
+
+        return self._registers_n
+
+    def get_operand_kinds(self):
+        """
+        Returns the operand kind column
+
+        :return: (array)
+        """
+
+        return self._operand_kinds
+
+    def get_operand_values(self):
+        """
+        Returns the operand value column
+
+        :return: (array)
+        """
+
+        return self._operand_values
+
+    def get_branch_targets(self):
+        """
+        Returns the branch target column
+
+        :return: (array)
+        """
+
+        return self._branch_targets
+
+    def get_lines(self):
+        """
+        Returns the source line of each statement
+
+        :return: (array)
+        """
+
+        return self._lines
+
+    def get_labels(self):
+        """
+        Returns label definitions
+
+        :return: in format {identifier: index} (dict)
+        """
+
+        return self._labels
+
+    def get_symbols(self):
+        """
+        Returns the identifiers of every label referenced or defined, in order of first use
+
+        :return: (list)
+        """
+
+        return self._symbols
+
+    def __len__(self):
+        """
+        Returns the number of statements in the program
+
+        :return: (integer)
+        """
+
+        return len(self._opcodes)
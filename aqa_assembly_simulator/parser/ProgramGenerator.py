@@ -0,0 +1,102 @@
+import random
+
+from aqa_assembly_simulator.lexer.TokenType import TokenType
+from aqa_assembly_simulator.parser.Grammar import GRAMMAR
+
+
+class ProgramGenerator:
+
+    def __init__(self, registers, memory_capacity, seed=None, labels=4, immediate_range=(0, 64), invalid_rate=0.01):
+        """
+        Program Generator constructor.
+        Generates random, syntactically valid AQA assembly programs from the grammar built from syntax.json.
+        Generated programs may loop forever, so they should be executed with a step limit.
+
+        :param registers: number of registers in the virtual machine (integer)
+        :param memory_capacity: number of addressable memory units in the virtual machine (integer)
+        :param seed: random seed, None for a random seed
+        :param labels: number of distinct label identifiers used (integer)
+        :param immediate_range: inclusive range of immediate address literals (tuple)
+        :param invalid_rate: probability of a register, address or label reference being out of range (float)
+        """
+
+        self._registers = registers
+        self._memory_capacity = memory_capacity
+        self._random = random.Random(seed)
+        self._labels = ["label{0}".format(label) for label in range(labels)]
+        self._immediate_range = immediate_range
+        self._invalid_rate = invalid_rate
+
+        self._syntax = [
+            (type.name, [token for token, _ in conditions]) for type, (_, conditions) in GRAMMAR.items()
+        ]
+
+    def generate(self, length):
+        """
+        Generates the source code for a random program.
+
+        :param length: number of instructions in the program (integer)
+        :return: (string)
+        """
+
+        lines = []
+
+        for _ in range(length):
+            if self._labels and self._random.random() < 0.15:
+                lines.append("{0}:".format(self._random.choice(self._labels)))
+
+            mnemonic, tokens = self._random.choice(self._syntax)
+            operands = [self._operand(type) for type in tokens if type != TokenType.COMMA]
+
+            lines.append(" ".join([mnemonic, ", ".join(operands)]) if operands else mnemonic)
+
+        return "\n".join(lines) + "\n"
+
+    def _invalid(self):
+        """
+        Returns whether the next reference should be out of range
+
+        :return: (boolean)
+        """
+
+        return self._random.random() < self._invalid_rate
+
+    def _operand(self, type):
+        """
+        Generates the lexeme of a random operand of type :param type
+
+        :param type: (aqa_assembly_simulator.lexer.TokenType.TokenType)
+        :return: (string)
+        """
+
+        if type == TokenType.REGISTER:
+            return self._register()
+
+        if type == TokenType.OPERAND:
+            if self._random.random() < 0.5:
+                return self._register()
+
+            return "#{0}".format(self._random.randint(*self._immediate_range))
+
+        if type == TokenType.DIRECT_ADDRESS:
+            if self._invalid():
+                return str(self._memory_capacity + self._random.randint(0, 3))
+
+            return str(self._random.randrange(self._memory_capacity))
+
+        if self._invalid() or not self._labels:
+            return "undefined"
+
+        return self._random.choice(self._labels)
+
+    def _register(self):
+        """
+        Generates the lexeme of a random register reference
+
+        :return: (string)
+        """
+
+        if self._invalid():
+            return "r{0}".format(self._random.choice([0, self._registers + 1]))
+
+        return "r{0}".format(self._random.randint(1, self._registers))
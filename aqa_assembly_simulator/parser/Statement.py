@@ -76,7 +76,7 @@ class StatementVisitor(Abstract):
         pass
 
     @abstractmethod
-    def visit_halt_statement(self):
+    def visit_halt_statement(self, statement):
         pass
 
     @abstractmethod
@@ -88,8 +88,11 @@ class Statement(Abstract):
     """
     Parent class of the Statement class.
     Inherited by all statement objects.
+    Statements declare __slots__, so they have no per-instance __dict__.
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def accept(self, visitor):
         pass
@@ -97,6 +100,8 @@ class Statement(Abstract):
 
 class Load(Statement):
 
+    __slots__ = ("_register", "_direct_address")
+
     def __init__(self, tokens):
         """
         Load statement constructor
@@ -147,6 +152,8 @@ class Load(Statement):
 
 class Store(Statement):
 
+    __slots__ = ("_register", "_direct_address")
+
     def __init__(self, tokens):
         """
         Store statement constructor
@@ -197,6 +204,8 @@ class Store(Statement):
 
 class Add(Statement):
 
+    __slots__ = ("_register_d", "_register_n", "_operand")
+
     def __init__(self, tokens):
         """
         Add statement constructor
@@ -258,6 +267,8 @@ class Add(Statement):
 
 class Subtract(Statement):
 
+    __slots__ = ("_register_d", "_register_n", "_operand")
+
     def __init__(self, tokens):
         """
         Subtract statement constructor
@@ -319,6 +330,8 @@ class Subtract(Statement):
 
 class Move(Statement):
 
+    __slots__ = ("_register_d", "_operand")
+
     def __init__(self, tokens):
         """
         Move statement constructor
@@ -369,6 +382,8 @@ class Move(Statement):
 
 class Compare(Statement):
 
+    __slots__ = ("_register_d", "_operand")
+
     def __init__(self, tokens):
         """
         Compare statement constructor
@@ -419,6 +434,8 @@ class Compare(Statement):
 
 class Branch(Statement):
 
+    __slots__ = ("_label",)
+
     def __init__(self, tokens):
         """
         Branch statement constructor
@@ -460,6 +477,8 @@ class Branch(Statement):
 
 class BranchEqual(Statement):
 
+    __slots__ = ("_label",)
+
     def __init__(self, tokens):
         """
         Branch equal statement constructor
@@ -501,6 +520,8 @@ class BranchEqual(Statement):
 
 class BranchNotEqual(Statement):
 
+    __slots__ = ("_label",)
+
     def __init__(self, tokens):
         """
         Branch not equal statement constructor
@@ -542,6 +563,8 @@ class BranchNotEqual(Statement):
 
 class BranchGreaterThan(Statement):
 
+    __slots__ = ("_label",)
+
     def __init__(self, tokens):
         """
         Branch greater than statement constructor
@@ -583,6 +606,8 @@ class BranchGreaterThan(Statement):
 
 class BranchLessThan(Statement):
 
+    __slots__ = ("_label",)
+
     def __init__(self, tokens):
         """
         Branch less than statement constructor
@@ -624,6 +649,8 @@ class BranchLessThan(Statement):
 
 class And(Statement):
 
+    __slots__ = ("_register_d", "_register_n", "_operand")
+
     def __init__(self, tokens):
         """
         And statement constructor
@@ -685,6 +712,8 @@ class And(Statement):
 
 class Or(Statement):
 
+    __slots__ = ("_register_d", "_register_n", "_operand")
+
     def __init__(self, tokens):
         """
         Or statement constructor
@@ -746,6 +775,8 @@ class Or(Statement):
 
 class Eor(Statement):
 
+    __slots__ = ("_register_d", "_register_n", "_operand")
+
     def __init__(self, tokens):
         """
         Xor statement constructor
@@ -807,6 +838,8 @@ class Eor(Statement):
 
 class Not(Statement):
 
+    __slots__ = ("_register_d", "_operand")
+
     def __init__(self, tokens):
         """
         Not statement constructor
@@ -859,6 +892,8 @@ class Not(Statement):
 
 class LeftShift(Statement):
 
+    __slots__ = ("_register_d", "_register_n", "_operand")
+
     def __init__(self, tokens):
         """
         Logical left shift statement constructor
@@ -920,6 +955,8 @@ class LeftShift(Statement):
 
 class RightShift(Statement):
 
+    __slots__ = ("_register_d", "_register_n", "_operand")
+
     def __init__(self, tokens):
         """
         Logical right shift statement constructor
@@ -981,14 +1018,25 @@ class RightShift(Statement):
 
 class Halt(Statement):
 
+    __slots__ = ("_token",)
+
     def __init__(self, tokens):
         """
         Halt statement constructor
 
-        :param tokens: (|tokens| = 0) (list)
+        :param tokens: (|tokens| = 1) the HALT mnemonic token, or (|tokens| = 0) if the source line is unknown (list)
         """
 
-        pass
+        self._token = tokens[0] if tokens else None
+
+    def get_token(self):
+        """
+        Returns the HALT mnemonic token, None if the source line is unknown
+
+        :return: (aqa_assembly_simulator.lexer.Token.Token)
+        """
+
+        return self._token
 
     def accept(self, visitor):
         """
@@ -999,7 +1047,7 @@ class Halt(Statement):
         :return:
         """
 
-        return visitor.visit_halt_statement()
+        return visitor.visit_halt_statement(self)
 
     def __repr__(self):
         """
@@ -1013,6 +1061,8 @@ class Halt(Statement):
 
 class Label(Statement):
 
+    __slots__ = ("_identifier",)
+
     def __init__(self, identifier):
         """
         Label statement constructor
@@ -1051,3 +1101,6 @@ class Label(Statement):
         """
 
         return "{0}:".format(self._identifier)
+
+
+BRANCHES = (Branch, BranchEqual, BranchNotEqual, BranchGreaterThan, BranchLessThan)
@@ -0,0 +1,531 @@
+import numpy
+
+from aqa_assembly_simulator.parser.Statement import StatementVisitor
+import aqa_assembly_simulator.parser.Statement as Statement
+from aqa_assembly_simulator.virtual_machine.State import State
+from aqa_assembly_simulator.lexer.TokenType import TokenType
+from aqa_assembly_simulator.error.VirtualMachineError import VirtualMachineError
+
+CONDITIONS = ["EQ", "NE", "GT", "LT"]
+INT64_MAX = numpy.iinfo(numpy.int64).max
+
+
+class _Decoder(StatementVisitor):
+    """
+    Translates statements into flat instruction tuples for the batched virtual machine.
+    Register and memory references are range checked once here, rather than on every execution. An instruction that
+    references an invalid register or address carries the error the reference virtual machine would raise, in the same
+    evaluation order.
+    """
+
+    def __init__(self, registers, memory_capacity):
+        """
+        Decoder constructor
+
+        :param registers: number of registers in the virtual machine (integer)
+        :param memory_capacity: number of addressable memory units in the virtual machine (integer)
+        """
+
+        self._registers = registers
+        self._memory_capacity = memory_capacity
+
+    def decode(self, statement):
+        """
+        Decodes :param statement into an instruction tuple in format
+        (opcode, r_d, r_n, operand, label, error, destination error), where operand is in format (is register, value).
+        The destination error is raised by an out of range r_d, which the reference virtual machine only checks after
+        the result has been computed.
+
+        :param statement: (aqa_assembly_simulator.parser.Statement.Statement)
+        :return: (tuple)
+        """
+
+        return statement.accept(self)
+
+    def _check(self, *tokens):
+        """
+        Returns the error raised by the first out of range register or memory reference in :param tokens
+
+        :param tokens: register, direct address or <operand 2> tokens in evaluation order
+        :return: (aqa_assembly_simulator.error.VirtualMachineError.VirtualMachineError)
+        """
+
+        for token in tokens:
+            if token.get_type() == TokenType.REGISTER and not 1 <= token.get_literal() <= self._registers:
+                return VirtualMachineError(token, "Register index out of range")
+
+            if token.get_type() == TokenType.DIRECT_ADDRESS and not 0 <= token.get_literal() < self._memory_capacity:
+                return VirtualMachineError(token, "Address index out of range")
+
+            if token.get_type() == TokenType.IMMEDIATE_ADDRESS and token.get_literal() > INT64_MAX:
+                return OverflowError("immediate value too large for batched virtual machine")
+
+        return None
+
+    def _operand(self, operand):
+        """
+        Decodes an <operand 2> token
+
+        :param operand: (aqa_assembly_simulator.lexer.Token.Token)
+        :return: in format (is register, value) (tuple)
+        """
+
+        return operand.get_type() == TokenType.REGISTER, operand.get_literal()
+
+    def _arithmetic(self, type, statement):
+        """
+        Decodes an r_d, r_n, <operand 2> statement
+
+        :param type: (aqa_assembly_simulator.lexer.TokenType.TokenType)
+        :param statement: (aqa_assembly_simulator.parser.Statement.Statement)
+        :return: (tuple)
+        """
+
+        register_d, register_n, operand = statement.get_register_d(), statement.get_register_n(), statement.get_operand()
+
+        return (
+            type, register_d.get_literal(), register_n.get_literal(), self._operand(operand), None,
+            self._check(register_n, operand), self._check(register_d)
+        )
+
+    def _branch(self, type, statement):
+        """
+        Decodes a branch statement
+
+        :param type: (aqa_assembly_simulator.lexer.TokenType.TokenType)
+        :param statement: (aqa_assembly_simulator.parser.Statement.Statement)
+        :return: (tuple)
+        """
+
+        return type, None, None, None, statement.get_label(), None, None
+
+    def visit_load_statement(self, statement):
+        register, address = statement.get_register(), statement.get_direct_address()
+        return (
+            TokenType.LDR, register.get_literal(), None, (False, address.get_literal()), None,
+            self._check(address, register), None
+        )
+
+    def visit_store_statement(self, statement):
+        register, address = statement.get_register(), statement.get_direct_address()
+        return (
+            TokenType.STR, register.get_literal(), None, (False, address.get_literal()), None,
+            self._check(register, address), None
+        )
+
+    def visit_add_statement(self, statement):
+        return self._arithmetic(TokenType.ADD, statement)
+
+    def visit_subtract_statement(self, statement):
+        return self._arithmetic(TokenType.SUB, statement)
+
+    def visit_move_statement(self, statement):
+        register_d, operand = statement.get_register_d(), statement.get_operand()
+        return (
+            TokenType.MOV, register_d.get_literal(), None, self._operand(operand), None,
+            self._check(operand, register_d), None
+        )
+
+    def visit_compare_statement(self, statement):
+        register_d, operand = statement.get_register_d(), statement.get_operand()
+        return (
+            TokenType.CMP, register_d.get_literal(), None, self._operand(operand), None,
+            self._check(register_d, operand), None
+        )
+
+    def visit_branch_statement(self, statement):
+        return self._branch(TokenType.B, statement)
+
+    def visit_branch_equal_statement(self, statement):
+        return self._branch(TokenType.BEQ, statement)
+
+    def visit_branch_not_equal_statement(self, statement):
+        return self._branch(TokenType.BNE, statement)
+
+    def visit_branch_greater_than_statement(self, statement):
+        return self._branch(TokenType.BGT, statement)
+
+    def visit_branch_less_than_statement(self, statement):
+        return self._branch(TokenType.BLT, statement)
+
+    def visit_and_statement(self, statement):
+        return self._arithmetic(TokenType.AND, statement)
+
+    def visit_or_statement(self, statement):
+        return self._arithmetic(TokenType.ORR, statement)
+
+    def visit_eor_statement(self, statement):
+        return self._arithmetic(TokenType.EOR, statement)
+
+    def visit_not_statement(self, statement):
+        register_d, operand = statement.get_register_d(), statement.get_operand()
+        return (
+            TokenType.MVN, register_d.get_literal(), None, self._operand(operand), None,
+            self._check(operand, register_d), None
+        )
+
+    def visit_left_shift_statement(self, statement):
+        return self._arithmetic(TokenType.LSL, statement)
+
+    def visit_right_shift_statement(self, statement):
+        return self._arithmetic(TokenType.LSR, statement)
+
+    def visit_halt_statement(self, statement):
+        return TokenType.HALT, None, None, None, None, None, None
+
+    def visit_label_statement(self, statement):
+        return TokenType.IDENTIFIER, None, None, None, None, None, None
+
+
+class BatchedVirtualMachine:
+
+    def __init__(self, statements, registers, memory_capacity, memory_images, register_images=None, coverage=None):
+        """
+        Batched Virtual Machine constructor.
+        Executes one program over many initial memory images at once. Registers, comparison registers and memory are
+        NumPy arrays with one lane per memory image; each instruction is applied to every lane whose program counter
+        references it. Lanes that diverge at a conditional branch are regrouped by program counter.
+        Values are 64-bit integers, so a lane whose ADD, SUB or LSL overflows is halted with an OverflowError, where the
+        reference virtual machine would continue with an arbitrary precision integer.
+        Direct addresses are literals, so memory only has a column for each address referenced by a LDR or STR
+        statement or set by a memory image, and memory capacity does not affect how much memory is allocated.
+
+        :param statements: list of statements produced by the parser (list)
+        :param registers: number of registers in the virtual machine (integer)
+        :param memory_capacity: number of addressable memory units in the virtual machine (integer)
+        :param memory_images: initial memory contents for each lane, each a list of values starting at address 0 or a
+                              dictionary in format {address: value} (list)
+        :param register_images: initial register contents for each lane, each a dictionary in format {index: value} (list)
+        :param coverage: records the statements and branch directions executed by any lane
+        (aqa_assembly_simulator.virtual_machine.Coverage.Coverage)
+        """
+
+        self._statements = statements
+        self._labels = {
+            statement.get_identifier().get_lexeme(): pointer
+            for pointer, statement in enumerate(statements)
+            if isinstance(statement, Statement.Label)
+        }
+
+        decoder = _Decoder(registers, memory_capacity)
+        self._instructions = [decoder.decode(statement) for statement in statements]
+
+        self._registers = registers
+        self._memory_capacity = memory_capacity
+
+        memory_images = list(memory_images)
+        self._lanes = len(memory_images)
+
+        addresses = {
+            operand[1] for type, _, _, operand, _, error, _ in self._instructions
+            if type in (TokenType.LDR, TokenType.STR) and error is None
+        }
+        for image in memory_images:
+            addresses.update(image if isinstance(image, dict) else range(len(image)))
+
+        self._addresses = sorted(addresses)
+        self._columns = {address: column for column, address in enumerate(self._addresses)}
+
+        self._memory = numpy.zeros((self._lanes, len(self._addresses)), dtype=numpy.int64)
+        for lane, image in enumerate(memory_images):
+            self._load(self._memory[lane], image, 0, memory_capacity, "memory image", self._columns)
+
+        self._register = numpy.zeros((self._lanes, registers + 1), dtype=numpy.int64)
+        for lane, image in enumerate(register_images or []):
+            self._load(self._register[lane], image, 1, registers + 1, "register image")
+
+        self._comparison_register = numpy.zeros((self._lanes, len(CONDITIONS)), dtype=bool)
+
+        self._program_counter = numpy.zeros(self._lanes, dtype=numpy.int64)
+        self._steps = numpy.zeros(self._lanes, dtype=numpy.int64)
+        self._halted = numpy.zeros(self._lanes, dtype=bool)
+
+        self._errors = [[] for _ in range(self._lanes)]
+
+        self._coverage = coverage
+
+    def _load(self, lane, image, start, end, name, columns=None):
+        """
+        Copies :param image into :param lane
+
+        :param lane: row of a register or memory array (numpy.ndarray)
+        :param image: list of values starting at :param start, or dictionary in format {index: value}
+        :param start: first valid index (integer)
+        :param end: one past the last valid index (integer)
+        :param name: description of the image used in error messages (string)
+        :param columns: column of each index, in format {index: column}, None if indices are columns (dict)
+        :return: (None)
+        """
+
+        items = image.items() if isinstance(image, dict) else enumerate(image, start)
+
+        for index, value in items:
+            if not start <= index < end:
+                raise ValueError("{0} index {1} out of range".format(name, index))
+
+            lane[index if columns is None else columns[index]] = value
+
+    def run(self, max_steps=None):
+        """
+        Executes statements on every lane until all lanes finish or :param max_steps statements have been executed
+        per lane. May be called repeatedly to execute the program in slices.
+
+        :param max_steps: maximum number of statements to execute per lane, None for no limit (integer)
+        :return: state of each lane (list)
+        """
+
+        steps = 0
+
+        while max_steps is None or steps < max_steps:
+            active = numpy.nonzero(~self._finished())[0]
+            if not len(active):
+                break
+
+            program_counters = self._program_counter[active]
+            if program_counters.min() == program_counters.max():
+                self._execute(int(program_counters[0]), active)
+            else:
+                for program_counter in numpy.unique(program_counters):
+                    self._execute(int(program_counter), active[program_counters == program_counter])
+
+            steps += 1
+
+        return self.get_states()
+
+    def get_states(self):
+        """
+        Returns a snapshot of every lane
+
+        :return: (list)
+        """
+
+        finished = self._finished()
+
+        return [
+            State(
+                int(self._program_counter[lane]),
+                {register: int(self._register[lane, register]) for register in range(1, self._registers + 1)},
+                {condition: bool(self._comparison_register[lane, index]) for index, condition in enumerate(CONDITIONS)},
+                {
+                    self._addresses[column]: int(self._memory[lane, column])
+                    for column in numpy.nonzero(self._memory[lane])[0]
+                },
+                self._memory_capacity, int(self._steps[lane]), bool(self._halted[lane]), bool(finished[lane]),
+                list(self._errors[lane])
+            ) for lane in range(self._lanes)
+        ]
+
+    def get_errors(self):
+        """
+        Returns virtual machine errors for each lane
+
+        :return: (list)
+        """
+
+        return self._errors
+
+    def __len__(self):
+        """
+        Returns the number of lanes
+
+        :return: (integer)
+        """
+
+        return self._lanes
+
+    def _finished(self):
+        """
+        Returns a mask of lanes that can no longer execute statements
+
+        :return: (numpy.ndarray)
+        """
+
+        return self._halted | (self._program_counter >= len(self._instructions))
+
+    def _fail(self, lanes, error):
+        """
+        Halts :param lanes, recording :param error against each lane
+
+        :param lanes: lane indices (numpy.ndarray)
+        :param error: (Exception)
+        :return: (None)
+        """
+
+        for lane in lanes:
+            self._errors[lane].append(error)
+
+        self._halted[lanes] = True
+
+    def _advance(self, lanes):
+        """
+        Increments the program counter and step count of :param lanes
+
+        :param lanes: lane indices (numpy.ndarray)
+        :return: (None)
+        """
+
+        self._program_counter[lanes] += 1
+        self._steps[lanes] += 1
+
+    def _operand(self, operand, lanes):
+        """
+        Returns the value of <operand 2> for :param lanes
+
+        :param operand: in format (is register, value) (tuple)
+        :param lanes: lane indices (numpy.ndarray)
+        :return: (numpy.ndarray or integer)
+        """
+
+        is_register, value = operand
+        if is_register:
+            return self._register[lanes, value]
+
+        return value
+
+    def _execute(self, program_counter, lanes):
+        """
+        Executes the instruction at :param program_counter on :param lanes
+
+        :param program_counter: (integer)
+        :param lanes: lane indices (numpy.ndarray)
+        :return: (None)
+        """
+
+        type, register_d, register_n, operand, label, error, destination_error = self._instructions[program_counter]
+
+        if self._coverage is not None:
+            self._coverage.record_instruction(program_counter)
+
+        if error is not None:
+            self._fail(lanes, error)
+            return
+
+        if type == TokenType.IDENTIFIER:
+            pass
+        elif type == TokenType.LDR:
+            self._register[lanes, register_d] = self._memory[lanes, self._columns[operand[1]]]
+        elif type == TokenType.STR:
+            self._memory[lanes, self._columns[operand[1]]] = self._register[lanes, register_d]
+        elif type == TokenType.MOV:
+            self._register[lanes, register_d] = self._operand(operand, lanes)
+        elif type == TokenType.MVN:
+            self._register[lanes, register_d] = ~numpy.int64(self._operand(operand, lanes))
+        elif type == TokenType.CMP:
+            self._compare(register_d, operand, lanes)
+        elif type == TokenType.HALT:
+            self._halted[lanes] = True
+        elif label is not None:
+            lanes = self._branch(type, label, lanes)
+        else:
+            lanes = self._arithmetic(type, register_d, register_n, operand, destination_error, lanes)
+
+        self._advance(lanes)
+
+    def _compare(self, register_d, operand, lanes):
+        """
+        Stores the comparison of r_d and <operand 2> in the comparison register of :param lanes
+
+        :param register_d: (integer)
+        :param operand: in format (is register, value) (tuple)
+        :param lanes: lane indices (numpy.ndarray)
+        :return: (None)
+        """
+
+        left = self._register[lanes, register_d]
+        right = self._operand(operand, lanes)
+
+        self._comparison_register[lanes] = numpy.stack(
+            [left == right, left != right, left > right, left < right], axis=-1
+        )
+
+    def _branch(self, type, label, lanes):
+        """
+        Jumps to :param label on lanes whose comparison register meets the branch condition.
+        Lanes that take a branch to an undefined label are halted with an error.
+
+        :param type: (aqa_assembly_simulator.lexer.TokenType.TokenType)
+        :param label: (aqa_assembly_simulator.lexer.Token.Token)
+        :param lanes: lane indices (numpy.ndarray)
+        :return: lanes that executed the branch without error (numpy.ndarray)
+        """
+
+        if type == TokenType.B:
+            taken = numpy.ones(len(lanes), dtype=bool)
+        else:
+            taken = self._comparison_register[lanes, CONDITIONS.index(type.name[1:])]
+
+        if self._coverage is not None and not taken.all():
+            self._coverage.record_branch(int(self._program_counter[lanes[0]]), None, False)
+
+        if not taken.any():
+            return lanes
+
+        if label.get_lexeme() not in self._labels:
+            self._fail(lanes[taken], VirtualMachineError(label, "Invalid label identifier"))
+            return lanes[~taken]
+
+        if self._coverage is not None:
+            self._coverage.record_branch(int(self._program_counter[lanes[0]]), None, True)
+
+        self._program_counter[lanes[taken]] = self._labels[label.get_lexeme()] - 1
+        return lanes
+
+    def _arithmetic(self, type, register_d, register_n, operand, destination_error, lanes):
+        """
+        Stores the result of an arithmetic, bitwise or shift operation on r_n and <operand 2> in r_d of :param lanes.
+        Lanes that overflow or shift by a negative amount are halted with an error.
+        If r_d is out of range, lanes that shift by a negative amount are halted with that error and all other lanes
+        with :param destination_error.
+
+        :param type: (aqa_assembly_simulator.lexer.TokenType.TokenType)
+        :param register_d: (integer)
+        :param register_n: (integer)
+        :param operand: in format (is register, value) (tuple)
+        :param destination_error: error raised by an out of range r_d (Exception)
+        :param lanes: lane indices (numpy.ndarray)
+        :return: lanes that executed the operation without error (numpy.ndarray)
+        """
+
+        left = self._register[lanes, register_n]
+        right = numpy.broadcast_to(numpy.int64(self._operand(operand, lanes)), left.shape)
+        invalid = None
+
+        with numpy.errstate(over="ignore"):
+            if type == TokenType.ADD:
+                result = left + right
+                invalid = ((left ^ result) & (right ^ result)) < 0
+            elif type == TokenType.SUB:
+                result = left - right
+                invalid = ((left ^ right) & (left ^ result)) < 0
+            elif type == TokenType.AND:
+                result = left & right
+            elif type == TokenType.ORR:
+                result = left | right
+            elif type == TokenType.EOR:
+                result = left ^ right
+            elif type == TokenType.LSL:
+                shift = numpy.clip(right, 0, 63)
+                result = left << shift
+                invalid = (right < 0) | ((left != 0) & ((right > 63) | ((result >> shift) != left)))
+            else:
+                shift = numpy.clip(right, 0, 63)
+                result = left >> shift
+                invalid = right < 0
+
+        if destination_error is not None:
+            negative = right < 0 if type in (TokenType.LSL, TokenType.LSR) else numpy.zeros(len(lanes), dtype=bool)
+            self._fail(lanes[negative], ValueError("negative shift count"))
+            self._fail(lanes[~negative], destination_error)
+            return lanes[:0]
+
+        if invalid is not None and invalid.any():
+            for lane, count in zip(lanes[invalid], right[invalid]):
+                error = ValueError("negative shift count") if count < 0 else OverflowError(
+                    "integer overflow in batched virtual machine"
+                )
+                self._fail([lane], error)
+
+            result, lanes = result[~invalid], lanes[~invalid]
+
+        self._register[lanes, register_d] = result
+        return lanes
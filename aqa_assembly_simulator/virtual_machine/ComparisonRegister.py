@@ -1,5 +1,3 @@
-from ascii_table import Table
-
 from aqa_assembly_simulator.virtual_machine.Register import Register
 
 
@@ -40,6 +38,27 @@ class ComparisonRegister(Register):
         for key, value in register.items():
             self._register[self._mapping[key]] = int(value)
 
+    def restore(self, snapshot):
+        """
+        Sets the comparison register contents to :param snapshot
+
+        :param snapshot: in format {condition: value} (dict)
+        :return: (None)
+        """
+
+        self.set_register(snapshot)
+
+    def snapshot(self):
+        """
+        Returns a copy of the comparison register contents
+
+        :return: in format {condition: value} (dict)
+        """
+
+        return {
+            condition: self.__getitem__(condition) for condition in self._mapping
+        }
+
     def __repr__(self):
         """
         Returns string representation of the comparison register using an ascii_table.Table object
@@ -47,6 +66,8 @@ class ComparisonRegister(Register):
         :return: (string)
         """
 
+        from ascii_table import Table
+
         return str(Table([
             {
                 "Header": condition,
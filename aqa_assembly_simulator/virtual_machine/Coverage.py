@@ -0,0 +1,284 @@
+import json
+
+import aqa_assembly_simulator.parser.Statement as Statement
+from aqa_assembly_simulator.parser.Program import statement_lines
+
+FORMATS = ["text", "json", "lcov"]
+
+
+class Coverage:
+
+    def __init__(self, sources, lines, directions, file_location=None, executed=None, taken=None, not_taken=None):
+        """
+        Coverage constructor.
+        Records which statements were executed and which directions of each branch were taken, in bitsets indexed by
+        program counter. Coverage of the same program from many runs is merged by or-ing the bitsets.
+
+        :param sources: source code of each statement (list)
+        :param lines: source line of each statement (list)
+        :param directions: number of directions of each statement, 2 for conditional branches, 1 for branches and 0
+        for other statements (list)
+        :param file_location: path of the program, used in reports (string)
+        :param executed: bitset of executed statements (bytearray)
+        :param taken: bitset of branches that jumped to their label (bytearray)
+        :param not_taken: bitset of conditional branches that did not jump to their label (bytearray)
+        """
+
+        size = (len(sources) + 7) // 8
+
+        self._sources = sources
+        self._lines = lines
+        self._directions = directions
+        self._file_location = file_location
+        self._executed = bytearray(size) if executed is None else executed
+        self._taken = bytearray(size) if taken is None else taken
+        self._not_taken = bytearray(size) if not_taken is None else not_taken
+
+    @staticmethod
+    def from_statements(statements, file_location=None):
+        """
+        Returns empty coverage for :param statements
+
+        :param statements: list of statements produced by the parser (list)
+        :param file_location: path of the program, used in reports (string)
+        :return: (aqa_assembly_simulator.virtual_machine.Coverage.Coverage)
+        """
+
+        return Coverage(
+            [str(statement) for statement in statements], statement_lines(statements),
+            [
+                (1 if isinstance(statement, Statement.Branch) else 2) if isinstance(statement, Statement.BRANCHES)
+                else 0 for statement in statements
+            ],
+            file_location
+        )
+
+    @staticmethod
+    def from_json(text):
+        """
+        Returns the coverage stored in a JSON report.
+        If :param text is not a JSON coverage report -> ValueError raised.
+
+        :param text: (string)
+        :return: (aqa_assembly_simulator.virtual_machine.Coverage.Coverage)
+        """
+
+        data = json.loads(text)
+        if not isinstance(data, dict):
+            raise ValueError("invalid coverage report, not a JSON object")
+
+        try:
+            sources, lines, directions = data["program"], data["line table"], data["directions"]
+            bitsets = [bytearray.fromhex(data[name]) for name in ("executed", "taken", "not taken")]
+            file_location = data["file"]
+        except KeyError as error:
+            raise ValueError("invalid coverage report, missing {0}".format(error))
+        except TypeError:
+            raise ValueError("invalid coverage report, bitsets must be hexadecimal strings")
+
+        if not all(isinstance(column, list) for column in (sources, lines, directions)):
+            raise ValueError("invalid coverage report, program, line table and directions must be lists")
+
+        if len(lines) != len(sources) or len(directions) != len(sources):
+            raise ValueError("invalid coverage report, line table and directions must have an entry per statement")
+
+        if any(len(bitset) != (len(sources) + 7) // 8 for bitset in bitsets):
+            raise ValueError("invalid coverage report, bitsets do not match the number of statements")
+
+        return Coverage(sources, lines, directions, file_location, *bitsets)
+
+    def attach(self, virtual_machine):
+        """
+        Records coverage of :param virtual_machine using instruction and branch hooks
+
+        :param virtual_machine: (aqa_assembly_simulator.virtual_machine.VirtualMachine.VirtualMachine)
+        :return: (None)
+        """
+
+        virtual_machine.add_hook("instruction", self.record_instruction)
+        virtual_machine.add_hook("branch", self.record_branch)
+
+    def record_instruction(self, program_counter, statement=None):
+        """
+        Marks the statement at :param program_counter as executed
+
+        :param program_counter: (integer)
+        :param statement: (aqa_assembly_simulator.parser.Statement.Statement)
+        :return: (None)
+        """
+
+        self._executed[program_counter >> 3] |= 1 << (program_counter & 7)
+
+    def record_branch(self, source, destination, taken):
+        """
+        Marks the direction of the branch at :param source as taken
+
+        :param source: program counter of the branch (integer)
+        :param destination: program counter after the branch (integer)
+        :param taken: whether the branch jumped to its label (boolean)
+        :return: (None)
+        """
+
+        bitset = self._taken if taken else self._not_taken
+        bitset[source >> 3] |= 1 << (source & 7)
+
+    def merge(self, other):
+        """
+        Adds the coverage of :param other to this coverage.
+        If :param other is coverage of a different program -> ValueError raised.
+
+        :param other: (aqa_assembly_simulator.virtual_machine.Coverage.Coverage)
+        :return: (None)
+        """
+
+        if other._sources != self._sources:
+            raise ValueError("coverage is of a different program")
+
+        for bitset, other_bitset in (
+            (self._executed, other._executed), (self._taken, other._taken), (self._not_taken, other._not_taken)
+        ):
+            bitset[:] = (
+                int.from_bytes(bitset, "little") | int.from_bytes(other_bitset, "little")
+            ).to_bytes(len(bitset), "little")
+
+    def get_lines(self):
+        """
+        Returns whether each source line was executed. A line is executed if any of its statements were.
+
+        :return: in format {line: executed} (dict)
+        """
+
+        lines = {}
+        for pointer, line in enumerate(self._lines):
+            lines[line] = lines.get(line, False) or self._bit(self._executed, pointer)
+
+        return lines
+
+    def get_branches(self):
+        """
+        Returns the directions taken by each branch
+
+        :return: in format [(line, program counter, directions)], where directions is a list of whether the branch
+        was taken and, for conditional branches, not taken (list)
+        """
+
+        return [
+            (line, pointer, [self._bit(self._taken, pointer), self._bit(self._not_taken, pointer)][:directions])
+            for pointer, (line, directions) in enumerate(zip(self._lines, self._directions)) if directions
+        ]
+
+    def render(self, format="text"):
+        """
+        Returns a coverage report keyed by source line.
+        If :param format is not in FORMATS -> ValueError raised.
+
+        :param format: "text", "json" or "lcov" (string)
+        :return: (string)
+        """
+
+        if format not in FORMATS:
+            raise ValueError("unknown coverage format {0}".format(format))
+
+        return getattr(self, "_{0}".format(format))()
+
+    def _text(self):
+        """
+        Returns a line and branch summary followed by every statement, marked + if it was executed
+
+        :return: (string)
+        """
+
+        lines, branches = self.get_lines(), self.get_branches()
+        directions = {pointer: taken for _, pointer, taken in branches}
+
+        report = [
+            self._summary("Lines", sum(lines.values()), len(lines)),
+            self._summary("Branches", sum(sum(taken) for _, _, taken in branches), sum(map(len, directions.values()))),
+            ""
+        ]
+
+        for pointer, (line, source) in enumerate(zip(self._lines, self._sources)):
+            report.append("{0:>5} {1} {2}{3}".format(
+                line, "+" if self._bit(self._executed, pointer) else "-", source,
+                "  [{0}]".format(", ".join(
+                    "{0}: {1}".format(direction, "yes" if taken else "no")
+                    for direction, taken in zip(("taken", "not taken"), directions[pointer])
+                )) if pointer in directions else ""
+            ))
+
+        return "\n".join(report)
+
+    def _json(self):
+        """
+        Returns a JSON report. It also holds the bitsets, so it can be read with from_json and merged.
+
+        :return: (string)
+        """
+
+        lines, branches = self.get_lines(), self.get_branches()
+
+        return json.dumps({
+            "file": self._file_location,
+            "lines": {str(line): int(executed) for line, executed in sorted(lines.items())},
+            "branches": {
+                str(pointer): dict(zip(("line", "taken", "not taken"), [line] + [int(taken) for taken in directions]))
+                for line, pointer, directions in branches
+            },
+            "program": self._sources,
+            "line table": self._lines,
+            "directions": self._directions,
+            "executed": self._executed.hex(),
+            "taken": self._taken.hex(),
+            "not taken": self._not_taken.hex()
+        })
+
+    def _lcov(self):
+        """
+        Returns an LCOV tracefile record
+
+        :return: (string)
+        """
+
+        lines, branches = self.get_lines(), self.get_branches()
+
+        record = ["TN:", "SF:{0}".format(self._file_location or "")]
+
+        for line, pointer, directions in branches:
+            for number, taken in enumerate(directions):
+                record.append("BRDA:{0},{1},{2},{3}".format(
+                    line, pointer, number, int(taken) if self._bit(self._executed, pointer) else "-"
+                ))
+
+        record.append("BRF:{0}".format(sum(len(directions) for _, _, directions in branches)))
+        record.append("BRH:{0}".format(sum(sum(directions) for _, _, directions in branches)))
+
+        record.extend("DA:{0},{1}".format(line, int(executed)) for line, executed in sorted(lines.items()))
+
+        record.append("LF:{0}".format(len(lines)))
+        record.append("LH:{0}".format(sum(lines.values())))
+        record.append("end_of_record")
+
+        return "\n".join(record)
+
+    def _summary(self, name, hit, total):
+        """
+        Returns a summary line in format "<name>: <hit>/<total> (<percentage>%)"
+
+        :param name: (string)
+        :param hit: (integer)
+        :param total: (integer)
+        :return: (string)
+        """
+
+        return "{0}: {1}/{2} ({3:.1f}%)".format(name, hit, total, 100 * hit / total if total else 100)
+
+    def _bit(self, bitset, pointer):
+        """
+        Returns whether bit :param pointer of :param bitset is set
+
+        :param bitset: (bytearray)
+        :param pointer: (integer)
+        :return: (boolean)
+        """
+
+        return bool(bitset[pointer >> 3] >> (pointer & 7) & 1)
@@ -0,0 +1,152 @@
+ACCESSES = ["read", "write", "access"]
+STORAGE_HOOKS = ["memory_read", "memory_write", "register_write"]
+HOOKS = ["instruction", "branch"] + STORAGE_HOOKS
+
+
+class Hit:
+
+    def __init__(self, kind, location, line, program_counter, steps, access=None, value=None):
+        """
+        Hit constructor.
+        Describes a breakpoint or watchpoint that paused a virtual machine.
+
+        :param kind: "breakpoint" or "watchpoint" (string)
+        :param location: label identifier, line, register (e.g. "r1") or memory address that was set
+        (string or integer)
+        :param line: source line of the statement or token that triggered the hit (integer)
+        :param program_counter: index of the statement that triggered the hit (integer)
+        :param steps: number of statements executed when the hit was triggered (integer)
+        :param access: "read" or "write", for watchpoints (string)
+        :param value: value read or written, for watchpoints (integer)
+        """
+
+        self._kind = kind
+        self._location = location
+        self._line = line
+        self._program_counter = program_counter
+        self._steps = steps
+        self._access = access
+        self._value = value
+
+    def get_kind(self):
+        """
+        Returns "breakpoint" or "watchpoint"
+
+        :return: (string)
+        """
+
+        return self._kind
+
+    def get_location(self):
+        """
+        Returns the label identifier, line, register or memory address that was set
+
+        :return: (string or integer)
+        """
+
+        return self._location
+
+    def get_line(self):
+        """
+        Returns the source line that triggered the hit
+
+        :return: (integer)
+        """
+
+        return self._line
+
+    def get_program_counter(self):
+        """
+        Returns the index of the statement that triggered the hit
+
+        :return: (integer)
+        """
+
+        return self._program_counter
+
+    def get_steps(self):
+        """
+        Returns the number of statements executed when the hit was triggered
+
+        :return: (integer)
+        """
+
+        return self._steps
+
+    def get_access(self):
+        """
+        Returns "read" or "write" for watchpoints, None for breakpoints
+
+        :return: (string)
+        """
+
+        return self._access
+
+    def get_value(self):
+        """
+        Returns the value read or written for watchpoints, None for breakpoints
+
+        :return: (integer)
+        """
+
+        return self._value
+
+    def report(self):
+        """
+        Report method. Used to produce a string representation of the hit when it is printed.
+
+        :return: (string)
+        """
+
+        if self._kind == "breakpoint":
+            return "Breakpoint {0}: Line: {1}, Step: {2}.".format(self._location, self._line, self._steps)
+
+        return "Watchpoint {0}: Line: {1}, Step: {2}, {3}: {4}.".format(
+            self._location, self._line, self._steps, self._access.capitalize(), self._value
+        )
+
+    __repr__ = report
+
+
+class Watched:
+
+    def __init__(self, storage, kind, virtual_machine):
+        """
+        Watched constructor.
+        Wraps the registers or memory of a virtual machine while watchpoints or storage hooks are set, reporting every
+        read and write to the virtual machine. All other attributes are forwarded to the wrapped storage.
+
+        :param storage: (aqa_assembly_simulator.virtual_machine.Register.Register or
+        aqa_assembly_simulator.virtual_machine.Memory.Memory)
+        :param kind: "register" or "memory" (string)
+        :param virtual_machine: (aqa_assembly_simulator.virtual_machine.VirtualMachine.VirtualMachine)
+        """
+
+        self._storage = storage
+        self._kind = kind
+        self._virtual_machine = virtual_machine
+
+    def get_storage(self):
+        """
+        Returns the wrapped storage
+
+        :return: (aqa_assembly_simulator.virtual_machine.Register.Register or
+        aqa_assembly_simulator.virtual_machine.Memory.Memory)
+        """
+
+        return self._storage
+
+    def __getitem__(self, token):
+        value = self._storage[token]
+        self._virtual_machine._watch(self._kind, token, "read", value)
+        return value
+
+    def __setitem__(self, token, value):
+        self._storage[token] = value
+        self._virtual_machine._watch(self._kind, token, "write", int(value))
+
+    def __getattr__(self, name):
+        return getattr(self._storage, name)
+
+    def __repr__(self):
+        return repr(self._storage)
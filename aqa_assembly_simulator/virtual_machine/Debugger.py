@@ -0,0 +1,253 @@
+import cmd
+
+from aqa_assembly_simulator.virtual_machine.StateWriter import Selection, CONDITIONS
+from aqa_assembly_simulator.parser.Program import statement_lines
+
+
+class Debugger(cmd.Cmd):
+    """
+    Interactive debugger for a virtual machine.
+    Statements are executed with run, so execution between stops is at full speed unless breakpoints or watchpoints are
+    set. A checkpoint of the virtual machine is taken before every command that executes statements; back-stepping
+    restores the last checkpoint before the target step and replays from there.
+    """
+
+    intro = 'AQA Assembly Simulator debugger. Type "help" for a list of commands.'
+    prompt = "(debug) "
+
+    def __init__(self, virtual_machine, statements, stdin=None, stdout=None):
+        """
+        Debugger constructor.
+
+        :param virtual_machine: (aqa_assembly_simulator.virtual_machine.VirtualMachine.VirtualMachine)
+        :param statements: statements executed by :param virtual_machine (list)
+        :param stdin: stream commands are read from, sys.stdin if None (file)
+        :param stdout: stream output is written to, sys.stdout if None (file)
+        """
+
+        super().__init__(stdin=stdin, stdout=stdout)
+        self.use_rawinput = stdin is None
+
+        self._virtual_machine = virtual_machine
+        self._statements = statements
+        self._lines = statement_lines(statements)
+        self._checkpoints = [virtual_machine.get_state()]
+        self._breakpoints = []
+
+    def do_step(self, argument):
+        """step [n]: executes n statements (default 1), stopping early at breakpoints and watchpoints."""
+
+        count = self._count(argument)
+        if count is not None:
+            self._advance(count)
+
+    def do_continue(self, argument):
+        """continue [label]: executes until a breakpoint or watchpoint is hit, :param label is reached or the program
+        finishes."""
+
+        location = self._location(argument)
+
+        if not argument or location in self._breakpoints:
+            self._advance(None)
+            return
+
+        if self._add_breakpoint(argument):
+            try:
+                self._advance(None)
+            finally:
+                self._virtual_machine.remove_breakpoint(location)
+
+    def do_break(self, argument):
+        """break [label | line]: sets a breakpoint, or lists breakpoints if no location is given."""
+
+        if not argument:
+            self._print(*["Breakpoint {0}".format(location) for location in self._breakpoints] or ["No breakpoints."])
+        elif self._add_breakpoint(argument):
+            self._breakpoints.append(self._location(argument))
+
+    def do_watch(self, argument):
+        """watch <r<n> | address> [read | write | access]: pauses after a statement reads or writes a register or
+        memory unit (default write)."""
+
+        arguments = argument.split()
+        if not 1 <= len(arguments) <= 2:
+            self._print("Usage: watch <r<n> | address> [read | write | access]")
+            return
+
+        try:
+            self._virtual_machine.add_watchpoint(self._location(arguments[0]), *arguments[1:])
+        except ValueError as error:
+            self._print(error)
+
+    def do_delete(self, argument):
+        """delete [label | line]: removes a breakpoint, or every breakpoint and watchpoint if no location is given."""
+
+        if not argument:
+            self._virtual_machine.clear_breakpoints()
+            self._virtual_machine.clear_watchpoints()
+            self._breakpoints = []
+            return
+
+        location = self._location(argument)
+
+        try:
+            self._virtual_machine.remove_breakpoint(location)
+        except ValueError as error:
+            self._print(error)
+        else:
+            self._breakpoints.remove(location)
+
+    def do_print(self, argument):
+        """print [items]: prints registers, flags and memory, e.g. print r1-r3,flags,0-99 (default registers,flags).
+        Every memory unit in an address range is printed; print memory skips memory units that are 0."""
+
+        try:
+            selection = Selection.parse(argument or "registers,flags")
+        except ValueError as error:
+            self._print(error)
+            return
+
+        state = self._virtual_machine.get_state()
+
+        self._print(*["r{0}: {1}".format(register, value) for register, value in selection.registers(
+            state.get_registers()
+        )])
+
+        if selection.has_flags():
+            self._print(" ".join(
+                "{0}: {1}".format(condition, int(state.get_comparison_register()[condition]))
+                for condition in CONDITIONS
+            ))
+
+        self._print(*["[{0}]: {1}".format(address, value) for address, value in selection.memory(
+            state.get_memory(), state.get_memory_capacity()
+        )])
+
+    def do_back(self, argument):
+        """back [n]: undoes the last n statements (default 1)."""
+
+        count = self._count(argument)
+        if count is None:
+            return
+
+        target = max(self._virtual_machine.get_steps() - count, 0)
+
+        while len(self._checkpoints) > 1 and self._checkpoints[-1].get_steps() > target:
+            self._checkpoints.pop()
+
+        self._virtual_machine.load_state(self._checkpoints[-1])
+
+        while self._virtual_machine.get_steps() < target and not self._virtual_machine.is_finished():
+            self._virtual_machine.run(target - self._virtual_machine.get_steps())
+
+        self.do_where("")
+
+    def do_where(self, argument):
+        """where: prints the next statement and its line."""
+
+        virtual_machine = self._virtual_machine
+
+        if virtual_machine.is_finished():
+            self._print("Program finished after {0} steps.".format(virtual_machine.get_steps()))
+            self._print(*[
+                error.report() if hasattr(error, "report") else error for error in virtual_machine.get_errors()
+            ])
+            return
+
+        program_counter = virtual_machine.get_program_counter()
+        self._print("Line: {0}, Step: {1}, Program Counter: {2}: {3}".format(
+            self._lines[program_counter], virtual_machine.get_steps(), program_counter,
+            self._statements[program_counter]
+        ))
+
+    def do_quit(self, argument):
+        """quit: exits the debugger."""
+
+        return True
+
+    do_s = do_next = do_step
+    do_c = do_continue
+    do_b = do_break
+    do_p = do_print
+    do_EOF = do_q = do_quit
+
+    def _advance(self, count):
+        """
+        Executes :param count statements, or until the program finishes if None, stopping at breakpoints and
+        watchpoints. A breakpoint on the statement execution starts from is passed over. Execution can be interrupted
+        with Ctrl-C.
+
+        :param count: (integer)
+        :return: (None)
+        """
+
+        virtual_machine = self._virtual_machine
+
+        if virtual_machine.get_steps() != self._checkpoints[-1].get_steps():
+            self._checkpoints.append(virtual_machine.get_state())
+
+        start = virtual_machine.get_steps()
+
+        while not virtual_machine.is_finished():
+            executed = virtual_machine.get_steps() - start
+            if count is not None and executed >= count:
+                break
+
+            try:
+                virtual_machine.run(None if count is None else count - executed)
+            except KeyboardInterrupt:
+                self._print("Interrupted.")
+                break
+
+            if virtual_machine.get_hits() and virtual_machine.get_steps() != start:
+                self._print(*[hit.report() for hit in virtual_machine.get_hits()])
+                break
+
+        self.do_where("")
+
+    def _add_breakpoint(self, argument):
+        """
+        Sets a breakpoint on the label or line :param argument. Invalid locations are printed.
+
+        :param argument: (string)
+        :return: whether the breakpoint was set (boolean)
+        """
+
+        try:
+            self._virtual_machine.add_breakpoint(self._location(argument))
+        except ValueError as error:
+            self._print(error)
+            return False
+
+        return True
+
+    def _location(self, argument):
+        """
+        Returns :param argument as an integer if it is a line or address, otherwise as a label identifier or register
+
+        :param argument: (string)
+        :return: (string or integer)
+        """
+
+        return int(argument) if argument.isdigit() else argument
+
+    def _count(self, argument):
+        """
+        Returns the number of statements given by :param argument, 1 if it is empty. Invalid counts are printed.
+
+        :param argument: (string)
+        :return: (integer or None)
+        """
+
+        if not argument:
+            return 1
+
+        if not argument.isdigit():
+            self._print("Invalid count {0}".format(argument))
+            return None
+
+        return int(argument)
+
+    def _print(self, *lines):
+        for line in lines:
+            print(line, file=self.stdout)
@@ -0,0 +1,412 @@
+from aqa_assembly_simulator.helpers.Constants import TEST_BUDGET
+from aqa_assembly_simulator.virtual_machine.VirtualMachine import VirtualMachine
+from aqa_assembly_simulator.virtual_machine.StateWriter import Selection, CONDITIONS
+from aqa_assembly_simulator.virtual_machine.TestSpec import TestResult
+from aqa_assembly_simulator.parser.ProgramGenerator import ProgramGenerator
+from aqa_assembly_simulator.parser.Parser import Parser
+from aqa_assembly_simulator.lexer.Lexer import Lexer
+
+
+def reference_engine(statements, registers, memory_capacity, memory_image):
+    """
+    Engine factory for the reference visitor virtual machine
+
+    :param statements: list of statements produced by the parser (list)
+    :param registers: number of registers in the virtual machine (integer)
+    :param memory_capacity: number of addressable memory units in the virtual machine (integer)
+    :param memory_image: initial memory contents (list or dict)
+    :return: (aqa_assembly_simulator.virtual_machine.VirtualMachine.VirtualMachine)
+    """
+
+    virtual_machine = VirtualMachine(statements, registers, memory_capacity)
+    virtual_machine.load_memory(memory_image)
+
+    return virtual_machine
+
+
+def batched_engine(statements, registers, memory_capacity, memory_image):
+    """
+    Engine factory for a single lane of the batched virtual machine. Requires NumPy.
+
+    :param statements: list of statements produced by the parser (list)
+    :param registers: number of registers in the virtual machine (integer)
+    :param memory_capacity: number of addressable memory units in the virtual machine (integer)
+    :param memory_image: initial memory contents (list or dict)
+    :return: (aqa_assembly_simulator.virtual_machine.Differential.BatchedLane)
+    """
+
+    from aqa_assembly_simulator.virtual_machine.BatchedVirtualMachine import BatchedVirtualMachine
+
+    return BatchedLane(BatchedVirtualMachine(statements, registers, memory_capacity, [memory_image]))
+
+
+class BatchedLane:
+
+    def __init__(self, batched_virtual_machine):
+        """
+        Batched Lane constructor.
+        Adapts a single lane batched virtual machine to the run(max_steps) engine interface.
+
+        :param batched_virtual_machine: (aqa_assembly_simulator.virtual_machine.BatchedVirtualMachine.BatchedVirtualMachine)
+        """
+
+        self._batched_virtual_machine = batched_virtual_machine
+
+    def run(self, max_steps=None):
+        """
+        Executes statements on the lane
+
+        :param max_steps: maximum number of statements to execute, None for no limit (integer)
+        :return: (aqa_assembly_simulator.virtual_machine.State.State)
+        """
+
+        return self._batched_virtual_machine.run(max_steps)[0]
+
+
+class Divergence:
+
+    def __init__(self, step, location, reference, candidate, source=None, memory_image=None):
+        """
+        Divergence constructor.
+        Describes the first point at which a candidate engine disagrees with the reference engine.
+
+        :param step: number of statements executed by the reference engine when the divergence was found (integer)
+        :param location: what diverged e.g. "program counter", "register 2", "memory 14" (string)
+        :param reference: state of the reference engine (aqa_assembly_simulator.virtual_machine.State.State)
+        :param candidate: state of the candidate engine (aqa_assembly_simulator.virtual_machine.State.State)
+        :param source: source code of the program, if known (string)
+        :param memory_image: initial memory contents (list or dict)
+        """
+
+        self._step = step
+        self._location = location
+        self._reference = reference
+        self._candidate = candidate
+        self._source = source
+        self._memory_image = memory_image
+
+    def get_step(self):
+        """
+        Returns the step at which the engines diverged
+
+        :return: (integer)
+        """
+
+        return self._step
+
+    def get_location(self):
+        """
+        Returns what diverged
+
+        :return: (string)
+        """
+
+        return self._location
+
+    def get_reference(self):
+        """
+        Returns the state of the reference engine
+
+        :return: (aqa_assembly_simulator.virtual_machine.State.State)
+        """
+
+        return self._reference
+
+    def get_candidate(self):
+        """
+        Returns the state of the candidate engine
+
+        :return: (aqa_assembly_simulator.virtual_machine.State.State)
+        """
+
+        return self._candidate
+
+    def get_source(self):
+        """
+        Returns the source code of the program
+
+        :return: (string)
+        """
+
+        return self._source
+
+    def get_memory_image(self):
+        """
+        Returns the initial memory contents the program was run with
+
+        :return: (list or dict)
+        """
+
+        return self._memory_image
+
+    def report(self):
+        """
+        Report method. Used to produce a string representation of the divergence when it is printed.
+
+        :return: (string)
+        """
+
+        return "Step: {0}, Where: {1}, Reference: {2}, Candidate: {3}".format(
+            self._step, self._location, self._reference, self._candidate
+        )
+
+    __repr__ = report
+
+
+class DifferentialHarness:
+
+    def __init__(self, candidate, registers, memory_capacity, reference=reference_engine, checkpoint=1,
+                 max_steps=10000):
+        """
+        Differential Harness constructor.
+        Runs a candidate engine alongside the reference engine and compares program counter, registers, comparison
+        register, memory, errors and completion every :param checkpoint statements. When a divergence is found at a
+        checkpoint, the program is replayed one statement at a time to locate the first divergent step, so large
+        checkpoint intervals keep the cost of agreeing programs low without losing precision.
+
+        Engines are created by factories in format factory(statements, registers, memory_capacity, memory_image) and
+        must provide run(max_steps), returning a State.
+
+        :param candidate: candidate engine factory (callable)
+        :param registers: number of registers in the virtual machine (integer)
+        :param memory_capacity: number of addressable memory units in the virtual machine (integer)
+        :param reference: reference engine factory (callable)
+        :param checkpoint: number of statements executed between comparisons (integer)
+        :param max_steps: maximum number of statements executed per program (integer)
+        """
+
+        self._candidate = candidate
+        self._reference = reference
+        self._registers = registers
+        self._memory_capacity = memory_capacity
+        self._checkpoint = checkpoint
+        self._max_steps = max_steps
+
+    def compare(self, statements, memory_image=(), source=None):
+        """
+        Runs :param statements on both engines and returns the first divergence, if any.
+
+        :param statements: list of statements produced by the parser (list)
+        :param memory_image: initial memory contents (list or dict)
+        :param source: source code of the program, included in the divergence (string)
+        :return: (aqa_assembly_simulator.virtual_machine.Differential.Divergence or None)
+        """
+
+        divergence = self._lockstep(statements, memory_image, source, self._checkpoint)
+
+        if divergence is None or self._checkpoint == 1:
+            return divergence
+
+        return self._lockstep(statements, memory_image, source, 1)
+
+    def fuzz(self, programs, length=20, seed=None, memory_images=((),)):
+        """
+        Compares the engines on :param programs randomly generated programs.
+
+        :param programs: number of programs to generate (integer)
+        :param length: number of instructions per program (integer)
+        :param seed: random seed, None for a random seed
+        :param memory_images: initial memory contents each program is run with (list)
+        :return: first divergence found (aqa_assembly_simulator.virtual_machine.Differential.Divergence or None)
+        """
+
+        generator = ProgramGenerator(self._registers, self._memory_capacity, seed)
+
+        for _ in range(programs):
+            source = generator.generate(length)
+            statements = Parser(Lexer(source).scan_tokens()).parse()
+
+            for memory_image in memory_images:
+                divergence = self.compare(statements, memory_image, source)
+                if divergence is not None:
+                    return divergence
+
+        return None
+
+    def _lockstep(self, statements, memory_image, source, checkpoint):
+        """
+        Runs both engines in slices of :param checkpoint statements, comparing their states after each slice.
+
+        :param statements: list of statements produced by the parser (list)
+        :param memory_image: initial memory contents (list or dict)
+        :param source: source code of the program (string)
+        :param checkpoint: number of statements executed between comparisons (integer)
+        :return: (aqa_assembly_simulator.virtual_machine.Differential.Divergence or None)
+        """
+
+        reference = self._reference(statements, self._registers, self._memory_capacity, memory_image)
+        candidate = self._candidate(statements, self._registers, self._memory_capacity, memory_image)
+
+        steps = 0
+        while steps < self._max_steps:
+            reference_state = reference.run(min(checkpoint, self._max_steps - steps))
+            candidate_state = candidate.run(min(checkpoint, self._max_steps - steps))
+            steps += checkpoint
+
+            location = self._diverges(reference_state, candidate_state)
+            if location is not None:
+                return Divergence(
+                    reference_state.get_steps(), location, reference_state, candidate_state, source, memory_image
+                )
+
+            if reference_state.is_finished():
+                break
+
+        return None
+
+    def _diverges(self, reference, candidate):
+        """
+        Returns the first location at which :param reference and :param candidate differ
+
+        :param reference: (aqa_assembly_simulator.virtual_machine.State.State)
+        :param candidate: (aqa_assembly_simulator.virtual_machine.State.State)
+        :return: (string or None)
+        """
+
+        if list(map(repr, reference.get_errors())) != list(map(repr, candidate.get_errors())):
+            return "errors"
+
+        if reference.get_program_counter() != candidate.get_program_counter():
+            return "program counter"
+
+        for register, value in reference.get_registers().items():
+            if candidate.get_registers().get(register) != value:
+                return "register {0}".format(register)
+
+        if reference.get_comparison_register() != candidate.get_comparison_register():
+            return "comparison register"
+
+        for address in sorted(set(reference.get_memory()) | set(candidate.get_memory())):
+            if reference.get_memory_cell(address) != candidate.get_memory_cell(address):
+                return "memory {0}".format(address)
+
+        if reference.get_steps() != candidate.get_steps() or reference.is_finished() != candidate.is_finished():
+            return "steps"
+
+        return None
+
+
+class ProgramComparison:
+
+    def __init__(self, candidate, reference, registers, memory_capacity, selection=None, max_steps=TEST_BUDGET,
+                 engine=reference_engine):
+        """
+        Program Comparison constructor.
+        Checks a candidate program for equivalence with a reference program. Both programs are run on the same initial
+        memory contents and their observable outputs, the selected registers, comparison register and memory units,
+        are compared. The programs are decoded once and every input is run in this process.
+
+        :param candidate: statements of the candidate program (list)
+        :param reference: statements of the reference program (list)
+        :param registers: number of registers in the virtual machine (integer)
+        :param memory_capacity: number of addressable memory units in the virtual machine (integer)
+        :param selection: observable outputs, everything if None
+        (aqa_assembly_simulator.virtual_machine.StateWriter.Selection)
+        :param max_steps: maximum number of statements executed per program and input (integer)
+        :param engine: engine factory (callable)
+        """
+
+        self._candidate = candidate
+        self._reference = reference
+        self._registers = registers
+        self._memory_capacity = memory_capacity
+        self._selection = selection or Selection()
+        self._max_steps = max_steps
+        self._engine = engine
+
+    def compare(self, memory_image=(), name=None):
+        """
+        Runs both programs on :param memory_image and returns the first output at which the candidate differs from
+        the reference. Outputs are compared in order of register, condition and address, stopping at the first
+        difference. The candidate is not run if the reference does not finish or :param memory_image is invalid.
+
+        :param memory_image: initial memory contents (list or dict)
+        :param name: name of the input, used in the result (string)
+        :return: (aqa_assembly_simulator.virtual_machine.TestSpec.TestResult)
+        """
+
+        try:
+            reference = self._run(self._reference, memory_image)
+        except ValueError as error:
+            return TestResult(name, 0, "spec", None, str(error))
+
+        if not reference.is_finished():
+            return TestResult(name, 0, "error", None, "reference did not finish within {0} steps".format(
+                self._max_steps
+            ))
+
+        candidate = self._run(self._candidate, memory_image)
+        steps = candidate.get_steps()
+
+        if not candidate.is_finished():
+            return TestResult(name, steps, "budget", self._max_steps, None)
+
+        reference_error, candidate_error = self._error(reference), self._error(candidate)
+        if (reference_error is None) != (candidate_error is None):
+            return TestResult(name, steps, "error", reference_error, candidate_error or "no error, expected {0}".format(
+                reference_error
+            ))
+
+        for register, value in self._selection.registers(reference.get_registers()):
+            if candidate.get_registers().get(register) != value:
+                return TestResult(name, steps, "r{0}".format(register), value, candidate.get_registers().get(register))
+
+        if self._selection.has_flags():
+            for condition in CONDITIONS:
+                value = reference.get_comparison_register()[condition]
+                if candidate.get_comparison_register()[condition] != value:
+                    return TestResult(name, steps, condition, value, candidate.get_comparison_register()[condition])
+
+        reference_memory = dict(self._selection.memory(reference.get_memory(), sparse=True))
+        candidate_memory = dict(self._selection.memory(candidate.get_memory(), sparse=True))
+
+        for address in sorted(set(reference_memory) | set(candidate_memory)):
+            value = reference_memory.get(address, 0)
+            if candidate_memory.get(address, 0) != value:
+                return TestResult(name, steps, "[{0}]".format(address), value, candidate_memory.get(address, 0))
+
+        return TestResult(name, steps)
+
+    def run(self, memory_images, fail_fast=False):
+        """
+        Compares the programs on every memory image in :param memory_images
+
+        :param memory_images: initial memory contents for each input (list)
+        :param fail_fast: stop at the first input whose outputs differ (boolean)
+        :return: result of each input that was compared, in order (list)
+        """
+
+        results = []
+
+        for number, memory_image in enumerate(memory_images, 1):
+            results.append(self.compare(memory_image, "input {0}".format(number)))
+
+            if fail_fast and not results[-1].is_passed():
+                break
+
+        return results
+
+    def _run(self, statements, memory_image):
+        """
+        Runs :param statements on :param memory_image
+
+        :param statements: (list)
+        :param memory_image: initial memory contents (list or dict)
+        :return: (aqa_assembly_simulator.virtual_machine.State.State)
+        """
+
+        return self._engine(statements, self._registers, self._memory_capacity, memory_image).run(self._max_steps)
+
+    def _error(self, state):
+        """
+        Returns the report of the first error of :param state, None if it has no errors
+
+        :param state: (aqa_assembly_simulator.virtual_machine.State.State)
+        :return: (string)
+        """
+
+        if not state.get_errors():
+            return None
+
+        error = state.get_errors()[0]
+        return error.report() if hasattr(error, "report") else str(error)
@@ -0,0 +1,173 @@
+from aqa_assembly_simulator.virtual_machine.VirtualMachine import VirtualMachine
+import aqa_assembly_simulator.parser.Statement as Statement
+
+
+class IncrementalRunner:
+
+    def __init__(self, registers, memory_capacity, memory_image=(), checkpoint=1000):
+        """
+        Incremental Runner constructor.
+        Edit-and-continue runner. Every run records a checkpoint of the virtual machine every :param checkpoint
+        statements, and the step at which each statement was first executed. When an edited program is run, the
+        statements whose behaviour may have changed are found by comparing their string representations and the
+        statements their branches jump to with the previous program. Execution resumes from the last checkpoint before
+        the first execution of any changed statement, since everything executed before that point is unaffected.
+        A run that ended with an error is always resumed from a checkpoint, so the error refers to the tokens of the
+        edited program.
+
+        :param registers: number of registers in the virtual machine (integer)
+        :param memory_capacity: number of addressable memory units in the virtual machine (integer)
+        :param memory_image: initial memory contents (list or dict)
+        :param checkpoint: number of statements executed between checkpoints (integer)
+        """
+
+        self._registers = registers
+        self._memory_capacity = memory_capacity
+        self._memory_image = memory_image
+        self._checkpoint = checkpoint
+
+        self._keys = []
+        self._checkpoints = []
+        self._first_executions = {}
+        self._final = None
+        self._reused_steps = 0
+
+    def run(self, statements, max_steps=None):
+        """
+        Executes :param statements, reusing as much of the previous run as possible.
+        The resulting state is identical to executing :param statements on a new virtual machine.
+
+        :param statements: list of statements produced by the parser (list)
+        :param max_steps: maximum number of statements to execute from the start of the program, None for no limit
+        (integer)
+        :return: (aqa_assembly_simulator.virtual_machine.State.State)
+        """
+
+        keys = self._statement_keys(statements)
+        virtual_machine = VirtualMachine(statements, self._registers, self._memory_capacity)
+
+        resume = self._resume_step(keys)
+
+        if self._final is None:
+            virtual_machine.load_memory(self._memory_image)
+            self._checkpoints.append(virtual_machine.get_state())
+        elif resume is None and not self._final.get_errors() and (
+                max_steps is None or self._final.get_steps() <= max_steps):
+            virtual_machine.load_state(self._final)
+        else:
+            self._rewind(min(step for step in (resume, max_steps, self._final.get_steps()) if step is not None))
+            virtual_machine.load_state(self._checkpoints[-1])
+
+        self._reused_steps = virtual_machine.get_steps()
+        self._keys = keys
+        self._final = self._execute(virtual_machine, len(statements), max_steps)
+
+        return self._final
+
+    def get_reused_steps(self):
+        """
+        Returns the number of statements of the last run that were reused from the previous run instead of being
+        executed again
+
+        :return: (integer)
+        """
+
+        return self._reused_steps
+
+    def reset(self):
+        """
+        Discards the previous run, so the next run executes from the start of the program
+
+        :return: (None)
+        """
+
+        self._keys = []
+        self._checkpoints = []
+        self._first_executions = {}
+        self._final = None
+
+    def _execute(self, virtual_machine, length, max_steps):
+        """
+        Executes statements, recording checkpoints and first executions, until the program finishes or
+        :param max_steps statements have been executed.
+
+        :param virtual_machine: (aqa_assembly_simulator.virtual_machine.VirtualMachine.VirtualMachine)
+        :param length: number of statements in the program (integer)
+        :param max_steps: maximum number of statements to execute from the start of the program, None for no limit
+        (integer)
+        :return: (aqa_assembly_simulator.virtual_machine.State.State)
+        """
+
+        checkpoints = self._checkpoints
+        first_executions = self._first_executions
+
+        while not virtual_machine.is_finished() and (max_steps is None or virtual_machine.get_steps() < max_steps):
+            steps = virtual_machine.get_steps()
+
+            if steps % self._checkpoint == 0 and (not checkpoints or checkpoints[-1].get_steps() < steps):
+                checkpoints.append(virtual_machine.get_state())
+
+            first_executions.setdefault(virtual_machine.get_program_counter(), steps)
+
+            if not virtual_machine.step():
+                break
+
+        if not virtual_machine.is_halted() and virtual_machine.get_program_counter() >= length:
+            first_executions.setdefault(length, virtual_machine.get_steps())
+
+        return virtual_machine.get_state()
+
+    def _statement_keys(self, statements):
+        """
+        Returns the equality key of every statement: its string representation and, for branches, the index of the
+        statement it jumps to.
+
+        :param statements: list of statements produced by the parser (list)
+        :return: (list)
+        """
+
+        labels = {
+            statement.get_identifier().get_lexeme(): pointer
+            for pointer, statement in enumerate(statements)
+            if isinstance(statement, Statement.Label)
+        }
+
+        return [
+            (repr(statement), labels.get(statement.get_label().get_lexeme()))
+            if isinstance(statement, Statement.BRANCHES) else repr(statement)
+            for statement in statements
+        ]
+
+    def _resume_step(self, keys):
+        """
+        Returns the first step at which the previous run executed a statement that differs in :param keys.
+        The position one past the last statement counts as a statement, so running off the end of a program that has
+        since grown is also detected.
+
+        :param keys: equality keys of the new program (list)
+        :return: (integer or None)
+        """
+
+        steps = [
+            step for pointer, step in self._first_executions.items()
+            if keys[pointer:pointer + 1] != self._keys[pointer:pointer + 1]
+        ]
+
+        return min(steps) if steps else None
+
+    def _rewind(self, step):
+        """
+        Discards checkpoints and first executions recorded after :param step, leaving the last checkpoint at or
+        before :param step on top of the checkpoint stack.
+
+        :param step: (integer)
+        :return: (None)
+        """
+
+        while self._checkpoints[-1].get_steps() > step:
+            self._checkpoints.pop()
+
+        start = self._checkpoints[-1].get_steps()
+        self._first_executions = {
+            pointer: first for pointer, first in self._first_executions.items() if first < start
+        }
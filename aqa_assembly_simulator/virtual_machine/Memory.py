@@ -1,23 +1,33 @@
-from ascii_table import Table
+from array import array
+import sys
+import mmap
+import os
 
+from aqa_assembly_simulator.helpers.Exceptions import AssemblySimulatorMemoryImageException
+from aqa_assembly_simulator.helpers.Constants import MEMORY_PAGE_BITS, MEMORY_CELL_SIZE
 from aqa_assembly_simulator.error.VirtualMachineError import VirtualMachineError
 
+MEMORY_PAGE_SIZE = 1 << MEMORY_PAGE_BITS
+MEMORY_PAGE_MASK = MEMORY_PAGE_SIZE - 1
+
+VIEWS = ["sparse", "touched", "full"]
+HEADERS = ["Addresses", "Values"]
+
 
 class Memory:
 
     def __init__(self, capacity):
         """
         Memory constructor.
-        Constructs _memory using a list comprehension.
+        Memory is paged: pages of MEMORY_PAGE_SIZE cells are allocated and zero filled on the first write to one of
+        their cells, so constructing memory with a large capacity is cheap and unwritten cells cost nothing.
 
         :param capacity: number of addressable memory units (integer)
         """
 
         self._capacity = capacity
-
-        self._memory = [
-            0 for address in range(capacity)
-        ]
+        self._pages = {}
+        self._touched = None
 
     def __getitem__(self, address):
         """
@@ -28,10 +38,15 @@ class Memory:
         :return: (integer)
         """
 
-        if not 0 <= address.get_literal() < self._capacity:
+        index = address.get_literal()
+        if not 0 <= index < self._capacity:
             raise VirtualMachineError(address, "Address index out of range")
 
-        return self._memory[address.get_literal()]
+        if self._touched is not None:
+            self._touched.add(index)
+
+        page = self._pages.get(index >> MEMORY_PAGE_BITS)
+        return page[index & MEMORY_PAGE_MASK] if page else 0
 
     def __setitem__(self, address, value):
         """
@@ -43,25 +58,279 @@ class Memory:
         :return: (None)
         """
 
-        if not 0 <= address.get_literal() < self._capacity:
+        index = address.get_literal()
+        if not 0 <= index < self._capacity:
             raise VirtualMachineError(address, "Address index out of range")
 
-        self._memory[address.get_literal()] = int(value)
+        if self._touched is not None:
+            self._touched.add(index)
+
+        self._write(index, int(value))
+
+    def _write(self, index, value):
+        """
+        Stores :param value at :param index, allocating its page if required.
+
+        :param index: address index (0 <= a < n) (integer)
+        :param value: (integer)
+        :return: (None)
+        """
+
+        page = self._pages.get(index >> MEMORY_PAGE_BITS)
+        if page is None:
+            if not value:
+                return
+
+            page = self._pages[index >> MEMORY_PAGE_BITS] = [0] * MEMORY_PAGE_SIZE
+
+        page[index & MEMORY_PAGE_MASK] = value
+
+    def load(self, image):
+        """
+        Copies :param image into memory.
+        If an address in :param image is out of index range -> ValueError raised.
+
+        :param image: list of values starting at address 0, or dictionary in format {address: value}
+        :return: (None)
+        """
+
+        items = image.items() if isinstance(image, dict) else enumerate(image)
+
+        for address, value in items:
+            if not 0 <= address < self._capacity:
+                raise ValueError("memory image address {0} out of range".format(address))
+
+            self._write(address, int(value))
+
+    def restore(self, snapshot):
+        """
+        Sets the memory contents to :param snapshot, all other cells are cleared.
+
+        :param snapshot: in format {address: value} (dict)
+        :return: (None)
+        """
+
+        self._pages = {}
+        self.load(snapshot)
+
+    def load_file(self, file_location):
+        """
+        Sets the memory contents to the memory image stored at :param file_location; all other cells are cleared.
+        A memory image holds every cell from address 0 as a little endian signed 64 bit integer. The file is memory
+        mapped and read a page at a time, and pages that are entirely zero are not allocated.
+        If the file is not a whole number of cells or is larger than memory -> AssemblySimulatorMemoryImageException
+        raised.
+
+        :param file_location: absolute path for the memory image (string)
+        :return: (None)
+        """
+
+        page_size = MEMORY_PAGE_SIZE * MEMORY_CELL_SIZE
+
+        with open(file_location, "rb") as file:
+            size = os.fstat(file.fileno()).st_size
+
+            if size % MEMORY_CELL_SIZE or size // MEMORY_CELL_SIZE > self._capacity:
+                raise AssemblySimulatorMemoryImageException({
+                    "message": "memory image must hold at most {0} cells of {1} bytes".format(
+                        self._capacity, MEMORY_CELL_SIZE
+                    ),
+                    "file": file_location,
+                    "size": size
+                })
+
+            self._pages = {}
+            if not size:
+                return
+
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapping:
+                for offset in range(0, size, page_size):
+                    chunk = mapping[offset:offset + page_size]
+                    if not chunk.strip(b"\0"):
+                        continue
+
+                    page = array("q")
+                    page.frombytes(chunk)
+                    if sys.byteorder == "big":
+                        page.byteswap()
+
+                    self._pages[offset // page_size] = page.tolist() + [0] * (MEMORY_PAGE_SIZE - len(page))
+
+    def save_file(self, file_location):
+        """
+        Writes the memory contents to :param file_location as a memory image (see load_file). Only allocated pages
+        are written; the rest of the file is left as a hole, which most file systems store without using disk space.
+        If a cell does not fit in a signed 64 bit integer -> AssemblySimulatorMemoryImageException raised.
+
+        :param file_location: absolute path for the memory image (string)
+        :return: (None)
+        """
+
+        with open(file_location, "wb") as file:
+            file.truncate(self._capacity * MEMORY_CELL_SIZE)
+
+            for index in sorted(self._pages):
+                start = index << MEMORY_PAGE_BITS
+
+                try:
+                    page = array("q", self._pages[index][:self._capacity - start])
+                except OverflowError:
+                    raise AssemblySimulatorMemoryImageException({
+                        "message": "memory cell does not fit in a memory image",
+                        "address": start
+                    })
+
+                if sys.byteorder == "big":
+                    page.byteswap()
+
+                file.seek(start * MEMORY_CELL_SIZE)
+                file.write(page.tobytes())
+
+    def _read(self, index):
+        """
+        Returns the value stored at :param index
+
+        :param index: address index (0 <= a < n) (integer)
+        :return: (integer)
+        """
+
+        page = self._pages.get(index >> MEMORY_PAGE_BITS)
+        return page[index & MEMORY_PAGE_MASK] if page else 0
+
+    def get_capacity(self):
+        """
+        Returns the number of addressable memory units
+
+        :return: (integer)
+        """
+
+        return self._capacity
+
+    def snapshot(self):
+        """
+        Returns a sparse copy of the memory contents. Only non-zero cells are included.
+
+        :return: in format {address: value} (dict)
+        """
+
+        return {
+            (page << MEMORY_PAGE_BITS) + offset: value
+            for page in sorted(self._pages)
+            for offset, value in enumerate(self._pages[page]) if value
+        }
+
+    def track_touched(self):
+        """
+        Starts recording the addresses read or written by statements, for the touched memory view
+
+        :return: (None)
+        """
+
+        self._touched = set()
+
+    @staticmethod
+    def parse_view(view):
+        """
+        Parses a memory view: "sparse", "touched", "full" or an inclusive address window "<first>-<last>".
+        If :param view is not recognised -> ValueError raised.
+
+        :param view: (string)
+        :return: view name, or window in format (first, last) (string or tuple)
+        """
+
+        if view in VIEWS:
+            return view
+
+        bounds = view.split("-")
+        if len(bounds) != 2 or not all(bound.isdigit() for bound in bounds):
+            raise ValueError("invalid memory view {0}".format(view))
+
+        return int(bounds[0]), int(bounds[1])
+
+    def render(self, view="sparse"):
+        """
+        Returns a table of the memory contents in the same layout as an ascii_table.Table.
+        "sparse" lists every non-zero cell and collapses each run of zero cells into a single row. A window
+        "<first>-<last>" does the same for the addresses in the window. "touched" lists the cells read or written
+        by statements since track_touched was called. "full" lists every cell.
+
+        :param view: (string or tuple, see parse_view)
+        :return: (string)
+        """
+
+        view = Memory.parse_view(view) if isinstance(view, str) else view
+
+        if view == "full":
+            rows = [(str(address), str(self._read(address))) for address in range(self._capacity)]
+        elif view == "touched":
+            rows = [(str(address), str(self._read(address))) for address in sorted(self._touched or ())]
+        elif view == "sparse":
+            rows = self._window(0, self._capacity - 1)
+        else:
+            rows = self._window(view[0], min(view[1], self._capacity - 1))
+
+        widths = [
+            max([len(header)] + [len(row[column]) for row in rows]) for column, header in enumerate(HEADERS)
+        ]
+        border = " +{0}+".format("+".join("-" * (width + 2) for width in widths))
+
+        return "\n".join(
+            [border, " | {0} |".format(" | ".join(format(header, "^{0}".format(width)) for header, width in zip(
+                HEADERS, widths
+            ))), border] +
+            [" | {0} |".format(" | ".join(cell.ljust(width) for cell, width in zip(row, widths))) for row in rows] +
+            [border]
+        )
+
+    def _window(self, first, last):
+        """
+        Returns the table rows for the addresses :param first to :param last, collapsing runs of zero cells
+
+        :param first: (integer)
+        :param last: (integer)
+        :return: in format [(addresses, value)] (list)
+        """
+
+        rows = []
+        start = first
+
+        for page in sorted(self._pages):
+            base = page << MEMORY_PAGE_BITS
+            if base + MEMORY_PAGE_SIZE <= first or base > last:
+                continue
+
+            for offset, value in enumerate(self._pages[page]):
+                address = base + offset
+                if not value or not first <= address <= last:
+                    continue
+
+                if address > start:
+                    rows.append(self._zeros(start, address - 1))
+
+                rows.append((str(address), str(value)))
+                start = address + 1
+
+        if start <= last:
+            rows.append(self._zeros(start, last))
+
+        return rows
+
+    def _zeros(self, first, last):
+        """
+        Returns the table row for a run of zero cells
+
+        :param first: (integer)
+        :param last: (integer)
+        :return: in format (addresses, value) (tuple)
+        """
+
+        return str(first) if first == last else "{0}-{1}".format(first, last), "0"
 
     def __repr__(self):
         """
-        Returns string representation of the memory unit using an ascii_table.Table object
+        Returns string representation of the memory unit, with runs of zero cells collapsed
 
         :return: (string)
         """
 
-        return str(Table([
-            {
-                "Header": "Addresses",
-                "Contents": list(map(str, range(self._capacity)))
-            },
-            {
-                "Header": "Values",
-                "Contents": list(map(str, self._memory))
-            }
-        ]))
+        return self.render()
@@ -1,5 +1,3 @@
-from ascii_table import Table
-
 from aqa_assembly_simulator.error.VirtualMachineError import VirtualMachineError
 
 
@@ -47,6 +45,42 @@ class Register:
 
         self._register[register.get_literal()] = int(value)
 
+    def load(self, image):
+        """
+        Copies :param image into the registers.
+        If a register in :param image is out of index range -> ValueError raised.
+
+        :param image: in format {index: value} (dict)
+        :return: (None)
+        """
+
+        for register, value in image.items():
+            if not 1 <= register <= self._registers:
+                raise ValueError("register image index {0} out of range".format(register))
+
+            self._register[register] = int(value)
+
+    def snapshot(self):
+        """
+        Returns a copy of the register contents
+
+        :return: in format {index: value} (dict)
+        """
+
+        return dict(self._register)
+
+    def restore(self, snapshot):
+        """
+        Sets the register contents to :param snapshot
+
+        :param snapshot: in format {index: value} (dict)
+        :return: (None)
+        """
+
+        self._register = {
+            register: int(snapshot[register]) for register in range(1, self._registers + 1)
+        }
+
     def __repr__(self):
         """
         Returns string representation of the register using an ascii_table.Table object
@@ -54,6 +88,8 @@ class Register:
         :return: (string)
         """
 
+        from ascii_table import Table
+
         return str(Table([
             {
                 "Header": str(register),
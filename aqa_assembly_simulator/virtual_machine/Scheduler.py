@@ -0,0 +1,103 @@
+import asyncio
+from collections import deque
+
+
+class Scheduler:
+
+    def __init__(self, slice_size=1000):
+        """
+        Scheduler constructor.
+        Cooperatively time-slices virtual machines on a single asyncio event loop. Virtual machines are run in
+        round-robin order, each executing at most :param slice_size statements per turn before control is yielded
+        back to the event loop, so short programs are never starved by long ones.
+
+        :param slice_size: number of statements a virtual machine executes per turn (integer)
+        """
+
+        self._slice_size = slice_size
+        self._queue = deque()
+        self._task = None
+
+    def submit(self, virtual_machine, budget=None):
+        """
+        Schedules :param virtual_machine for execution. Must be called from within a running event loop.
+        The returned future resolves to the final state of the virtual machine. If :param budget statements have been
+        executed before the program finishes, the virtual machine is descheduled and the future resolves to its
+        unfinished state (State.is_finished() is False). Cancelling the future deschedules the virtual machine.
+
+        :param virtual_machine: (aqa_assembly_simulator.virtual_machine.VirtualMachine.VirtualMachine)
+        :param budget: maximum number of statements to execute, None for no limit (integer)
+        :return: (asyncio.Future)
+        """
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+
+        self._queue.append((virtual_machine, budget, virtual_machine.get_steps(), future))
+
+        if self._task is None or self._task.done():
+            self._task = loop.create_task(self._drive())
+
+        return future
+
+    async def execute(self, virtual_machine, budget=None):
+        """
+        Schedules :param virtual_machine and waits for it to finish or exhaust its budget.
+
+        :param virtual_machine: (aqa_assembly_simulator.virtual_machine.VirtualMachine.VirtualMachine)
+        :param budget: maximum number of statements to execute, None for no limit (integer)
+        :return: (aqa_assembly_simulator.virtual_machine.State.State)
+        """
+
+        return await self.submit(virtual_machine, budget)
+
+    def cancel(self):
+        """
+        Deschedules all pending virtual machines, cancelling their futures.
+
+        :return: (None)
+        """
+
+        while self._queue:
+            self._queue.popleft()[-1].cancel()
+
+    def __len__(self):
+        """
+        Returns the number of virtual machines waiting to be executed
+
+        :return: (integer)
+        """
+
+        return len(self._queue)
+
+    async def _drive(self):
+        """
+        Round-robin loop. Runs one slice of the virtual machine at the head of the queue, then either resolves its
+        future or re-queues it, and yields to the event loop. Exits once the queue is empty.
+        Slices are run with advance, so the state is only copied once, when the future is resolved.
+
+        :return: (None)
+        """
+
+        while self._queue:
+            virtual_machine, budget, start, future = self._queue.popleft()
+
+            if future.done():
+                continue
+
+            slice_size = self._slice_size
+            if budget is not None:
+                slice_size = min(slice_size, start + budget - virtual_machine.get_steps())
+
+            try:
+                virtual_machine.advance(slice_size)
+            except Exception as error:
+                future.set_exception(error)
+                continue
+
+            if virtual_machine.is_finished() or (budget is not None and virtual_machine.get_steps() - start >= budget):
+                future.set_result(virtual_machine.get_state())
+            else:
+                self._queue.append((virtual_machine, budget, start, future))
+
+            await asyncio.sleep(0)
@@ -0,0 +1,161 @@
+class State:
+
+    def __init__(self, program_counter, registers, comparison_register, memory, memory_capacity, steps, halted,
+                 finished, errors):
+        """
+        State constructor.
+        Lightweight, read-only snapshot of a virtual machine. Memory is stored sparsely, only non-zero cells are
+        kept, so a snapshot is cheap to take after every statement.
+
+        :param program_counter: index of the next statement to be executed (integer)
+        :param registers: register contents, in format {index: value} (dict)
+        :param comparison_register: comparison register contents, in format {condition: value} (dict)
+        :param memory: non-zero memory contents, in format {address: value} (dict)
+        :param memory_capacity: number of addressable memory units (integer)
+        :param steps: number of statements executed so far (integer)
+        :param halted: indicates whether a HALT statement has been executed (boolean)
+        :param finished: indicates whether the virtual machine can no longer execute statements (boolean)
+        :param errors: errors raised during execution (list)
+        """
+
+        self._program_counter = program_counter
+        self._registers = registers
+        self._comparison_register = comparison_register
+        self._memory = memory
+        self._memory_capacity = memory_capacity
+        self._steps = steps
+        self._halted = halted
+        self._finished = finished
+        self._errors = errors
+
+    def get_program_counter(self):
+        """
+        Returns the program counter
+
+        :return: (integer)
+        """
+
+        return self._program_counter
+
+    def get_registers(self):
+        """
+        Returns register contents
+
+        :return: (dict)
+        """
+
+        return self._registers
+
+    def get_register(self, register):
+        """
+        Returns the value stored in register :param register
+
+        :param register: register index (1 <= r <= n) (integer)
+        :return: (integer)
+        """
+
+        return self._registers[register]
+
+    def get_comparison_register(self):
+        """
+        Returns comparison register contents
+
+        :return: (dict)
+        """
+
+        return self._comparison_register
+
+    def get_memory(self):
+        """
+        Returns non-zero memory contents
+
+        :return: (dict)
+        """
+
+        return self._memory
+
+    def get_memory_cell(self, address):
+        """
+        Returns the value stored at memory address :param address
+
+        :param address: address index (0 <= a < n) (integer)
+        :return: (integer)
+        """
+
+        return self._memory.get(address, 0)
+
+    def get_memory_capacity(self):
+        """
+        Returns the number of addressable memory units
+
+        :return: (integer)
+        """
+
+        return self._memory_capacity
+
+    def get_steps(self):
+        """
+        Returns the number of statements executed
+
+        :return: (integer)
+        """
+
+        return self._steps
+
+    def is_halted(self):
+        """
+        Returns whether a HALT statement has been executed
+
+        :return: (boolean)
+        """
+
+        return self._halted
+
+    def is_finished(self):
+        """
+        Returns whether the virtual machine has finished executing, either by halting, running past the last statement
+        or raising an error.
+
+        :return: (boolean)
+        """
+
+        return self._finished
+
+    def get_errors(self):
+        """
+        Returns errors raised during execution
+
+        :return: (list)
+        """
+
+        return self._errors
+
+    def __eq__(self, other):
+        """
+        Compares the observable machine state (program counter, registers, comparison register and memory) of two
+        states.
+
+        :param other: (aqa_assembly_simulator.virtual_machine.State.State)
+        :return: (boolean)
+        """
+
+        if not isinstance(other, State):
+            return NotImplemented
+
+        return (
+            self._program_counter == other._program_counter and
+            self._registers == other._registers and
+            self._comparison_register == other._comparison_register and
+            self._memory == other._memory
+        )
+
+    def __repr__(self):
+        """
+        Returns the string representation of the state (Debug)
+
+        :return: (string)
+        """
+
+        return "(Program Counter: {0}, Registers: {1}, Comparison Register: {2}, Memory: {3}, Steps: {4})".format(
+            self._program_counter, self._registers, self._comparison_register, self._memory, self._steps
+        )
@@ -0,0 +1,246 @@
+import json
+import sys
+
+FORMATS = ["json", "csv", "none"]
+CONDITIONS = ["EQ", "NE", "GT", "LT"]
+
+
+class Selection:
+
+    def __init__(self, registers=None, flags=True, memory=None):
+        """
+        Selection constructor.
+        The parts of a state that are written by a StateWriter.
+
+        :param registers: inclusive (first, last) register ranges, None for every register (list)
+        :param flags: indicates whether the comparison register is written (boolean)
+        :param memory: inclusive (first, last) address ranges, None for every address (list)
+        """
+
+        self._registers = registers
+        self._flags = flags
+        self._memory = memory
+
+    @staticmethod
+    def parse(text):
+        """
+        Parses a comma separated selection, e.g. "r1-r3,flags,0-99,256".
+        Items are "registers", "flags", "memory", a register "r<n>", a register range "r<n>-r<m>", an address "<a>" or
+        an address range "<a>-<b>". Parts of the state that no item refers to are not selected.
+        If an item is not recognised -> ValueError raised.
+
+        :param text: (string)
+        :return: (aqa_assembly_simulator.virtual_machine.StateWriter.Selection)
+        """
+
+        registers, flags, memory = [], False, []
+
+        for item in filter(None, (item.strip() for item in text.split(","))):
+            if item == "registers":
+                registers = None
+            elif item == "memory":
+                memory = None
+            elif item == "flags":
+                flags = True
+            elif item.startswith("r"):
+                bounds = Selection._range(item, "r")
+                if registers is not None:
+                    registers.append(bounds)
+            else:
+                bounds = Selection._range(item, "")
+                if memory is not None:
+                    memory.append(bounds)
+
+        return Selection(registers, flags, memory)
+
+    @staticmethod
+    def _range(item, prefix):
+        """
+        Parses "<prefix><n>" or "<prefix><n>-<prefix><m>" into an inclusive range
+
+        :param item: (string)
+        :param prefix: (string)
+        :return: in format (first, last) (tuple)
+        """
+
+        bounds = item.split("-")
+        if len(bounds) > 2 or not all(bound.startswith(prefix) and bound[len(prefix):].isdigit() for bound in bounds):
+            raise ValueError("invalid selection item {0}".format(item))
+
+        return int(bounds[0][len(prefix):]), int(bounds[-1][len(prefix):])
+
+    def registers(self, registers):
+        """
+        Returns the selected items of :param registers
+
+        :param registers: in format {index: value} (dict)
+        :return: (list)
+        """
+
+        return self._filter(registers, self._registers)
+
+    def memory(self, memory, memory_capacity=None, sparse=False):
+        """
+        Returns the selected items of :param memory, sorted by address.
+        Every address in a selected address range is returned, 0 if it is not in :param memory, so a fixed range always
+        gives the same addresses. The "memory" item selects every address, so only the addresses in :param memory are
+        returned.
+
+        :param memory: in format {address: value} (dict)
+        :param memory_capacity: number of addressable memory units, addresses at or above it are never returned
+        (integer)
+        :param sparse: only return the addresses in :param memory (boolean)
+        :return: (list)
+        """
+
+        if self._memory is None or sparse:
+            return self._filter(memory, self._memory)
+
+        items, end = [], 0
+        for first, last in sorted(self._memory):
+            if memory_capacity is not None:
+                last = min(last, memory_capacity - 1)
+
+            items.extend((address, memory.get(address, 0)) for address in range(max(first, end), last + 1))
+            end = max(end, last + 1)
+
+        return items
+
+    def has_flags(self):
+        """
+        Returns whether the comparison register is selected
+
+        :return: (boolean)
+        """
+
+        return self._flags
+
+    def _filter(self, items, ranges):
+        """
+        Returns the items of :param items whose keys are in :param ranges, sorted by key
+
+        :param items: (dict)
+        :param ranges: inclusive (first, last) ranges, None for every key (list)
+        :return: (list)
+        """
+
+        if ranges is None:
+            return sorted(items.items())
+
+        return [
+            (key, value) for key, value in sorted(items.items())
+            if any(first <= key <= last for first, last in ranges)
+        ]
+
+
+class StateWriter:
+
+    def __init__(self, format, selection=None, stream=None):
+        """
+        State Writer constructor.
+        Writes the final state of a virtual machine in a machine readable format, one item at a time, so large memories
+        are never built into a single string. Memory is written sparsely, only non-zero cells are included, unless address
+        ranges are selected, in which case every cell in the ranges is included.
+
+        :param format: "json", "csv" or "none" (string)
+        :param selection: parts of the state to write, everything if None
+        (aqa_assembly_simulator.virtual_machine.StateWriter.Selection)
+        :param stream: text stream the state is written to, sys.stdout if None (file)
+        """
+
+        if format not in FORMATS:
+            raise ValueError("unknown output format {0}".format(format))
+
+        self._format = format
+        self._selection = selection or Selection()
+        self._stream = stream or sys.stdout
+
+    def write(self, state):
+        """
+        Writes :param state
+
+        :param state: (aqa_assembly_simulator.virtual_machine.State.State)
+        :return: (None)
+        """
+
+        if self._format == "json":
+            self._json(state)
+        elif self._format == "csv":
+            self._csv(state)
+
+    def _json(self, state):
+        """
+        Writes :param state as a JSON object
+
+        :param state: (aqa_assembly_simulator.virtual_machine.State.State)
+        :return: (None)
+        """
+
+        write = self._stream.write
+
+        write('{{"program counter": {0}, "steps": {1}, "halted": {2}, "errors": {3}'.format(
+            state.get_program_counter(), state.get_steps(), json.dumps(state.is_halted()),
+            json.dumps([self._report(error) for error in state.get_errors()])
+        ))
+
+        self._json_items("registers", self._selection.registers(state.get_registers()))
+
+        if self._selection.has_flags():
+            self._json_items("comparison register", [
+                (condition, int(state.get_comparison_register()[condition])) for condition in CONDITIONS
+            ])
+
+        self._json_items("memory", self._selection.memory(state.get_memory(), state.get_memory_capacity()))
+
+        write("}\n")
+
+    def _json_items(self, name, items):
+        """
+        Writes a JSON object member :param name holding :param items
+
+        :param name: (string)
+        :param items: in format [(key, value)] (list)
+        :return: (None)
+        """
+
+        write = self._stream.write
+
+        write(', "{0}": {{'.format(name))
+        for index, (key, value) in enumerate(items):
+            write('{0}"{1}": {2}'.format(", " if index else "", key, value))
+        write("}")
+
+    def _csv(self, state):
+        """
+        Writes :param state as CSV rows in format section,location,value
+
+        :param state: (aqa_assembly_simulator.virtual_machine.State.State)
+        :return: (None)
+        """
+
+        write = self._stream.write
+
+        write("section,location,value\n")
+        write("program counter,,{0}\n".format(state.get_program_counter()))
+        write("steps,,{0}\n".format(state.get_steps()))
+        write("halted,,{0}\n".format(int(state.is_halted())))
+
+        for register, value in self._selection.registers(state.get_registers()):
+            write("register,{0},{1}\n".format(register, value))
+
+        if self._selection.has_flags():
+            for condition in CONDITIONS:
+                write("flag,{0},{1}\n".format(condition, int(state.get_comparison_register()[condition])))
+
+        for address, value in self._selection.memory(state.get_memory(), state.get_memory_capacity()):
+            write("memory,{0},{1}\n".format(address, value))
+
+    def _report(self, error):
+        """
+        Returns the report of :param error
+
+        :param error: (Exception)
+        :return: (string)
+        """
+
+        return error.report() if hasattr(error, "report") else str(error)
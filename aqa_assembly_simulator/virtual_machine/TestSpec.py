@@ -0,0 +1,405 @@
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from aqa_assembly_simulator.helpers.Constants import TEST_BUDGET
+from aqa_assembly_simulator.virtual_machine.VirtualMachine import VirtualMachine
+from aqa_assembly_simulator.virtual_machine.StateWriter import CONDITIONS
+
+_program = None
+
+
+def _initialise(statements, registers, memory_capacity):
+    """
+    Worker initialiser. Stores the program, so it is sent to each worker once rather than with every test case.
+
+    :param statements: list of statements produced by the parser (list)
+    :param registers: number of registers in the virtual machine (integer)
+    :param memory_capacity: number of addressable memory units in the virtual machine (integer)
+    :return: (None)
+    """
+
+    global _program
+    _program = statements, registers, memory_capacity
+
+
+def _run(case):
+    """
+    Runs :param case on the program stored by _initialise
+
+    :param case: (aqa_assembly_simulator.virtual_machine.TestSpec.TestCase)
+    :return: (aqa_assembly_simulator.virtual_machine.TestSpec.TestResult)
+    """
+
+    return case.run(*_program)
+
+
+class TestResult:
+
+    def __init__(self, name, steps, location=None, expected=None, actual=None):
+        """
+        Test Result constructor.
+        Outcome of a test case. A failed test case records the first location whose final value did not match.
+
+        :param name: name of the test case (string)
+        :param steps: number of statements executed (integer)
+        :param location: first mismatching location, e.g. "r1", "EQ", "[3]", "halted", "budget" or "error", None if
+        the test case passed (string)
+        :param expected: expected value at :param location
+        :param actual: final value at :param location
+        """
+
+        self._name = name
+        self._steps = steps
+        self._location = location
+        self._expected = expected
+        self._actual = actual
+
+    def get_name(self):
+        """
+        Returns the name of the test case
+
+        :return: (string)
+        """
+
+        return self._name
+
+    def get_steps(self):
+        """
+        Returns the number of statements executed
+
+        :return: (integer)
+        """
+
+        return self._steps
+
+    def get_location(self):
+        """
+        Returns the first mismatching location, None if the test case passed
+
+        :return: (string)
+        """
+
+        return self._location
+
+    def get_expected(self):
+        """
+        Returns the expected value at the first mismatching location
+
+        :return: (integer, boolean or string)
+        """
+
+        return self._expected
+
+    def get_actual(self):
+        """
+        Returns the final value at the first mismatching location
+
+        :return: (integer, boolean or string)
+        """
+
+        return self._actual
+
+    def is_passed(self):
+        """
+        Returns whether the test case passed
+
+        :return: (boolean)
+        """
+
+        return self._location is None
+
+    def report(self):
+        """
+        Report method. Used to produce a string representation of the result when it is printed.
+
+        :return: (string)
+        """
+
+        if self.is_passed():
+            return "PASS {0} ({1} steps)".format(self._name, self._steps)
+
+        if self._location == "budget":
+            return "FAIL {0}: budget of {1} steps exhausted".format(self._name, self._expected)
+
+        if self._location in ("error", "spec"):
+            return "FAIL {0}: {1}".format(self._name, self._actual)
+
+        return "FAIL {0}: {1} expected {2}, got {3} ({4} steps)".format(
+            self._name, self._location, self._expected, self._actual, self._steps
+        )
+
+    __repr__ = report
+
+
+class TestCase:
+
+    def __init__(self, name, registers, memory, budget, expected):
+        """
+        Test Case constructor.
+
+        :param name: (string)
+        :param registers: initial register contents, in format {index: value} (dict)
+        :param memory: initial memory contents, a list of values starting at address 0 or a dictionary in format
+        {address: value}
+        :param budget: maximum number of statements to execute (integer)
+        :param expected: expected final state, in format {"registers": {index: value}, "flags": {condition: value},
+        "memory": {address: value}, "halted": value}, where every key is optional (dict)
+        """
+
+        self._name = name
+        self._registers = registers
+        self._memory = memory
+        self._budget = budget
+        self._expected = expected
+
+    def get_name(self):
+        """
+        Returns the name of the test case
+
+        :return: (string)
+        """
+
+        return self._name
+
+    def run(self, statements, registers, memory_capacity):
+        """
+        Runs the test case on :param statements.
+        Final registers, flags and memory are compared in order of index, condition and address.
+
+        :param statements: list of statements produced by the parser (list)
+        :param registers: number of registers in the virtual machine (integer)
+        :param memory_capacity: number of addressable memory units in the virtual machine (integer)
+        :return: (aqa_assembly_simulator.virtual_machine.TestSpec.TestResult)
+        """
+
+        virtual_machine = VirtualMachine(statements, registers, memory_capacity)
+
+        try:
+            virtual_machine.load_registers(self._registers)
+            virtual_machine.load_memory(self._memory)
+        except ValueError as error:
+            return TestResult(self._name, 0, "spec", None, str(error))
+
+        state = virtual_machine.run(self._budget)
+        steps = state.get_steps()
+
+        if not state.is_finished():
+            return TestResult(self._name, steps, "budget", self._budget, None)
+
+        if state.get_errors():
+            error = state.get_errors()[0]
+            report = error.report() if hasattr(error, "report") else str(error)
+            return TestResult(self._name, steps, "error", None, report)
+
+        comparisons = [
+            ("r{0}".format(register), value, state.get_registers().get(register))
+            for register, value in sorted(self._expected.get("registers", {}).items())
+        ] + [
+            (condition, self._expected["flags"][condition], state.get_comparison_register()[condition])
+            for condition in CONDITIONS if condition in self._expected.get("flags", {})
+        ] + [
+            ("[{0}]".format(address), value, state.get_memory().get(address, 0))
+            for address, value in sorted(self._expected.get("memory", {}).items())
+        ]
+
+        if "halted" in self._expected:
+            comparisons.append(("halted", self._expected["halted"], state.is_halted()))
+
+        for location, expected, actual in comparisons:
+            if expected != actual:
+                return TestResult(self._name, steps, location, expected, actual)
+
+        return TestResult(self._name, steps)
+
+
+class TestSpec:
+
+    def __init__(self, cases, registers=None, memory_capacity=None):
+        """
+        Test Spec constructor.
+        A list of test cases for a program, read from a JSON test spec.
+
+        :param cases: (list)
+        :param registers: number of registers the test cases are written for, None to use the virtual machine config
+        (integer)
+        :param memory_capacity: number of addressable memory units the test cases are written for, None to use the
+        virtual machine config (integer)
+        """
+
+        self._cases = cases
+        self._registers = registers
+        self._memory_capacity = memory_capacity
+
+    @staticmethod
+    def parse(text):
+        """
+        Parses a JSON test spec in format
+        {"registers": n, "memory": n, "budget": n, "cases": [{"name": name, "registers": {index: value},
+        "memory": [value] or {address: value}, "budget": n, "expected": {"registers": {index: value},
+        "flags": {condition: boolean}, "memory": {address: value}, "halted": boolean}}]},
+        where every key except "cases" is optional. A case budget defaults to the spec budget, and the spec budget to
+        TEST_BUDGET statements.
+        If :param text is not a valid test spec -> ValueError raised.
+
+        :param text: (string)
+        :return: (aqa_assembly_simulator.virtual_machine.TestSpec.TestSpec)
+        """
+
+        spec = json.loads(text)
+        if not isinstance(spec, dict) or not isinstance(spec.get("cases"), list):
+            raise ValueError("test spec must be an object with a list of cases")
+
+        budget = TestSpec._integer(spec.get("budget", TEST_BUDGET), "budget")
+        cases = []
+
+        for number, case in enumerate(spec["cases"], 1):
+            if not isinstance(case, dict):
+                raise ValueError("case {0} must be an object".format(number))
+
+            name = str(case.get("name", "case {0}".format(number)))
+            expected = case.get("expected", {})
+            if not isinstance(expected, dict):
+                raise ValueError("{0}: expected must be an object".format(name))
+
+            flags = expected.get("flags", {})
+            if not isinstance(flags, dict) or any(condition not in CONDITIONS for condition in flags):
+                raise ValueError("{0}: flags must be an object with keys {1}".format(name, ", ".join(CONDITIONS)))
+
+            for condition, value in flags.items():
+                TestSpec._boolean(value, "{0}: flags {1}".format(name, condition))
+
+            if "halted" in expected:
+                TestSpec._boolean(expected["halted"], "{0}: halted".format(name))
+
+            memory = case.get("memory", [])
+            cases.append(TestCase(
+                name,
+                TestSpec._image(case.get("registers", {}), "{0}: registers".format(name)),
+                [TestSpec._integer(value, "{0}: memory".format(name)) for value in memory] if isinstance(memory, list)
+                else TestSpec._image(memory, "{0}: memory".format(name)),
+                TestSpec._integer(case.get("budget", budget), "{0}: budget".format(name)),
+                dict(
+                    expected,
+                    registers=TestSpec._image(expected.get("registers", {}), "{0}: expected registers".format(name)),
+                    memory=TestSpec._image(expected.get("memory", {}), "{0}: expected memory".format(name))
+                )
+            ))
+
+        return TestSpec(
+            cases,
+            TestSpec._integer(spec["registers"], "registers") if "registers" in spec else None,
+            TestSpec._integer(spec["memory"], "memory") if "memory" in spec else None
+        )
+
+    @staticmethod
+    def _image(image, name):
+        """
+        Returns :param image, a JSON object in format {index: value}, with integer keys and values.
+        If :param image is invalid -> ValueError raised.
+
+        :param image: (dict)
+        :param name: description of the image used in error messages (string)
+        :return: in format {index: value} (dict)
+        """
+
+        if not isinstance(image, dict):
+            raise ValueError("{0} must be an object".format(name))
+
+        return {TestSpec._index(index, name): TestSpec._integer(value, name) for index, value in image.items()}
+
+    @staticmethod
+    def _index(index, name):
+        """
+        Returns :param index, a JSON object key, as an integer.
+        If :param index is not a string of decimal digits -> ValueError raised.
+
+        :param index: (string)
+        :param name: description of the image used in error messages (string)
+        :return: (integer)
+        """
+
+        if not isinstance(index, str) or not index.isdecimal():
+            raise ValueError("{0}: {1} is not an index".format(name, json.dumps(index)))
+
+        return int(index)
+
+    @staticmethod
+    def _integer(value, name):
+        """
+        Returns :param value, a JSON integer.
+        If :param value is not an integer -> ValueError raised.
+
+        :param value: (integer)
+        :param name: description of the value used in error messages (string)
+        :return: (integer)
+        """
+
+        if not isinstance(value, int) or isinstance(value, bool):
+            raise ValueError("{0}: {1} is not an integer".format(name, json.dumps(value)))
+
+        return value
+
+    @staticmethod
+    def _boolean(value, name):
+        """
+        Returns :param value, a JSON boolean.
+        If :param value is not a boolean -> ValueError raised.
+
+        :param value: (boolean)
+        :param name: description of the value used in error messages (string)
+        :return: (boolean)
+        """
+
+        if not isinstance(value, bool):
+            raise ValueError("{0}: {1} is not a boolean".format(name, json.dumps(value)))
+
+        return value
+
+    def get_cases(self):
+        """
+        Returns the test cases
+
+        :return: (list)
+        """
+
+        return self._cases
+
+    def get_registers(self):
+        """
+        Returns the number of registers the test cases are written for, None if not given
+
+        :return: (integer)
+        """
+
+        return self._registers
+
+    def get_memory_capacity(self):
+        """
+        Returns the number of addressable memory units the test cases are written for, None if not given
+
+        :return: (integer)
+        """
+
+        return self._memory_capacity
+
+    def run(self, statements, registers, memory_capacity, workers=None):
+        """
+        Runs every test case on :param statements. Test cases are fanned out over :param workers processes; the
+        program is sent to each worker once.
+
+        :param statements: list of statements produced by the parser (list)
+        :param registers: number of registers in the virtual machine (integer)
+        :param memory_capacity: number of addressable memory units in the virtual machine (integer)
+        :param workers: number of worker processes, the number of CPUs if None (integer)
+        :return: result of each test case, in order (list)
+        """
+
+        workers = min(workers or os.cpu_count() or 1, len(self._cases))
+
+        if workers <= 1:
+            return [case.run(statements, registers, memory_capacity) for case in self._cases]
+
+        with ProcessPoolExecutor(workers, initializer=_initialise,
+                                 initargs=(statements, registers, memory_capacity)) as executor:
+            return list(executor.map(_run, self._cases, chunksize=max(1, len(self._cases) // (workers * 4))))
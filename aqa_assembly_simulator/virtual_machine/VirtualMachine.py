@@ -3,13 +3,23 @@ import aqa_assembly_simulator.parser.Statement as Statement
 from aqa_assembly_simulator.virtual_machine.Register import Register
 from aqa_assembly_simulator.virtual_machine.ComparisonRegister import ComparisonRegister
 from aqa_assembly_simulator.virtual_machine.Memory import Memory
+from aqa_assembly_simulator.virtual_machine.Debug import Hit, Watched, ACCESSES, HOOKS, STORAGE_HOOKS
+from aqa_assembly_simulator.virtual_machine.State import State
+from aqa_assembly_simulator.parser.Program import statement_lines
 from aqa_assembly_simulator.lexer.TokenType import TokenType
 from aqa_assembly_simulator.error.VirtualMachineError import VirtualMachineError
 
+BRANCH_CONDITIONS = {
+    Statement.BranchEqual: "EQ",
+    Statement.BranchNotEqual: "NE",
+    Statement.BranchGreaterThan: "GT",
+    Statement.BranchLessThan: "LT"
+}
+
 
 class VirtualMachine(StatementVisitor):
 
-    def __init__(self, statements, registers, memory_capacity, trace=False):
+    def __init__(self, statements, registers, memory_capacity, trace=False, memory_view="sparse"):
         """
         Virtual Machine constructor.
         Interpreter for aqa_assembly_simulator.parser.Statement.Statement objects.
@@ -20,6 +30,7 @@ class VirtualMachine(StatementVisitor):
         :param registers: number of registers in the virtual machine (integer)
         :param memory_capacity: number of addressable memory units in the virtual machine (integer)
         :param trace: indicates whether registers and memory units should be printed after each statement (boolean)
+        :param memory_view: memory units printed by the trace and final results, see Memory.parse_view (string)
         """
 
         self._statements = statements
@@ -32,15 +43,27 @@ class VirtualMachine(StatementVisitor):
         self._trace = trace
 
         self._memory = Memory(memory_capacity)
+        self._memory_view = Memory.parse_view(memory_view)
+        if self._memory_view == "touched":
+            self._memory.track_touched()
         self._register = Register(registers)
         self._comparison_register = ComparisonRegister()
 
         self._program_counter = 0
         self._branched = False
         self._halted = False
+        self._steps = 0
 
         self._errors = []
 
+        self._breakpoints = {}
+        self._watchpoints = {}
+        self._lines = None
+        self._hits = []
+        self._pending = []
+        self._resume = None
+        self._hooks = {}
+
     def _operand(self, operand):
         """
         Returns the literal value for the <operand 2> operand
@@ -285,11 +308,12 @@ class VirtualMachine(StatementVisitor):
             statement.get_operand()
         )
 
-    def visit_halt_statement(self):
+    def visit_halt_statement(self, statement):
         """
         Handles halt statement according to the operation of a Halt Statement
         Sets _halted true -> Virtual Machine has Halted.
 
+        :param statement: (aqa_assembly_simulator.parser.Statement.Halt)
         :return: (None)
         """
 
@@ -306,31 +330,458 @@ class VirtualMachine(StatementVisitor):
             print("\nEntering {0} Label".format(statement.get_identifier().get_lexeme()))
 
 
+    def step(self):
+        """
+        Executes the statement referenced by the program counter and increments the program counter.
+        If a virtual machine error occurs then the error is appended to the internal errors list and the
+        program is halted.
+
+        :return: whether a statement was executed (boolean)
+        """
+
+        if self.is_finished():
+            return False
+
+        CIR = self._statements[self._program_counter]
+
+        try:
+            self._execute_statement(CIR)
+        except (VirtualMachineError, Exception) as error:
+            self._error(error)
+            self._halted = True
+            return False
+
+        self._print_trace(CIR)
+
+        self._program_counter += 1
+        self._branched = False
+        self._steps += 1
+
+        return True
+
+    def run(self, max_steps=None):
+        """
+        Executes statements until the program finishes or :param max_steps statements have been executed.
+        May be called repeatedly to execute the program in slices.
+
+        :param max_steps: maximum number of statements to execute, None for no limit (integer)
+        :return: state of the virtual machine after the slice (aqa_assembly_simulator.virtual_machine.State.State)
+        """
+
+        self.advance(max_steps)
+        return self.get_state()
+
+    def advance(self, max_steps=None):
+        """
+        Executes statements until the program finishes or :param max_steps statements have been executed, like run,
+        but without taking a snapshot of the state afterwards.
+
+        :param max_steps: maximum number of statements to execute, None for no limit (integer)
+        :return: (None)
+        """
+
+        if max_steps is None:
+            while self.step():
+                pass
+        else:
+            for _ in range(max_steps):
+                if not self.step():
+                    break
+
+    def iter_states(self, max_steps=None):
+        """
+        Generator that executes statements one at a time, yielding the state of the virtual machine after each
+        statement. Stops when the program finishes or :param max_steps statements have been executed.
+
+        :param max_steps: maximum number of statements to execute, None for no limit (integer)
+        :return: (generator)
+        """
+
+        steps = 0
+        while (max_steps is None or steps < max_steps) and self.step():
+            steps += 1
+            yield self.get_state()
+
     def execute(self):
         """
-        Executes statements stored in _statements.
-        Handles the incrementation of the program counter.
+        Executes statements stored in _statements and prints the results of the program.
         If a virtual machine error occurs during the execution of statements, then the
         error is appended to the internal errors list and the program is halted.
 
         :return: (None)
         """
 
-        try:
-            while not self._halted and self._program_counter < len(self._statements):
-                CIR = self._statements[self._program_counter]
-                self._execute_statement(CIR)
-                self._print_trace(CIR)
-
-                self._program_counter += 1
-                self._branched = False
+        self.run()
 
+        if not self._errors:
             print("\nResults of program being executed:")
             self._print_registers()
 
-        except (VirtualMachineError, Exception) as error:
-            self._error(error)
-            self._halted = True
+    def load_memory(self, image):
+        """
+        Sets the initial memory contents of the virtual machine
+
+        :param image: list of values starting at address 0, or dictionary in format {address: value}
+        :return: (None)
+        """
+
+        self._memory.load(image)
+
+    def load_registers(self, image):
+        """
+        Sets the initial register contents of the virtual machine
+
+        :param image: in format {index: value} (dict)
+        :return: (None)
+        """
+
+        self._register.load(image)
+
+    def add_hook(self, event, callback):
+        """
+        Registers :param callback to be called on :param event:
+            instruction(program_counter, statement) before a statement is executed,
+            memory_read(address, value) and memory_write(address, value) when a memory unit is read or written,
+            register_write(register, value) when a register is written,
+            branch(source, destination, taken) after a branch statement is executed.
+        The step and storage paths are only instrumented while a callback that needs them is registered, so events
+        without callbacks cost nothing.
+        If :param event is unknown -> ValueError raised.
+
+        :param event: (string)
+        :param callback: (function)
+        :return: (None)
+        """
+
+        if event not in HOOKS:
+            raise ValueError("unknown hook {0}".format(event))
+
+        self._hooks.setdefault(event, []).append(callback)
+        self._instrument()
+
+    def remove_hook(self, event, callback):
+        """
+        Removes :param callback from :param event.
+        If :param callback is not registered for :param event -> ValueError raised.
+
+        :param event: (string)
+        :param callback: (function)
+        :return: (None)
+        """
+
+        if callback not in self._hooks.get(event, ()):
+            raise ValueError("no {0} hook {1}".format(event, callback))
+
+        self._hooks[event].remove(callback)
+        if not self._hooks[event]:
+            del self._hooks[event]
+
+        self._instrument()
+
+    def add_breakpoint(self, location, condition=None):
+        """
+        Pauses execution before the statement at :param location is executed. While any breakpoint or watchpoint is
+        set, step uses an instrumented path; otherwise statements are executed at full speed.
+        If :param location is not a label identifier or a line containing a statement -> ValueError raised.
+
+        :param location: label identifier (string) or source line (integer)
+        :param condition: called with the current State, the breakpoint is only hit if it returns True (function)
+        :return: (None)
+        """
+
+        if isinstance(location, str):
+            if location not in self._labels:
+                raise ValueError("unknown label {0}".format(location))
+
+            pointer = self._labels[location] + 1
+        else:
+            pointers = [pointer for pointer, line in enumerate(self._statement_lines()) if line == location]
+            if not pointers:
+                raise ValueError("no statement on line {0}".format(location))
+
+            pointer = pointers[0]
+
+        self._breakpoints.setdefault(pointer, []).append((location, condition))
+        self._instrument()
+
+    def add_watchpoint(self, location, access="write", condition=None):
+        """
+        Pauses execution after a statement reads or writes the register or memory unit at :param location.
+        If :param location or :param access is invalid -> ValueError raised.
+
+        :param location: register (e.g. "r1") or memory address (string or integer)
+        :param access: "read", "write" or "access" for both (string)
+        :param condition: called with the value read or written, the watchpoint is only hit if it returns True
+        (function)
+        :return: (None)
+        """
+
+        if access not in ACCESSES:
+            raise ValueError("unknown access {0}".format(access))
+
+        if isinstance(location, str) and location[:1] == "r" and location[1:].isdigit():
+            key = "register", int(location[1:])
+        elif isinstance(location, int):
+            key = "memory", location
+        else:
+            raise ValueError("invalid watchpoint location {0}".format(location))
+
+        self._watchpoints.setdefault(key, []).append((location, access, condition))
+        self._instrument()
+
+    def remove_breakpoint(self, location):
+        """
+        Removes the breakpoints set on :param location.
+        If no breakpoint is set on :param location -> ValueError raised.
+
+        :param location: label identifier (string) or source line (integer)
+        :return: (None)
+        """
+
+        breakpoints = {
+            pointer: [entry for entry in entries if entry[0] != location]
+            for pointer, entries in self._breakpoints.items()
+        }
+
+        if sum(map(len, breakpoints.values())) == sum(map(len, self._breakpoints.values())):
+            raise ValueError("no breakpoint on {0}".format(location))
+
+        self._breakpoints = {pointer: entries for pointer, entries in breakpoints.items() if entries}
+        self._instrument()
+
+    def clear_breakpoints(self):
+        """
+        Removes every breakpoint
+
+        :return: (None)
+        """
+
+        self._breakpoints = {}
+        self._instrument()
+
+    def clear_watchpoints(self):
+        """
+        Removes every watchpoint
+
+        :return: (None)
+        """
+
+        self._watchpoints = {}
+        self._instrument()
+
+    def get_hits(self):
+        """
+        Returns the breakpoints and watchpoints that paused the last call to step, empty if it was not paused
+
+        :return: (list)
+        """
+
+        return self._hits
+
+    def _instrument(self):
+        """
+        Switches between the normal and the instrumented step, and wraps registers and memory while watchpoints or
+        storage hooks are set, so that nothing is checked when no breakpoints, watchpoints or hooks are set.
+
+        :return: (None)
+        """
+
+        watch = self._watchpoints or any(event in self._hooks for event in STORAGE_HOOKS)
+        watched = isinstance(self._memory, Watched)
+
+        if watch and not watched:
+            self._register = Watched(self._register, "register", self)
+            self._memory = Watched(self._memory, "memory", self)
+        elif not watch and watched:
+            self._register = self._register.get_storage()
+            self._memory = self._memory.get_storage()
+
+        if self._breakpoints or self._watchpoints or "instruction" in self._hooks or "branch" in self._hooks:
+            self.step = self._instrumented_step
+        else:
+            self.__dict__.pop("step", None)
+
+    def _instrumented_step(self):
+        """
+        Instrumented step. Pauses without executing a statement when a breakpoint is set on the next statement, and
+        pauses after executing a statement that hit a watchpoint. The hits are available from get_hits, and the next
+        call resumes execution. Calls instruction and branch hooks.
+
+        :return: whether a statement was executed and execution was not paused (boolean)
+        """
+
+        if self.is_finished():
+            return False
+
+        if self._resume != self._steps:
+            hits = self._breakpoint_hits()
+
+            if hits:
+                self._hits = hits
+                self._resume = self._steps
+                return False
+
+        self._hits = []
+
+        program_counter = self._program_counter
+        statement = self._statements[program_counter]
+
+        for callback in self._hooks.get("instruction", ()):
+            callback(program_counter, statement)
+
+        executed = VirtualMachine.step(self)
+
+        if executed and "branch" in self._hooks and isinstance(statement, Statement.BRANCHES):
+            condition = BRANCH_CONDITIONS.get(type(statement))
+            taken = condition is None or self._comparison_register[condition]
+
+            for callback in self._hooks["branch"]:
+                callback(program_counter, self._program_counter, taken)
+
+        if self._pending:
+            self._hits, self._pending = self._pending, []
+            return False
+
+        return executed
+
+    def _breakpoint_hits(self):
+        """
+        Returns the hits of the breakpoints set on the next statement
+
+        :return: (list)
+        """
+
+        return [
+            Hit("breakpoint", location, self._statement_lines()[self._program_counter], self._program_counter,
+                self._steps)
+            for location, condition in self._breakpoints.get(self._program_counter, ())
+            if condition is None or condition(self.get_state())
+        ]
+
+    def _watch(self, kind, token, access, value):
+        """
+        Calls the storage hooks and records the hits of the watchpoints set on a register or memory unit that is being
+        read or written
+
+        :param kind: "register" or "memory" (string)
+        :param token: register or direct address token (aqa_assembly_simulator.lexer.Token.Token)
+        :param access: "read" or "write" (string)
+        :param value: value read or written (integer)
+        :return: (None)
+        """
+
+        for callback in self._hooks.get("{0}_{1}".format(kind, access), ()):
+            callback(token.get_literal(), value)
+
+        for location, watched, condition in self._watchpoints.get((kind, token.get_literal()), ()):
+            if watched in (access, "access") and (condition is None or condition(value)):
+                self._pending.append(Hit(
+                    "watchpoint", location, token.get_line(), self._program_counter, self._steps + 1, access, value
+                ))
+
+    def _statement_lines(self):
+        """
+        Returns the source line of each statement, computed on first use
+
+        :return: (list)
+        """
+
+        if self._lines is None:
+            self._lines = statement_lines(self._statements)
+
+        return self._lines
+
+    def load_memory_file(self, file_location):
+        """
+        Sets the initial memory contents of the virtual machine to the memory image stored at :param file_location
+
+        :param file_location: absolute path for the memory image (string)
+        :return: (None)
+        """
+
+        self._memory.load_file(file_location)
+
+    def save_memory_file(self, file_location):
+        """
+        Writes the memory contents of the virtual machine to :param file_location as a memory image
+
+        :param file_location: absolute path for the memory image (string)
+        :return: (None)
+        """
+
+        self._memory.save_file(file_location)
+
+    def load_state(self, state):
+        """
+        Restores the program counter, registers, comparison register, memory, step count and errors from :param state.
+        The state must have been taken from a virtual machine with the same number of registers and memory capacity.
+
+        :param state: (aqa_assembly_simulator.virtual_machine.State.State)
+        :return: (None)
+        """
+
+        self._program_counter = state.get_program_counter()
+        self._register.restore(state.get_registers())
+        self._comparison_register.restore(state.get_comparison_register())
+        self._memory.restore(state.get_memory())
+
+        self._branched = False
+        self._halted = state.is_halted()
+        self._steps = state.get_steps()
+        self._errors = list(state.get_errors())
+
+        self._pending = []
+        self._resume = None
+
+    def get_state(self):
+        """
+        Returns a snapshot of the program counter, registers, comparison register and memory
+
+        :return: (aqa_assembly_simulator.virtual_machine.State.State)
+        """
+
+        return State(
+            self._program_counter, self._register.snapshot(), self._comparison_register.snapshot(),
+            self._memory.snapshot(), self._memory.get_capacity(), self._steps, self._halted,
+            self.is_finished(), list(self._errors)
+        )
+
+    def get_program_counter(self):
+        """
+        Returns the index of the next statement to be executed
+
+        :return: (integer)
+        """
+
+        return self._program_counter
+
+    def get_steps(self):
+        """
+        Returns the number of statements executed
+
+        :return: (integer)
+        """
+
+        return self._steps
+
+    def is_halted(self):
+        """
+        Returns whether the virtual machine has halted
+
+        :return: (boolean)
+        """
+
+        return self._halted
+
+    def is_finished(self):
+        """
+        Returns whether the virtual machine can no longer execute statements, either because it has halted or
+        because the program counter is past the last statement.
+
+        :return: (boolean)
+        """
+
+        return self._halted or self._program_counter >= len(self._statements)
 
     def _print_trace(self, CIR):
         """
@@ -359,7 +810,7 @@ class VirtualMachine(StatementVisitor):
         print("\nComparison Register")
         print(self._comparison_register)
         print("\nMemory")
-        print(self._memory)
+        print(self._memory.render(self._memory_view))
 
     def _execute_statement(self, statement):
         """
@@ -1,21 +1,43 @@
+import re as regular_expression
 import json
+import os
 
 from aqa_assembly_simulator.helpers.Exceptions import AssemblySimulatorVMConfigException
-from aqa_assembly_simulator.helpers.Constants import VM_CONFIG
+from aqa_assembly_simulator.helpers.Constants import (
+    VM_CONFIG, REGISTERS_REGEX, MEMORY_CAPACITY_REGEX, REGISTERS_ENVIRONMENT_VARIABLE, MEMORY_ENVIRONMENT_VARIABLE
+)
 from aqa_assembly_simulator.helpers.Util import read_file
 
+FIELDS = [
+    ("registers", REGISTERS_ENVIRONMENT_VARIABLE, REGISTERS_REGEX, "[0-9]{1,3}"),
+    ("memory capacity", MEMORY_ENVIRONMENT_VARIABLE, MEMORY_CAPACITY_REGEX, "[0-9]{1,9}")
+]
+
 
 class VirtualMachineConfig:
+    """
+    Virtual machine config, read from config.json.
+    The file is parsed once and only re-read when its modification time or size changes. Each field can be overridden
+    by an environment variable, and environment variables by overrides set from command line options.
+    """
+
+    _config = None
+    _signature = None
+    _overrides = {}
 
     @staticmethod
     def get_config():
-        try:
-            return json.loads(read_file(VM_CONFIG))
-        except:
+        config = dict(VirtualMachineConfig._load())
+        config.update(VirtualMachineConfig._environment())
+        config.update(VirtualMachineConfig._overrides)
+
+        if any(name not in config for name, _, _, _ in FIELDS):
             raise AssemblySimulatorVMConfigException({
                 "message": "virtual machine config not setup. Please use aqa-assembly-simulator config setup."
             })
 
+        return config
+
     @staticmethod
     def get_memory_capacity():
         return VirtualMachineConfig.get_config()["memory capacity"]
@@ -24,3 +46,100 @@ class VirtualMachineConfig:
     def get_registers():
         return VirtualMachineConfig.get_config()["registers"]
 
+    @staticmethod
+    def override(registers=None, memory_capacity=None):
+        """
+        Overrides the number of registers and addressable memory units for this process, taking precedence over
+        config.json and environment variables. None leaves a field unchanged.
+
+        :param registers: number of registers (string or integer)
+        :param memory_capacity: number of addressable memory units (string or integer)
+        :return: (None)
+        """
+
+        for (name, _, regex, format), value in zip(FIELDS, (registers, memory_capacity)):
+            if value is not None:
+                VirtualMachineConfig._overrides[name] = VirtualMachineConfig._validate(name, str(value), regex, format)
+
+    @staticmethod
+    def validate():
+        """
+        Validates the environment variable overrides, without requiring the config to be setup.
+        If an environment variable is invalid -> AssemblySimulatorVMConfigException raised.
+
+        :return: (None)
+        """
+
+        VirtualMachineConfig._environment()
+
+    @staticmethod
+    def clear_overrides():
+        """
+        Removes overrides set by override
+
+        :return: (None)
+        """
+
+        VirtualMachineConfig._overrides = {}
+
+    @staticmethod
+    def _environment():
+        """
+        Returns the fields set by environment variables.
+        If an environment variable is invalid -> AssemblySimulatorVMConfigException raised.
+
+        :return: (dict)
+        """
+
+        return {
+            name: VirtualMachineConfig._validate(name, os.environ[variable], regex, format)
+            for name, variable, regex, format in FIELDS if os.environ.get(variable)
+        }
+
+    @staticmethod
+    def _load():
+        """
+        Returns the contents of config.json, re-reading the file only if it has changed since it was last read.
+        A missing or invalid file is treated as an empty config.
+
+        :return: (dict)
+        """
+
+        try:
+            status = os.stat(VM_CONFIG)
+            signature = status.st_mtime_ns, status.st_size
+        except OSError:
+            signature = None
+
+        if signature != VirtualMachineConfig._signature or VirtualMachineConfig._config is None:
+            try:
+                config = json.loads(read_file(VM_CONFIG)) if signature else {}
+            except ValueError:
+                config = {}
+
+            VirtualMachineConfig._config = config if isinstance(config, dict) else {}
+            VirtualMachineConfig._signature = signature
+
+        return VirtualMachineConfig._config
+
+    @staticmethod
+    def _validate(name, value, regex, format):
+        """
+        Returns :param value as an integer.
+        If :param value does not match :param regex or is 0 -> AssemblySimulatorVMConfigException raised.
+
+        :param name: config field (string)
+        :param value: (string)
+        :param regex: (string)
+        :param format: format reported in the error (string)
+        :return: (integer)
+        """
+
+        if not regular_expression.match(regex, value) or not int(value):
+            raise AssemblySimulatorVMConfigException({
+                "message": "invalid {0}".format(name),
+                "format": format,
+                name: value
+            })
+
+        return int(value)
@@ -0,0 +1,116 @@
+"""
+Import time budget check.
+
+Runs `execute` on a cached program with python -X importtime and fails if the total import time exceeds the budget, or
+if a module that is meant to be imported lazily is imported on this path.
+
+Usage:
+  python scripts/check_import_time.py [<budget ms>] [--runs=<n>]
+"""
+
+import os
+import re
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+BUDGET = 60
+RUNS = 5
+
+REGISTERS = 6
+MEMORY_CAPACITY = 48
+
+PROGRAM = "LDR r1, 0\nCMP r1, #0\nBGT then\nB endif\nthen:\n  SUB r1, r1, #1\n  STR r1, 0\nendif:\n  HALT\n"
+
+LAZY = [
+    "docopt",
+    "numpy",
+    "tempfile",
+    "aqa_assembly_simulator.lexer.Lexer",
+    "aqa_assembly_simulator.parser.Parser",
+    "aqa_assembly_simulator.parser.Grammar",
+    "aqa_assembly_simulator.assembler.Loader"
+]
+
+LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \| ( *)(\S+)$")
+
+
+def measure(file_location, environment):
+    """
+    Runs `execute` on :param file_location with python -X importtime
+
+    :param file_location: (string)
+    :param environment: (dict)
+    :return: total import time in microseconds and the imported modules, in format (total, {module: cumulative}) (tuple)
+    """
+
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "from aqa_assembly_simulator.__main__ import main; main()",
+         "execute", file_location],
+        stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, env=environment, universal_newlines=True
+    )
+
+    if process.returncode:
+        sys.exit("execute failed with exit code {0}:\n{1}".format(process.returncode, process.stderr))
+
+    total, modules = 0, {}
+    for line in process.stderr.splitlines():
+        match = LINE.match(line)
+        if match is None:
+            continue
+
+        cumulative, indent, module = int(match.group(2)), match.group(3), match.group(4)
+        modules[module] = cumulative
+        if not indent:
+            total += cumulative
+
+    return total, modules
+
+
+def main(arguments):
+    """
+    Import time budget check entry point
+
+    :param arguments: command line arguments (list)
+    :return: exit code (integer)
+    """
+
+    budget, runs = BUDGET, RUNS
+    for argument in arguments:
+        if argument.startswith("--runs="):
+            runs = int(argument[len("--runs="):])
+        else:
+            budget = float(argument)
+
+    with tempfile.TemporaryDirectory() as directory:
+        file_location = os.path.join(directory, "program.asm")
+        with open(file_location, "w") as file:
+            file.write(PROGRAM)
+
+        environment = dict(
+            os.environ, PYTHONPATH=ROOT, AQA_ASSEMBLY_SIMULATOR_CACHE=os.path.join(directory, "cache"),
+            AQA_ASSEMBLY_SIMULATOR_REGISTERS=str(REGISTERS), AQA_ASSEMBLY_SIMULATOR_MEMORY=str(MEMORY_CAPACITY)
+        )
+
+        measure(file_location, environment)
+        total, modules = min(
+            (measure(file_location, environment) for _ in range(runs)), key=lambda measurement: measurement[0]
+        )
+
+    imported = [module for module in LAZY if module in modules]
+    slowest = sorted(modules.items(), key=lambda item: item[1], reverse=True)[:10]
+
+    print("Import time: {0:.1f}ms (budget {1:.1f}ms, best of {2} runs)".format(total / 1000, budget, runs))
+    for module, cumulative in slowest:
+        print("  {0:>7.1f}ms {1}".format(cumulative / 1000, module))
+
+    if imported:
+        print("Imported modules that should be imported lazily: {0}".format(", ".join(imported)))
+
+    return 1 if imported or total > budget * 1000 else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -8,6 +8,10 @@ requires = [
     "ascii-table>=0.0.2"
 ]
 
+extras = {
+    "batch": ["numpy"]
+}
+
 packages = [
     "aqa_assembly_simulator",
     "aqa_assembly_simulator.virtual_machine",
@@ -16,6 +20,8 @@ packages = [
     "aqa_assembly_simulator.lexer",
     "aqa_assembly_simulator.helpers",
     "aqa_assembly_simulator.error",
+    "aqa_assembly_simulator.assembler",
+    "aqa_assembly_simulator.language_server",
     "aqa_assembly_simulator.commands",
     "aqa_assembly_simulator.commands.config"
 ]
@@ -32,6 +38,7 @@ setuptools.setup(
     url="https://github.com/johnyob/AQA-Assembly-Simulator",
     packages=packages,
     install_requires=requires,
+    extras_require=extras,
     entry_points={
         "console_scripts": [
             "aqa-assembly-simulator=aqa_assembly_simulator.__main__:main"